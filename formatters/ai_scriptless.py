@@ -1,59 +1,64 @@
 from typing import List, Any, Optional
 
+from tools.utils import encode_cursor
 
-def format_ai_scriptless_tests_filter_values(tests: dict[str, Any], params: Optional[dict] = None) -> dict[str, Any]:
-    filter_values = {
-        "test_name": [],
-        "owner_list": [],
-    }
-
-    for item_visibility in tests["items"]:
-        stack_tests = list(item_visibility.get("items", []))
-        while stack_tests:
-            test = stack_tests.pop()
-            node_type = test["type"]
-            if node_type == "SIMPLE":
-                test_name = test['name'].rstrip('.xml')
-                if test_name not in filter_values["test_name"]:
-                    filter_values["test_name"].append(test_name)
-                if test['createdBy'] not in filter_values["owner_list"]:
-                    filter_values["owner_list"].append(test['createdBy'])
-                if test['modifiedBy'] not in filter_values["owner_list"]:
-                    filter_values["owner_list"].append(test['modifiedBy'])
-            elif node_type == "CONTAINER":
-                stack_tests.extend(reversed(test.get("items", [])))
-    return filter_values
 
+def get_ai_scriptless_test_name(name: str) -> str:
+    return name.removesuffix(".xml")
 
-def format_ai_scriptless_tests(tests: dict[str, Any], params: Optional[dict] = None) -> List[dict[str, Any]]:
-    formatted_ai_scriptless_tests = []
-    filters = params.get("filters", {})
-    page_size = params["page_size"]
-    skip = params["skip"]
-    offset = skip + page_size
 
-    for item_visibility in tests["items"]:
+def get_ai_scriptless_test_items(tree: dict[str, Any], params: Optional[dict] = None) -> List[dict[str, Any]]:
+    """
+    Flatten the scripts tree into its tests, each one with its visibility, the path of its containers
+    and the modification time of its container (None for the tests in the root).
+    """
+    tests = []
+    for item_visibility in tree["items"]:
         visibility = item_visibility["visibility"]
-        if "visibility" in filters and visibility != filters.get("visibility"):
-            continue
-        stack_tests = list(item_visibility.get("items", []))
+        stack_tests = [(test, (), None) for test in reversed(item_visibility.get("items", []))]
         while stack_tests:
-            test = stack_tests.pop()
+            test, path, container_modified = stack_tests.pop()
             node_type = test["type"]
             if node_type == "SIMPLE":
-                if "test_name" in filters and filters["test_name"].lower() not in test["name"].lower():
-                    continue
-                if "owner_list" in filters and test['createdBy'] not in filters.get('owner_list', []):
-                    continue
-                test_formatted = f"id:{test['key']} name:{test['name'].rstrip('.xml')} created[user:{test['createdBy']} date:{test['creationTime']['formatted']}] modified[user:{test['modifiedBy']} date:{test['modificationTime']['formatted']}]"
-                formatted_ai_scriptless_tests.append(test_formatted)
+                tests.append({**test, "visibility": visibility, "path": path,
+                              "container_modified": container_modified})
             elif node_type == "CONTAINER":
-                stack_tests.extend(reversed(test.get("items", [])))
+                container_path = path + (test.get("name", ""),)
+                container_modified = (test.get("modificationTime") or {}).get("formatted")
+                stack_tests.extend((child, container_path, container_modified)
+                                   for child in reversed(test.get("items", [])))
+    return tests
 
-            if len(formatted_ai_scriptless_tests) > offset:
-                break
 
-    if len(formatted_ai_scriptless_tests) >= offset:
-        offset = len(formatted_ai_scriptless_tests) - 1
+def format_ai_scriptless_test(test: dict[str, Any], params: Optional[dict] = None) -> str:
+    return (f"id:{test['key']} name:{get_ai_scriptless_test_name(test['name'])} "
+            f"created[user:{test['createdBy']} date:{test['creationTime']['formatted']}] "
+            f"modified[user:{test['modifiedBy']} date:{test['modificationTime']['formatted']}]")
 
-    return formatted_ai_scriptless_tests[skip:offset]
+
+def format_scriptless_execution_handle(response: Any, params: Optional[dict] = None) -> Optional[str]:
+    """
+    Handle of a submitted execution, with what's needed to find it between the live and the report executions:
+    the device ID of a real device, or the model and platform version of a virtual device,
+    or the browser and its version of a desktop device.
+    None when the execution can't be tracked (without execution ID nor test name).
+    """
+    params = params or {}
+    execution_id = None
+    if isinstance(response, dict):
+        execution_id = next((response[key] for key in ["executionId", "testExecutionId", "id"]
+                             if response.get(key) is not None), None)
+    if execution_id is None and params.get("test_name") is None:
+        return None
+    state = {
+        "e": str(execution_id) if execution_id is not None else None,
+        "t": params.get("test_name"),
+        "d": params.get("device_id"),
+        "s": params.get("submitted_at"),
+    }
+    platform = {key: str(params[name]) for key, name in [("m", "model"), ("v", "platform_version"),
+                                                          ("b", "browser_name"), ("bv", "browser_version")]
+                if params.get(name) is not None}
+    if platform:
+        state["p"] = platform
+    return encode_cursor(state)
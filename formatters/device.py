@@ -1,29 +1,31 @@
 from typing import List, Any, Optional
 
-from models.device import RealDevice, VirtualDevice
+from models.device import RealDevice, VirtualDevice, DesktopDevice, CatalogueDevice
 
 
-def format_real_device(devices: dict[str, Any], params: Optional[dict] = None) -> List[RealDevice]:
-    formatted_devices = []
+def get_real_device_items(devices: dict[str, Any], params: Optional[dict] = None) -> List[dict[str, Any]]:
+    device_items = []
     for device in devices.keys():
         if "handset" in devices[device]:
-            for d in devices[device]["handset"]:
-                if d.get("available") == "true":  # Only available devices
-                    formatted_devices.append(
-                        RealDevice(
-                            device_id=d.get("deviceId"),
-                            appium_automation_name="Appium",
-                            platform_name=d.get("os"),
-                            platform_version=d.get("osVersion"),
-                            manufacturer=d.get("manufacturer"),
-                            model=d.get("model"),
-                            location=d.get("location", ""),
-                            description=d.get("description", ""),
-                            status=d.get("status"),
-                            in_use=d.get("inUse", "false"),  # When device is on error inUse is None
-                        )
-                    )
-    return formatted_devices
+            device_items.extend(devices[device]["handset"])
+    return device_items
+
+
+def format_real_device_item(d: dict[str, Any], params: Optional[dict] = None) -> RealDevice:
+    params = params or {}
+    return RealDevice(
+        device_id=d.get("deviceId"),
+        appium_automation_name="Appium",
+        platform_name=d.get("os"),
+        platform_version=d.get("osVersion"),
+        manufacturer=d.get("manufacturer"),
+        model=d.get("model"),
+        location=d.get("location", ""),
+        description=d.get("description", ""),
+        status=d.get("status"),
+        in_use=d.get("inUse", "false"),  # When device is on error inUse is None
+        available=d.get("available") if params.get("include_available", False) else None,
+    )
 
 
 def format_virtual_device(devices: dict[str, Any], params: Optional[dict] = None) -> List[VirtualDevice]:
@@ -50,3 +52,112 @@ def format_virtual_device(devices: dict[str, Any], params: Optional[dict] = None
             )
         )
     return formatted_devices
+
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    return [str(v) for v in value] if isinstance(value, list) else [str(value)]
+
+
+def format_desktop_device(devices: Any, params: Optional[dict] = None) -> Any:
+    """
+    The desktop devices with a browser entry by platform, or the raw items when their format is not the known one.
+    """
+    items = devices.get("devices") if isinstance(devices, dict) else devices
+    if not isinstance(items, list) or \
+            not all(isinstance(d, dict) and isinstance(d.get("browsers"), list) for d in items):
+        return devices
+    formatted_devices = []
+    for d in items:
+        for browser in d["browsers"]:
+            formatted_devices.append(
+                DesktopDevice(
+                    platform_name=d.get("platformName", d.get("osName", "")),
+                    platform_version=str(d.get("platformVersion", d.get("osVersion", ""))),
+                    browser_name=browser.get("browserName", browser.get("name", "")),
+                    browser_version=_as_list(browser.get("browserVersions", browser.get("versions"))),
+                    resolution=_as_list(d.get("resolutions", d.get("resolution"))),
+                    location=_as_list(d.get("locations", d.get("location"))),
+                )
+            )
+    return formatted_devices
+
+
+def format_catalogue_devices(real_devices: List[RealDevice], virtual_devices: List[VirtualDevice],
+                             desktop_devices: List[DesktopDevice]) -> List[CatalogueDevice]:
+    """
+    A single entry by real device, by virtual device version and by desktop browser version and location.
+    """
+    catalogue = []
+    for d in real_devices:
+        catalogue.append(CatalogueDevice(
+            device_type="real",
+            platform_name=d.platform_name,
+            platform_version=d.platform_version,
+            manufacturer=d.manufacturer,
+            model=d.model,
+            device_id=d.device_id,
+            location=d.location,
+            available=d.available == "true",
+            in_use=d.in_use == "true",
+            capabilities={
+                "platformName": d.platform_name,
+                "platformVersion": d.platform_version,
+                "deviceName": d.device_id,
+                "appium:automationName": d.appium_automation_name,
+            },
+            device_under_test={"device_id": d.device_id},
+        ))
+    for d in virtual_devices:
+        for version in d.platform_version:
+            catalogue.append(CatalogueDevice(
+                device_type="virtual",
+                platform_name=d.platform_name,
+                platform_version=version,
+                manufacturer=d.manufacturer,
+                model=d.model,
+                capabilities={
+                    "platformName": d.platform_name,
+                    "platformVersion": version,
+                    "manufacturer": d.manufacturer,
+                    "model": d.model,
+                    "useVirtualDevice": d.use_virtual_device,
+                },
+                device_under_test={
+                    "platform_name": d.platform_name,
+                    "manufacturer": d.manufacturer,
+                    "model": d.model,
+                    "platform_version": version,
+                },
+            ))
+    for d in desktop_devices:
+        for browser_version in d.browser_version:
+            for location in d.location or [None]:
+                capabilities = {
+                    "platformName": d.platform_name,
+                    "platformVersion": d.platform_version,
+                    "browserName": d.browser_name,
+                    "browserVersion": browser_version,
+                    "resolution": d.resolution[0] if d.resolution else None,
+                    "location": location,
+                }
+                catalogue.append(CatalogueDevice(
+                    device_type="desktop",
+                    platform_name=d.platform_name,
+                    platform_version=d.platform_version,
+                    browser_name=d.browser_name,
+                    browser_version=browser_version,
+                    resolution=d.resolution,
+                    location=location,
+                    capabilities=capabilities,
+                    device_under_test={
+                        "platform_name": d.platform_name,
+                        "platform_version": d.platform_version,
+                        "browser_name": d.browser_name,
+                        "browser_version": browser_version,
+                        "resolution": capabilities["resolution"],
+                        "location": location,
+                    },
+                ))
+    return catalogue
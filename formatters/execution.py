@@ -1,6 +1,15 @@
+from collections import Counter
+from datetime import datetime
+from difflib import SequenceMatcher
+from itertools import zip_longest
 from typing import List, Any, Optional
 
-from models.execution import Execution, ExecutionPlatform
+from models.execution import Execution, ExecutionPlatform, FailureCluster, LiveExecution, LiveExecutionChange, \
+    ExecutionCommand, DurationStats, TrendSeries, ExecutionTrends, DeviceUtilization, ModelUtilization, \
+    DeviceUtilizationReport, TestDurationDelta, JobBuildSummary, JobSummary, CommandDiff, ExecutionComparison, \
+    ScriptlessRunDevice, FailureReasonCount, ScriptlessRunSummary
+from tools.stats_utils import percentiles, bucket_indexes, bucket_starts
+from tools.text_utils import normalize_message
 from tools.utils import get_date_time_iso
 
 
@@ -48,3 +57,606 @@ def format_executions(executions: dict[str, Any], params: Optional[dict] = None)
                 )
             )
     return formatted_executions
+
+
+def get_executions_total(executions: dict[str, Any]) -> Optional[int]:
+    metadata = executions.get("metadata") if isinstance(executions.get("metadata"), dict) else {}
+    for source in [executions, metadata]:
+        total = _first_value(source, ["total", "totalCount", "totalItems"])
+        if isinstance(total, int):
+            return total
+    return None
+
+
+def get_failure_message(execution: Execution) -> Optional[str]:
+    parts = []
+    for details in [execution.failure_reason, execution.error_analysis]:
+        if not details:
+            continue
+        values = [details.get(key) for key in ["name", "message", "errorMessage", "description", "stackTrace"]
+                  if isinstance(details.get(key), str)]
+        if len(values) == 0:
+            values = [value for value in details.values() if isinstance(value, str)]
+        parts.extend(value.strip() for value in values if value.strip())
+    if len(parts) == 0:
+        return None
+    return " | ".join(dict.fromkeys(parts))
+
+
+def format_failure_clusters(executions: List[Execution], messages: List[str],
+                            clusters: List[List[int]]) -> List[FailureCluster]:
+    formatted_clusters = []
+    for cluster in clusters:
+        cluster_messages = Counter(messages[i] for i in cluster)
+        representative_message = cluster_messages.most_common(1)[0][0]
+        formatted_clusters.append(
+            FailureCluster(
+                size=len(cluster),
+                representative_message=representative_message,
+                pattern=normalize_message(representative_message),
+                test_names=list(dict.fromkeys(executions[i].test_name for i in cluster)),
+                execution_ids=[executions[i].execution_id for i in cluster],
+            )
+        )
+    return formatted_clusters
+
+
+def _first_value(item: dict[str, Any], keys: List[str]) -> Any:
+    for key in keys:
+        if item.get(key) is not None:
+            return item[key]
+    return None
+
+
+def get_live_execution_items(executions: Any) -> List[dict[str, Any]]:
+    if isinstance(executions, list):
+        return executions
+    if isinstance(executions, dict):
+        return _first_value(executions, ["items", "executions", "resources"]) or []
+    return []
+
+
+def format_live_executions(executions: Any, params: Optional[dict] = None) -> List[LiveExecution]:
+    formatted_executions = []
+    for item in get_live_execution_items(executions):
+        execution_id = _first_value(item, ["id", "executionId", "testExecutionId"])
+        if execution_id is None:
+            continue  # Without ID it can't be tracked nor stopped
+        job = item.get("job") if isinstance(item.get("job"), dict) else {}
+        device_ids = []
+        for device in item.get("devices") or []:
+            device_id = _first_value(device, ["deviceId", "id"]) if isinstance(device, dict) else device
+            if device_id is not None:
+                device_ids.append(str(device_id))
+        if item.get("deviceId") is not None and str(item["deviceId"]) not in device_ids:
+            device_ids.append(str(item["deviceId"]))
+        start_time = _first_value(item, ["startTime", "startExecutionTime"])
+        formatted_executions.append(
+            LiveExecution(
+                execution_id=str(execution_id),
+                name=_first_value(item, ["name", "testName", "scriptName"]),
+                status=_first_value(item, ["status", "state"]),
+                owner=_first_value(item, ["owner", "user", "userName", "userId"]),
+                job_name=_first_value(job, ["name"]) or item.get("jobName"),
+                job_number=_first_value(job, ["number"]) or item.get("jobNumber"),
+                device_ids=device_ids,
+                start_time=get_date_time_iso(start_time / 1000) if isinstance(start_time, (int, float)) else start_time,
+            )
+        )
+    return formatted_executions
+
+
+def format_live_execution_changes(previous: dict[str, LiveExecution], current: dict[str, LiveExecution],
+                                  elapsed: float) -> List[LiveExecutionChange]:
+    changes = []
+    for execution_id, execution in current.items():
+        if execution_id not in previous:
+            changes.append(LiveExecutionChange(change="started", elapsed=elapsed, execution_id=execution_id,
+                                               name=execution.name, status=execution.status))
+        elif previous[execution_id].status != execution.status:
+            changes.append(LiveExecutionChange(change="status_changed", elapsed=elapsed, execution_id=execution_id,
+                                               name=execution.name, status=execution.status,
+                                               previous_status=previous[execution_id].status))
+    for execution_id, execution in previous.items():
+        if execution_id not in current:
+            changes.append(LiveExecutionChange(change="finished", elapsed=elapsed, execution_id=execution_id,
+                                               name=execution.name, status=execution.status))
+    return changes
+
+
+def format_live_execution_change_message(changes: List[LiveExecutionChange]) -> str:
+    messages = []
+    for change in changes:
+        message = f"{change.change} {change.execution_id}"
+        if change.name:
+            message += f" ({change.name})"
+        if change.change == "status_changed":
+            message += f" {change.previous_status}->{change.status}"
+        messages.append(message)
+    return "; ".join(messages)
+
+
+def format_execution_commands_summary(commands: Any, params: Optional[dict] = None) -> Any:
+    # Keeps the scalar and object attributes, the lists are replaced by their size (and status counters)
+    if not isinstance(commands, dict):
+        return commands
+    summary = {}
+    for key, value in commands.items():
+        if isinstance(value, list):
+            summary[f"{key}_count"] = len(value)
+            status_counter = Counter(item.get("status") for item in value
+                                     if isinstance(item, dict) and item.get("status") is not None)
+            if status_counter:
+                summary[f"{key}_status"] = dict(status_counter)
+        else:
+            summary[key] = value
+    return summary
+
+
+FAILED_STATUSES = {"FAILED", "FAILURE", "ERROR", "BLOCKED"}
+_COMMAND_CHILDREN_KEYS = ["commands", "subCommands", "steps", "items"]
+_COMMAND_MESSAGE_MAX_LENGTH = 300
+
+
+def is_failed_status(status: Optional[str]) -> bool:
+    return status is not None and status.upper() in FAILED_STATUSES
+
+
+def get_timestamp(value: Any) -> Optional[float]:
+    # Timestamps are in milliseconds (or ISO strings)
+    if isinstance(value, (int, float)):
+        return value / 1000
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _iter_commands(nodes: List[Any], step: Optional[str] = None):
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        children_key = next((key for key in _COMMAND_CHILDREN_KEYS if isinstance(node.get(key), list)), None)
+        if children_key is not None and len(node[children_key]) > 0:
+            # A test step, its commands are flattened with the step name
+            yield from _iter_commands(node[children_key], node.get("name", step))
+        else:
+            yield node, step
+
+
+def format_execution_commands(commands: Any, params: Optional[dict] = None) -> List[ExecutionCommand]:
+    params = params or {}
+    failed_only = params.get("failed_only", False)
+    start_time = params.get("start_time")
+    end_time = params.get("end_time")
+
+    if isinstance(commands, dict):
+        nodes = _first_value(commands, ["resources", "commands", "items", "testSteps"]) or []
+    elif isinstance(commands, list):
+        nodes = commands
+    else:
+        nodes = []
+
+    formatted_commands = []
+    execution_start = None
+    for index, (command, step) in enumerate(_iter_commands(nodes)):
+        command_start = get_timestamp(_first_value(command, ["startTime", "timestamp"]))
+        command_end = get_timestamp(command.get("endTime"))
+        if execution_start is None:
+            execution_start = command_start
+        status = _first_value(command, ["status", "result"])
+        if failed_only and not is_failed_status(status):
+            continue
+        if start_time is not None and (command_start is None or command_start < start_time):
+            continue
+        if end_time is not None and (command_start is None or command_start > end_time):
+            continue
+
+        duration = command.get("duration")
+        if isinstance(duration, (int, float)):
+            duration = duration / 1000
+        elif command_start is not None and command_end is not None:
+            duration = command_end - command_start
+        else:
+            duration = None
+        message = _first_value(command, ["message", "errorMessage", "failureReason"])
+        if message is not None:
+            message = str(message)[:_COMMAND_MESSAGE_MAX_LENGTH]
+
+        formatted_commands.append(
+            ExecutionCommand(
+                index=index,
+                name=_first_value(command, ["name", "commandName", "type"]),
+                step=step,
+                status=status,
+                start_time=get_date_time_iso(command_start),
+                offset=round(command_start - execution_start, 3) if None not in (command_start,
+                                                                                 execution_start) else None,
+                duration=round(duration, 3) if duration is not None else None,
+                message=message,
+            )
+        )
+    return formatted_commands
+
+
+EXPORT_EXECUTION_COLUMNS = [
+    "id", "test_execution_id", "name", "status", "start_time", "end_time", "duration_ms", "owner", "job_name",
+    "job_number", "tags", "framework", "device_id", "platform_name", "model", "os", "os_version", "browser",
+    "failure_reason", "error_message",
+]
+
+
+def format_export_execution_rows(executions: dict[str, Any], params: Optional[dict] = None) -> List[dict[str, Any]]:
+    rows = []
+    for item in _first_value(executions, ["resources", "items"]) or []:
+        job = item.get("job") or {}
+        platform = (item.get("platforms") or [{}])[0]
+        browser = platform.get("browserInfo") or {}
+        failure_reason = item.get("failureReason") or {}
+        error_analysis = item.get("errorAnalysis") or {}
+        start_time = item.get("startTime")
+        end_time = item.get("endTime")
+        rows.append({
+            "id": item.get("id"),
+            "test_execution_id": item.get("testExecutionId"),
+            "name": item.get("name"),
+            "status": item.get("status"),
+            "start_time": start_time,
+            "end_time": end_time,
+            "duration_ms": end_time - start_time if isinstance(start_time, int) and isinstance(end_time, int) else None,
+            "owner": item.get("owner"),
+            "job_name": job.get("name"),
+            "job_number": job.get("number"),
+            "tags": ",".join(item.get("tags") or []),
+            "framework": item.get("automationFramework"),
+            "device_id": platform.get("deviceId"),
+            "platform_name": platform.get("deviceType"),
+            "model": (platform.get("mobileInfo") or {}).get("model"),
+            "os": platform.get("os"),
+            "os_version": platform.get("osVersion"),
+            "browser": " ".join(str(v) for v in [browser.get("browserType"), browser.get("browserVersion")] if v) or None,
+            "failure_reason": _first_value(failure_reason, ["name", "id"]) or item.get("failureReasonName"),
+            "error_message": _first_value(error_analysis, ["message", "errorMessage", "description"]) or
+                             item.get("message"),
+        })
+    return rows
+
+
+PASSED_STATUSES = {"PASSED", "SUCCESS"}
+
+
+def get_execution_timing(execution: Execution) -> tuple[Optional[float], Optional[float]]:
+    """
+    Start timestamp and duration in seconds of the execution.
+    """
+    start_time = get_timestamp(execution.start_time)
+    end_time = get_timestamp(execution.end_time)
+    if start_time is None or end_time is None or end_time < start_time:
+        return start_time, None
+    return start_time, end_time - start_time
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+def _format_duration_stats(name: str, durations: List[float], passed: int, runs: int) -> DurationStats:
+    p50, p90, p99 = percentiles(durations, [50, 90, 99])
+    return DurationStats(name=name, runs=runs, pass_rate=_round(passed / runs), p50=_round(p50), p90=_round(p90),
+                         p99=_round(p99))
+
+
+def _format_trend_series(timings: List[tuple[float, Optional[float], bool]], start: float, end: float,
+                         buckets: int) -> TrendSeries:
+    indexes = bucket_indexes([timing[0] for timing in timings], start, end, buckets)
+    bucket_durations = [[] for _ in range(buckets)]
+    bucket_runs = [0] * buckets
+    bucket_passed = [0] * buckets
+    for index, (_, duration, passed) in zip(indexes, timings):
+        bucket_runs[index] += 1
+        bucket_passed[index] += passed
+        if duration is not None:
+            bucket_durations[index].append(duration)
+    bucket_percentiles = [percentiles(durations, [50, 90]) for durations in bucket_durations]
+    return TrendSeries(
+        bucket_start=[get_date_time_iso(round(bucket_start)) for bucket_start in bucket_starts(start, end, buckets)],
+        runs=bucket_runs,
+        pass_rate=[_round(passed / runs) if runs else None for passed, runs in zip(bucket_passed, bucket_runs)],
+        p50=[_round(p[0]) for p in bucket_percentiles],
+        p90=[_round(p[1]) for p in bucket_percentiles],
+    )
+
+
+def format_execution_trends(executions: List[Execution], params: Optional[dict] = None) -> ExecutionTrends:
+    params = params or {}
+    buckets = params.get("buckets", 20)
+    top_tests = params.get("top_tests", 10)
+
+    timings = []
+    tests = {}
+    devices = {}
+    for execution in executions:
+        start_time, duration = get_execution_timing(execution)
+        if start_time is None:
+            continue
+        passed = execution.status is not None and execution.status.upper() in PASSED_STATUSES
+        timings.append((start_time, duration, passed))
+        groups = [(tests, execution.test_name)]
+        groups.extend((devices, platform.device_id) for platform in execution.platforms if platform.device_id)
+        for group, name in groups:
+            group.setdefault(name, []).append((start_time, duration, passed))
+
+    def group_stats(group: dict[str, list]) -> List[DurationStats]:
+        stats = [_format_duration_stats(name, [t[1] for t in items if t[1] is not None], sum(t[2] for t in items),
+                                        len(items))
+                 for name, items in group.items()]
+        return sorted(stats, key=lambda s: s.runs, reverse=True)
+
+    start = min((timing[0] for timing in timings), default=0.0)
+    end = max((timing[0] for timing in timings), default=0.0)
+    start = params.get("window_start") or start
+    end = params.get("window_end") or end
+    tests_stats = group_stats(tests)
+    return ExecutionTrends(
+        executions=len(timings),
+        window_start=get_date_time_iso(start) if timings else None,
+        window_end=get_date_time_iso(end) if timings else None,
+        bucket_seconds=_round((end - start) / buckets) if timings else None,
+        tests=tests_stats,
+        devices=group_stats(devices),
+        series=_format_trend_series(timings, start, end, buckets),
+        test_series={stats.name: _format_trend_series(tests[stats.name], start, end, buckets)
+                     for stats in tests_stats[:top_tests]},
+    )
+
+
+def add_device_usage(devices_usage: dict[str, dict[str, Any]], executions: List[Execution]):
+    # Accumulates the device usage page by page, so the executions don't need to be kept
+    for execution in executions:
+        start_time, duration = get_execution_timing(execution)
+        failed = is_failed_status(execution.status)
+        for platform in execution.platforms:
+            if not platform.device_id:
+                continue
+            usage = devices_usage.setdefault(platform.device_id, {
+                "model": platform.model or None, "os": platform.os, "runs": 0, "failures": 0, "seconds": 0.0,
+                "last_run": None,
+            })
+            usage["runs"] += 1
+            usage["failures"] += failed
+            usage["seconds"] += duration or 0.0
+            if start_time is not None and (usage["last_run"] is None or start_time > usage["last_run"]):
+                usage["last_run"] = start_time
+
+
+def format_device_utilization(devices_usage: dict[str, dict[str, Any]],
+                              params: Optional[dict] = None) -> DeviceUtilizationReport:
+    params = params or {}
+    window_hours = max(params.get("window_hours", 1.0), 1 / 3600)
+    hot_threshold = params.get("hot_threshold", 0.5)
+    idle_threshold = params.get("idle_threshold", 0.05)
+    inventory = params.get("inventory")  # Device IDs of the real devices inventory
+
+    devices = []
+    models = {}
+    for device_id, usage in devices_usage.items():
+        utilization = usage["seconds"] / 3600 / window_hours
+        flag = None
+        if utilization >= hot_threshold:
+            flag = "hot"
+        elif utilization <= idle_threshold:
+            flag = "idle"
+        devices.append(DeviceUtilization(
+            device_id=device_id,
+            model=usage["model"],
+            os=usage["os"],
+            runs=usage["runs"],
+            failures=usage["failures"],
+            failure_rate=_round(usage["failures"] / usage["runs"]) if usage["runs"] else 0.0,
+            device_hours=_round(usage["seconds"] / 3600),
+            utilization=_round(utilization),
+            last_run=get_date_time_iso(usage["last_run"]),
+            flag=flag,
+        ))
+        if usage["runs"] > 0:
+            model = models.setdefault(usage["model"] or "unknown", {"devices": 0, "runs": 0, "failures": 0,
+                                                                    "seconds": 0.0})
+            model["devices"] += 1
+            model["runs"] += usage["runs"]
+            model["failures"] += usage["failures"]
+            model["seconds"] += usage["seconds"]
+
+    devices.sort(key=lambda d: d.device_hours, reverse=True)
+    return DeviceUtilizationReport(
+        executions=params.get("executions", 0),
+        window_hours=_round(window_hours),
+        devices=devices,
+        models=sorted((ModelUtilization(model=name, devices=model["devices"], runs=model["runs"],
+                                        failure_rate=_round(model["failures"] / model["runs"]),
+                                        device_hours=_round(model["seconds"] / 3600))
+                       for name, model in models.items()), key=lambda m: m.device_hours, reverse=True),
+        hot_devices=[device.device_id for device in devices if device.flag == "hot"],
+        idle_devices=[device.device_id for device in devices if device.flag == "idle"],
+        # The IDs are not joined as the same devices, the reports can use other device IDs than the inventory
+        inventory_without_executions=sorted(inventory - devices_usage.keys()) if inventory is not None else None,
+        devices_not_in_inventory=sorted(devices_usage.keys() - inventory) if inventory is not None else None,
+    )
+
+
+def _get_tests_outcome(executions: List[Execution]) -> dict[str, dict[str, Any]]:
+    # A test fails in a build when any of its executions failed
+    tests = {}
+    for execution in executions:
+        _, duration = get_execution_timing(execution)
+        test = tests.setdefault(execution.test_name, {"failed": False, "passed": False, "durations": []})
+        test["failed"] |= is_failed_status(execution.status)
+        test["passed"] |= execution.status is not None and execution.status.upper() in PASSED_STATUSES
+        if duration is not None:
+            test["durations"].append(duration)
+    return tests
+
+
+def format_job_summary(builds: dict[int, List[Execution]], params: Optional[dict] = None) -> JobSummary:
+    params = params or {}
+    max_deltas = params.get("max_deltas", 10)
+
+    summaries = []
+    previous_number = None
+    previous_tests = None
+    for job_number in sorted(builds.keys()):
+        executions = builds[job_number]
+        statuses = Counter(execution.status or "UNKNOWN" for execution in executions)
+        timings = [get_execution_timing(execution) for execution in executions]
+        starts = [start for start, _ in timings if start is not None]
+        ends = [start + duration for start, duration in timings if start is not None and duration is not None]
+        passed = sum(count for status, count in statuses.items() if status.upper() in PASSED_STATUSES)
+        tests = _get_tests_outcome(executions)
+
+        summary = JobBuildSummary(
+            job_number=job_number,
+            executions=len(executions),
+            statuses=dict(statuses),
+            pass_rate=_round(passed / len(executions)) if executions else None,
+            duration=_round(sum(duration for _, duration in timings if duration is not None)),
+            wall_time=_round(max(ends) - min(starts)) if starts and ends else None,
+        )
+        if previous_tests is not None:
+            summary.compared_to = previous_number
+            summary.newly_failing = sorted(name for name, test in tests.items()
+                                           if test["failed"] and previous_tests.get(name, {}).get("passed")
+                                           and not previous_tests[name]["failed"])
+            summary.newly_fixed = sorted(name for name, test in tests.items()
+                                         if not test["failed"] and test["passed"]
+                                         and previous_tests.get(name, {}).get("failed"))
+            deltas = []
+            for name, test in tests.items():
+                previous_durations = previous_tests.get(name, {}).get("durations")
+                if test["durations"] and previous_durations:
+                    previous = sum(previous_durations) / len(previous_durations)
+                    current = sum(test["durations"]) / len(test["durations"])
+                    deltas.append(TestDurationDelta(test_name=name, previous=_round(previous),
+                                                    current=_round(current), delta=_round(current - previous)))
+            summary.duration_deltas = sorted((delta for delta in deltas if delta.delta != 0),
+                                             key=lambda d: abs(d.delta), reverse=True)[:max_deltas]
+        summaries.append(summary)
+        if executions:
+            previous_number = job_number
+            previous_tests = tests
+
+    return JobSummary(job_name=params.get("job_name", ""), builds=summaries)
+
+
+def _get_duration_delta(command_a: ExecutionCommand, command_b: ExecutionCommand) -> Optional[float]:
+    if command_a.duration is None or command_b.duration is None:
+        return None
+    return _round(command_b.duration - command_a.duration)
+
+
+def format_execution_comparison(commands_a: List[ExecutionCommand], commands_b: List[ExecutionCommand],
+                                params: Optional[dict] = None) -> ExecutionComparison:
+    params = params or {}
+    min_delta = params.get("min_delta", 1.0)
+    max_items = params.get("max_items", 20)
+
+    keys_a = [(command.step, command.name) for command in commands_a]
+    keys_b = [(command.step, command.name) for command in commands_b]
+    matcher = SequenceMatcher(None, keys_a, keys_b, autojunk=False)
+
+    first_divergence = None
+    status_changes = []
+    timing_deltas = []
+    sequence_changes = []
+    for tag, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+        if tag == "equal":
+            for command_a, command_b in zip(commands_a[a_start:a_end], commands_b[b_start:b_end]):
+                delta = _get_duration_delta(command_a, command_b)
+                if command_a.status != command_b.status:
+                    diff = CommandDiff(kind="status_changed", command_a=command_a, command_b=command_b, delta=delta)
+                    status_changes.append(diff)
+                    first_divergence = first_divergence or diff
+                elif delta is not None and abs(delta) >= min_delta:
+                    timing_deltas.append(CommandDiff(kind="timing", command_a=command_a, command_b=command_b,
+                                                     delta=delta))
+        else:
+            for command_a, command_b in zip_longest(commands_a[a_start:a_end], commands_b[b_start:b_end]):
+                if command_a is None:
+                    kind = "inserted"
+                elif command_b is None:
+                    kind = "deleted"
+                else:
+                    kind = "replaced"
+                diff = CommandDiff(kind=kind, command_a=command_a, command_b=command_b)
+                sequence_changes.append(diff)
+                first_divergence = first_divergence or diff
+
+    aligned = sum(block.size for block in matcher.get_matching_blocks())
+    return ExecutionComparison(
+        execution_id_a=params.get("execution_id_a", ""),
+        execution_id_b=params.get("execution_id_b", ""),
+        commands_a=len(commands_a),
+        commands_b=len(commands_b),
+        duration_a=_round(sum(command.duration or 0 for command in commands_a)),
+        duration_b=_round(sum(command.duration or 0 for command in commands_b)),
+        similarity=_round(2 * aligned / (len(commands_a) + len(commands_b))) if commands_a or commands_b else 1.0,
+        first_divergence=first_divergence,
+        status_changes=status_changes[:max_items],
+        timing_deltas=sorted(timing_deltas, key=lambda d: abs(d.delta), reverse=True)[:max_items],
+        sequence_changes=sequence_changes[:max_items],
+    )
+
+
+def _get_run_device(platform: ExecutionPlatform) -> tuple[str, Optional[str]]:
+    browser = platform.browser or {}
+    browser_name = _first_value(browser, ["browserType", "name"])
+    browser_version = _first_value(browser, ["browserVersion", "version"])
+    device = platform.device_id or platform.model or browser_name or platform.os or "unknown"
+    if browser_name:
+        version = f"{browser_name} {browser_version or ''}".strip()
+    else:
+        version = f"{platform.os or ''} {platform.os_version or ''}".strip()
+    return device, version or None
+
+
+def format_scriptless_run_summary(executions: List[Execution], params: Optional[dict] = None) -> ScriptlessRunSummary:
+    # The latest execution of each test on each device, the executions can come in any order
+    latest: dict[tuple[str, str], tuple[Execution, Optional[str]]] = {}
+    runs = Counter()
+    for execution in executions:
+        for platform in execution.platforms or [None]:
+            device, version = _get_run_device(platform) if platform is not None else ("unknown", None)
+            key = (execution.test_name, device)
+            runs[key] += 1
+            current = latest.get(key)
+            if current is None or (get_execution_timing(execution)[0] or 0) > (get_execution_timing(current[0])[0] or 0):
+                latest[key] = (execution, version)
+
+    matrix = []
+    failure_patterns: dict[str, Counter] = {}
+    for (test_name, device), (execution, version) in latest.items():
+        _, duration = get_execution_timing(execution)
+        failure_reason = get_failure_message(execution) if is_failed_status(execution.status) else None
+        if failure_reason is not None:
+            failure_patterns.setdefault(normalize_message(failure_reason), Counter())[failure_reason] += 1
+        matrix.append(ScriptlessRunDevice(
+            test_name=test_name,
+            device=device,
+            platform=version,
+            status=execution.status,
+            duration=round(duration, 1) if duration is not None else None,
+            failure_reason=failure_reason,
+            runs=runs[(test_name, device)],
+            execution_url=execution.execution_url,
+        ))
+    matrix.sort(key=lambda row: (not is_failed_status(row.status), row.test_name, row.device))
+    failure_reasons = [FailureReasonCount(failure_reason=messages.most_common(1)[0][0], devices=sum(messages.values()))
+                       for messages in failure_patterns.values()]
+    failure_reasons.sort(key=lambda reason: reason.devices, reverse=True)
+    return ScriptlessRunSummary(
+        executions=len(executions),
+        devices=len({device for _, device in latest.keys()}),
+        status_counts=dict(Counter(row.status for row in matrix)),
+        failure_reasons=failure_reasons,
+        matrix=matrix,
+    )
@@ -1,6 +1,7 @@
 from typing import List, Any, Optional
 
-from models.grid import Grid
+from models.grid import Grid, GridCapacity, BrowserCapacity
+from tools.utils import get_date_time_iso
 
 
 def format_grid_info(grids: dict[str, Any], params: Optional[dict] = None) -> List[Grid]:
@@ -11,4 +12,34 @@ def format_grid_info(grids: dict[str, Any], params: Optional[dict] = None) -> Li
             selenium_grid_status={},
         )
     ]
-    return formatted_grids
\ No newline at end of file
+    return formatted_grids
+
+
+def format_grid_capacity(status: dict[str, Any], params: Optional[dict] = None) -> GridCapacity:
+    """
+    Slots by browser of a Selenium Grid 4 status (value.nodes[].slots[]), a slot with a session is busy.
+    """
+    params = params or {}
+    value = status.get("value", status) if isinstance(status, dict) else {}
+    browsers = {}
+    for node in value.get("nodes", []) or []:
+        node_up = str(node.get("availability", "UP")).upper() == "UP"
+        for slot in node.get("slots", []) or []:
+            browser_name = (slot.get("stereotype") or {}).get("browserName") or "unknown"
+            capacity = browsers.setdefault(browser_name, BrowserCapacity(browser_name=browser_name, total=0, busy=0,
+                                                                         free=0))
+            capacity.total += 1
+            if slot.get("session") is not None:
+                capacity.busy += 1
+            elif node_up:
+                capacity.free += 1
+    queue_length = value.get("sessionQueueSize", value.get("queueSize"))
+    return GridCapacity(
+        sampled_at=get_date_time_iso(params.get("sampled_at")),
+        ready=value.get("ready"),
+        total=sum(capacity.total for capacity in browsers.values()),
+        busy=sum(capacity.busy for capacity in browsers.values()),
+        free=sum(capacity.free for capacity in browsers.values()),
+        queue_length=queue_length if isinstance(queue_length, int) else None,
+        browsers=sorted(browsers.values(), key=lambda capacity: capacity.browser_name),
+    )
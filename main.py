@@ -5,13 +5,14 @@ import os
 import sys
 from typing import Literal, cast
 
+import anyio
 from mcp.server.fastmcp import FastMCP, Icon
 
 from config.perfecto import SECURITY_TOKEN_FILE_ENV_NAME, SECURITY_TOKEN_ENV_NAME, PERFECTO_CLOUD_NAME_ENV_NAME, \
     GITHUB
 from config.token import PerfectoToken, PerfectoTokenError
 from config.version import __version__, __executable__, __bundle__, __uvx__, get_version
-from server import register_tools
+from server import register_tools, run_stdio
 
 PERFECTO_SECURITY_TOKEN_FILE_NAME = "perfecto-security-token.txt"
 PERFECTO_SECURITY_TOKEN_FILE_PATH = os.getenv(SECURITY_TOKEN_FILE_ENV_NAME)
@@ -73,7 +74,7 @@ def run(log_level: str = "CRITICAL"):
     mcp = FastMCP("perfecto-mcp", instructions=instructions,
                   log_level=cast(LOG_LEVELS, log_level))
     register_tools(mcp, token)
-    mcp.run(transport="stdio")
+    anyio.run(run_stdio, mcp)
 
 
 def main():
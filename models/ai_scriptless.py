@@ -0,0 +1,12 @@
+from typing import Optional, Any
+
+from pydantic import BaseModel, Field
+
+
+class ScriptlessExecution(BaseModel):
+    device_type: str = Field(description="The device type: real, virtual or desktop")
+    device_under_test: dict[str, Any] = Field(description="The device configuration")
+    result: Optional[Any] = Field(description="The execution submission response", default=None)
+    handle: Optional[str] = Field(description="Handle to track the execution with wait_for_executions", default=None)
+    error: Optional[str] = Field(description="Error message when the device is invalid or the submission failed",
+                                 default=None)
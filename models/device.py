@@ -1,21 +1,84 @@
+from typing import Optional, List, Any
+
 from pydantic import BaseModel, Field
 
 
 class RealDevice(BaseModel):
     device_id: str = Field(description="Unique identifier of the device (capability=deviceName)")
     appium_automation_name: str = Field(description="Name of the appium automation (capability=appium:automationName)")
-    platform_name: str = Field(description="The Platform Name (capability=platformName)")
-    platform_version: str = Field(description="The Platform Version (capability=platformVersion)")
-    manufacturer: str = Field(description="The Manufacturer (capability=manufacturer)")
-    model: str = Field(description="The Model Name (capability=model)")
-    location: str = Field(description="The Location Name (capability=location)")
-    description: str = Field(description="The Device Description")
-    status: str = Field(description="The Device Status")
-    in_use: str = Field(description="Whether the device is in use")
+    # Unavailable or errored devices can miss any of the following attributes
+    platform_name: Optional[str] = Field(description="The Platform Name (capability=platformName)", default=None)
+    platform_version: Optional[str] = Field(description="The Platform Version (capability=platformVersion)",
+                                            default=None)
+    manufacturer: Optional[str] = Field(description="The Manufacturer (capability=manufacturer)", default=None)
+    model: Optional[str] = Field(description="The Model Name (capability=model)", default=None)
+    location: Optional[str] = Field(description="The Location Name (capability=location)", default=None)
+    description: Optional[str] = Field(description="The Device Description", default=None)
+    status: Optional[str] = Field(description="The Device Status", default=None)
+    in_use: Optional[str] = Field(description="Whether the device is in use", default=None)
+    available: Optional[str] = Field(description="Whether the device is available", default=None)
 
 class VirtualDevice(BaseModel):
     platform_name: str = Field(description="The Platform Name (capability=platformName)")
     platform_version: list[str] = Field(description="The Platform Version (capability=platformVersion)")
     manufacturer:str = Field(description="The Manufacturer (capability=manufacturer)")
     model:str = Field(description="The Model Name (capability=model)")
-    use_virtual_device: bool = Field(description="The Use Virtual Device (capability=useVirtualDevice)")
\ No newline at end of file
+    use_virtual_device: bool = Field(description="The Use Virtual Device (capability=useVirtualDevice)")
+
+
+class DesktopDevice(BaseModel):
+    platform_name: str = Field(description="The Platform Name (capability=platformName)")
+    platform_version: str = Field(description="The Platform Version (capability=platformVersion)")
+    browser_name: str = Field(description="The Browser Name (capability=browserName)")
+    browser_version: List[str] = Field(description="The Browser Versions (capability=browserVersion)")
+    resolution: List[str] = Field(description="The Screen Resolutions (capability=resolution)")
+    location: List[str] = Field(description="The Location Names (capability=location)")
+
+
+class CatalogueDevice(BaseModel):
+    device_type: str = Field(description="The device type: real, virtual or desktop")
+    platform_name: Optional[str] = Field(description="The Platform Name", default=None)
+    platform_version: Optional[str] = Field(description="The Platform Version", default=None)
+    manufacturer: Optional[str] = Field(description="The Manufacturer (real and virtual devices)", default=None)
+    model: Optional[str] = Field(description="The Model Name (real and virtual devices)", default=None)
+    device_id: Optional[str] = Field(description="Unique identifier of the device (real devices)", default=None)
+    browser_name: Optional[str] = Field(description="The Browser Name (desktop devices)", default=None)
+    browser_version: Optional[str] = Field(description="The Browser Version (desktop devices)", default=None)
+    resolution: Optional[List[str]] = Field(description="The Screen Resolutions (desktop devices)", default=None)
+    location: Optional[str] = Field(description="The Location Name", default=None)
+    available: Optional[bool] = Field(description="Whether the device is available (real devices)", default=None)
+    in_use: Optional[bool] = Field(description="Whether the device is in use (real devices)", default=None)
+    capabilities: dict[str, Any] = Field(description="Capabilities to open an Appium or Selenium session")
+    device_under_test: dict[str, Any] = Field(description="The device_under_test of the AI Scriptless execute_test "
+                                                          "with this device_type")
+
+
+class RealDeviceChanges(BaseModel):
+    devices: List[RealDevice] = Field(description="Devices added or with status, in use or availability changed")
+    removed_device_ids: List[str] = Field(description="Devices removed from the inventory")
+    since: str = Field(description="Token to use as since in the next call to get only the later changes")
+    refreshed_at: Optional[str] = Field(description="Time of the last refresh of the inventory", default=None)
+
+
+class RealDeviceInfo(BaseModel):
+    device_id: str = Field(description="Unique identifier of the device")
+    result: Optional[Any] = Field(description="Device information", default=None)
+    error: Optional[str] = Field(description="Error message when the device information could not be read",
+                                 default=None)
+
+
+class DeviceCandidate(BaseModel):
+    device: RealDevice = Field(description="The device")
+    score: float = Field(description="Selection score (0 to 1), higher is better")
+    fit: float = Field(description="Fit score (0 to 1), 1 for the lowest platform version meeting the requirements")
+    failure_rate: float = Field(description="Smoothed ratio of failed executions on the device in the history window")
+    runs: int = Field(description="Number of executions on the device in the history window")
+    idle_hours: Optional[float] = Field(description="Hours since the latest execution on the device, "
+                                                    "None without executions in the history window", default=None)
+    verified: bool = Field(description="Whether the device was confirmed free with the live device information")
+
+
+class DeviceSelection(BaseModel):
+    allocation: List[DeviceCandidate] = Field(description="Selected devices, best first")
+    rejected_device_ids: List[str] = Field(description="Top candidates found busy or unavailable on verification")
+    candidates: int = Field(description="Number of free devices meeting the requirements")
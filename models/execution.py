@@ -27,3 +27,234 @@ class Execution(BaseModel):
     platforms: List[ExecutionPlatform] = Field(description="Platforms of the execution")
     failure_reason: dict[str, Any] = Field(description="Failure reason of the execution")
     error_analysis: dict[str, Any] = Field(description="Error analysis of the execution")
+
+
+class FailureCluster(BaseModel):
+    size: int = Field(description="Number of executions in the cluster")
+    representative_message: str = Field(description="Most frequent failure message of the cluster")
+    pattern: str = Field(description="Normalized message pattern (ids, numbers and timestamps stripped)")
+    test_names: List[str] = Field(description="Distinct test names affected by the cluster")
+    execution_ids: List[str] = Field(description="Execution IDs that belong to the cluster")
+
+
+class LiveExecution(BaseModel):
+    execution_id: str = Field(description="Unique identifier of the live execution")
+    name: Optional[str] = Field(description="Name of the test being executed", default=None)
+    status: Optional[str] = Field(description="Live execution status", default=None)
+    owner: Optional[str] = Field(description="User that started the execution", default=None)
+    job_name: Optional[str] = Field(description="Name of the job", default=None)
+    job_number: Optional[int] = Field(description="Number of the job", default=None)
+    device_ids: List[str] = Field(description="Device IDs used by the execution", default=[])
+    start_time: Optional[str] = Field(description="Start time of the execution", default=None)
+
+
+class LiveExecutionChange(BaseModel):
+    change: str = Field(description="Type of change: started, finished or status_changed")
+    elapsed: float = Field(description="Seconds since the beginning of the watch when the change was detected")
+    execution_id: str = Field(description="Unique identifier of the live execution")
+    name: Optional[str] = Field(description="Name of the test being executed", default=None)
+    status: Optional[str] = Field(description="Current status", default=None)
+    previous_status: Optional[str] = Field(description="Previous status (only for status_changed)", default=None)
+
+
+class LiveExecutionWatchSummary(BaseModel):
+    duration: float = Field(description="Seconds watched")
+    polls: int = Field(description="Number of polls made to the live executions search")
+    initial_count: int = Field(description="Live executions at the beginning of the watch")
+    final_count: int = Field(description="Live executions at the end of the watch")
+    started: int = Field(description="Number of executions started during the watch")
+    finished: int = Field(description="Number of executions finished during the watch")
+    status_changed: int = Field(description="Number of status changes during the watch")
+    changes: List[LiveExecutionChange] = Field(description="Changes detected during the watch")
+
+
+class ExecutionReport(BaseModel):
+    execution_id: str = Field(description="Unique identifier of the execution")
+    result: Optional[Any] = Field(description="Report execution details (commands summary)", default=None)
+    error: Optional[str] = Field(description="Error message when the details could not be read", default=None)
+
+
+class ExecutionCommand(BaseModel):
+    index: int = Field(description="Position of the command in the execution")
+    name: Optional[str] = Field(description="Name of the command")
+    step: Optional[str] = Field(description="Name of the test step that contains the command", default=None)
+    status: Optional[str] = Field(description="Status of the command", default=None)
+    start_time: Optional[str] = Field(description="Start time of the command", default=None)
+    offset: Optional[float] = Field(description="Seconds since the beginning of the execution", default=None)
+    duration: Optional[float] = Field(description="Duration of the command in seconds", default=None)
+    message: Optional[str] = Field(description="Message of the command (truncated)", default=None)
+
+
+class ExecutionExport(BaseModel):
+    file_path: str = Field(description="Path of the exported file")
+    file_format: str = Field(description="Format of the exported file")
+    rows: int = Field(description="Number of exported executions")
+    pages: int = Field(description="Number of pages read from the export API")
+    columns: List[str] = Field(description="Columns of the exported file")
+
+
+class TrackedExecution(BaseModel):
+    handle: str = Field(description="Handle of the submitted execution")
+    test_name: Optional[str] = Field(description="Name of the test", default=None)
+    device_id: Optional[str] = Field(description="Device ID (real devices)", default=None)
+    state: str = Field(description="queued (not seen running yet), running or finished")
+    live_status: Optional[str] = Field(description="Latest live execution status", default=None)
+    execution_id: Optional[str] = Field(description="Unique identifier of the execution", default=None)
+    status: Optional[str] = Field(description="Report execution status (once finished)", default=None)
+    execution_url: Optional[str] = Field(description="URL of the report (once finished)", default=None)
+    duration: Optional[float] = Field(description="Duration in seconds (once finished)", default=None)
+    failure_reason: Optional[str] = Field(description="Failure message (once finished with failure)", default=None)
+
+
+class ExecutionWaitSummary(BaseModel):
+    duration: float = Field(description="Seconds waited")
+    polls: int = Field(description="Number of live executions searches")
+    finished: int = Field(description="Number of executions finished with their report")
+    pending: int = Field(description="Number of executions still queued, running or without report")
+    executions: List[TrackedExecution] = Field(description="The tracked executions, in the order of the handles")
+
+
+class ScriptlessRunDevice(BaseModel):
+    test_name: str = Field(description="Name of the test")
+    device: str = Field(description="Device ID, or model or browser when there's no device ID")
+    platform: Optional[str] = Field(description="OS and OS version, or browser and browser version", default=None)
+    status: str = Field(description="Status of the latest execution on the device")
+    duration: Optional[float] = Field(description="Duration in seconds of the latest execution", default=None)
+    failure_reason: Optional[str] = Field(description="Failure message of the latest execution", default=None)
+    runs: int = Field(description="Number of executions of the test on the device")
+    execution_url: str = Field(description="URL of the report of the latest execution")
+
+
+class FailureReasonCount(BaseModel):
+    failure_reason: str = Field(description="Failure message (the most frequent of the messages with its pattern)")
+    devices: int = Field(description="Number of rows of the matrix failing with the message")
+
+
+class ScriptlessRunSummary(BaseModel):
+    executions: int = Field(description="Number of executions analyzed")
+    devices: int = Field(description="Number of devices")
+    status_counts: dict[str, int] = Field(description="Number of rows of the matrix by status")
+    failure_reasons: List[FailureReasonCount] = Field(description="Failure messages of the failed devices, "
+                                                                  "most frequent first")
+    matrix: List[ScriptlessRunDevice] = Field(description="Latest execution by test and device, failed first")
+
+
+class LiveExecutionStop(BaseModel):
+    dry_run: bool = Field(description="When true nothing was stopped, the matched executions are only a preview")
+    matched: int = Field(description="Number of live executions matching the predicate")
+    stopped: int = Field(description="Number of live executions with stop requested successfully")
+    executions: List[LiveExecution] = Field(description="Live executions matching the predicate")
+    errors: List[str] = Field(description="Errors of the stop requests", default=[])
+
+
+class DurationStats(BaseModel):
+    name: str = Field(description="Name of the group (test name, device ID, model, etc.)")
+    runs: int = Field(description="Number of executions")
+    pass_rate: float = Field(description="Ratio of passed executions (0 to 1)")
+    p50: Optional[float] = Field(description="Median duration in seconds", default=None)
+    p90: Optional[float] = Field(description="90th percentile duration in seconds", default=None)
+    p99: Optional[float] = Field(description="99th percentile duration in seconds", default=None)
+
+
+class TrendSeries(BaseModel):
+    bucket_start: List[str] = Field(description="Start time of each bucket")
+    runs: List[int] = Field(description="Number of executions of each bucket")
+    pass_rate: List[Optional[float]] = Field(description="Ratio of passed executions of each bucket")
+    p50: List[Optional[float]] = Field(description="Median duration in seconds of each bucket")
+    p90: List[Optional[float]] = Field(description="90th percentile duration in seconds of each bucket")
+
+
+class ExecutionTrends(BaseModel):
+    executions: int = Field(description="Number of executions analyzed")
+    window_start: Optional[str] = Field(description="Start of the analyzed window", default=None)
+    window_end: Optional[str] = Field(description="End of the analyzed window", default=None)
+    bucket_seconds: Optional[float] = Field(description="Size of each bucket in seconds", default=None)
+    tests: List[DurationStats] = Field(description="Duration percentiles and pass rate by test")
+    devices: List[DurationStats] = Field(description="Duration percentiles and pass rate by device")
+    series: TrendSeries = Field(description="Time series of all the executions")
+    test_series: dict[str, TrendSeries] = Field(description="Time series of the tests with more executions")
+
+
+class DeviceUtilization(BaseModel):
+    device_id: str = Field(description="Device ID")
+    model: Optional[str] = Field(description="Device Model Name", default=None)
+    os: Optional[str] = Field(description="OS name", default=None)
+    runs: int = Field(description="Number of executions")
+    failures: int = Field(description="Number of failed executions")
+    failure_rate: float = Field(description="Ratio of failed executions (0 to 1)")
+    device_hours: float = Field(description="Hours used by executions")
+    utilization: float = Field(description="Ratio of the window used by executions (0 to 1)")
+    last_run: Optional[str] = Field(description="Start time of the latest execution", default=None)
+    flag: Optional[str] = Field(description="hot when highly utilized, idle when barely or not utilized", default=None)
+
+
+class ModelUtilization(BaseModel):
+    model: str = Field(description="Device Model Name")
+    devices: int = Field(description="Number of devices of the model with executions")
+    runs: int = Field(description="Number of executions")
+    failure_rate: float = Field(description="Ratio of failed executions (0 to 1)")
+    device_hours: float = Field(description="Hours used by executions")
+
+
+class DeviceUtilizationReport(BaseModel):
+    executions: int = Field(description="Number of executions analyzed")
+    window_hours: float = Field(description="Hours of the analyzed window")
+    devices: List[DeviceUtilization] = Field(description="Utilization by device, most utilized first")
+    models: List[ModelUtilization] = Field(description="Utilization by model, most utilized first")
+    hot_devices: List[str] = Field(description="Device IDs with utilization over the hot threshold")
+    idle_devices: List[str] = Field(description="Device IDs with utilization under the idle threshold")
+    inventory_without_executions: Optional[List[str]] = Field(
+        description="Device IDs of the real devices inventory without executions in the window, they can be unused "
+                    "or reported with another device ID", default=None)
+    devices_not_in_inventory: Optional[List[str]] = Field(
+        description="Device IDs of the executions not found in the real devices inventory", default=None)
+
+
+class TestDurationDelta(BaseModel):
+    test_name: str = Field(description="Name of the test")
+    previous: float = Field(description="Mean duration in seconds in the previous build")
+    current: float = Field(description="Mean duration in seconds in the build")
+    delta: float = Field(description="Difference of the mean durations in seconds")
+
+
+class JobBuildSummary(BaseModel):
+    job_number: int = Field(description="Number of the job (build)")
+    executions: int = Field(description="Number of executions of the build")
+    statuses: dict[str, int] = Field(description="Number of executions by status")
+    pass_rate: Optional[float] = Field(description="Ratio of passed executions (0 to 1)", default=None)
+    duration: float = Field(description="Sum of the execution durations in seconds")
+    wall_time: Optional[float] = Field(description="Seconds between the first start and the last end", default=None)
+    compared_to: Optional[int] = Field(description="Previous job number used for the comparison", default=None)
+    newly_failing: List[str] = Field(description="Tests failing in this build that passed in the previous one",
+                                     default=[])
+    newly_fixed: List[str] = Field(description="Tests passing in this build that failed in the previous one",
+                                   default=[])
+    duration_deltas: List[TestDurationDelta] = Field(description="Biggest test duration changes versus the previous "
+                                                                 "build", default=[])
+
+
+class JobSummary(BaseModel):
+    job_name: str = Field(description="Name of the job")
+    builds: List[JobBuildSummary] = Field(description="Summary by build, sorted by job number")
+
+
+class CommandDiff(BaseModel):
+    kind: str = Field(description="Type of difference: status_changed, timing, inserted, deleted or replaced")
+    command_a: Optional[ExecutionCommand] = Field(description="Command of the first execution", default=None)
+    command_b: Optional[ExecutionCommand] = Field(description="Command of the second execution", default=None)
+    delta: Optional[float] = Field(description="Duration difference in seconds (b - a)", default=None)
+
+
+class ExecutionComparison(BaseModel):
+    execution_id_a: str = Field(description="First execution ID")
+    execution_id_b: str = Field(description="Second execution ID")
+    commands_a: int = Field(description="Number of commands of the first execution")
+    commands_b: int = Field(description="Number of commands of the second execution")
+    duration_a: float = Field(description="Sum of the command durations in seconds of the first execution")
+    duration_b: float = Field(description="Sum of the command durations in seconds of the second execution")
+    similarity: float = Field(description="Ratio of aligned commands (0 to 1)")
+    first_divergence: Optional[CommandDiff] = Field(description="First difference in the command sequences",
+                                                    default=None)
+    status_changes: List[CommandDiff] = Field(description="Aligned commands with different status")
+    timing_deltas: List[CommandDiff] = Field(description="Aligned commands with the biggest duration changes")
+    sequence_changes: List[CommandDiff] = Field(description="Commands inserted, deleted or replaced")
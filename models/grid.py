@@ -1,7 +1,32 @@
+from typing import Optional, List
+
 from pydantic import BaseModel, Field
 
 
+class BrowserCapacity(BaseModel):
+    browser_name: str = Field(description="The Browser Name")
+    total: int = Field(description="Number of session slots")
+    busy: int = Field(description="Number of slots running a session")
+    free: int = Field(description="Number of slots ready for a new session")
+
+
+class GridCapacity(BaseModel):
+    sampled_at: str = Field(description="Time of the Selenium Grid Status sample")
+    ready: Optional[bool] = Field(description="Whether the Selenium Grid is ready to accept sessions", default=None)
+    total: int = Field(description="Number of session slots")
+    busy: int = Field(description="Number of slots running a session")
+    free: int = Field(description="Number of slots ready for a new session")
+    queue_length: Optional[int] = Field(description="Number of session requests waiting for a slot, "
+                                                    "None when the status doesn't report it", default=None)
+    browsers: List[BrowserCapacity] = Field(description="Capacity by browser")
+
+
 class Grid(BaseModel):
     selenium_grid_url: str = Field(description="The Selenium Grid URL")
     selenium_grid_aws_region: str = Field(description="The AWS Region")
-    selenium_grid_status: dict = Field(description="The Selenium Grid Status")
\ No newline at end of file
+    selenium_grid_status: dict = Field(description="The Selenium Grid Status")
+    selenium_grid_capacity: Optional[GridCapacity] = Field(description="Capacity of the latest Selenium Grid Status",
+                                                           default=None)
+    selenium_grid_capacity_history: Optional[List[GridCapacity]] = Field(
+        description="Capacity of the previous Selenium Grid Status samples, oldest first", default=None
+    )
@@ -33,3 +33,5 @@ class PaginationResult(BaseResult):
     offset: int = Field(description="Offset index", default=0)
     next_offset: int = Field(description="Next Offset index", default=0)
     has_more: bool = Field(description="Has More", default=0)
+    cursor: Optional[str] = Field(description="Cursor of the current page", default=None)
+    next_cursor: Optional[str] = Field(description="Cursor to continue after the last item of the page", default=None)
@@ -1,5 +1,8 @@
 from typing import Optional
 
+from mcp import types
+from mcp.server.stdio import stdio_server
+
 from config.token import PerfectoToken
 from tools.ai_scriptless_manager import register as register_ai_scriptless_manager
 from tools.device_manager import register as register_device_manager
@@ -21,3 +24,22 @@ def register_tools(mcp, token: Optional[PerfectoToken]):
     register_execution_manager(mcp, token)
     register_help_manager(mcp, token)
     register_ai_scriptless_manager(mcp, token)
+
+
+async def run_stdio(mcp):
+    """
+    Run the MCP server using stdio transport.
+
+    The initialization options advertise the resource subscriptions when there is a subscribe handler registered,
+    the low level server doesn't advertise them by itself.
+
+    Args:
+        mcp: The MCP server instance with all the tools registered
+    """
+    server = mcp._mcp_server
+    initialization_options = server.create_initialization_options()
+    resources_capability = initialization_options.capabilities.resources
+    if resources_capability is not None and types.SubscribeRequest in server.request_handlers:
+        resources_capability.subscribe = True
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, initialization_options)
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import time
 import traceback
 from typing import Optional, Any, Dict
 
@@ -9,57 +11,148 @@ from pydantic import Field
 from config import perfecto
 from config.perfecto import TOOLS_PREFIX, SUPPORT_MESSAGE
 from config.token import PerfectoToken, token_verify
-from formatters.ai_scriptless import format_ai_scriptless_tests, \
-    format_ai_scriptless_tests_filter_values
+from formatters.ai_scriptless import format_ai_scriptless_test, get_ai_scriptless_test_items, \
+    format_scriptless_execution_handle, get_ai_scriptless_test_name
+from models.ai_scriptless import ScriptlessExecution
+from models.device import CatalogueDevice
 from models.manager import Manager
 from models.result import BaseResult, PaginationResult
-from tools.utils import api_request
+from tools.cache_utils import CloudCache
+from tools.device_cache import DeviceCatalogue
+from tools.device_manager import DeviceManager
+from tools.scriptless_cache import ScriptlessTestIndex
+from tools.text_utils import resolve_value
+from tools.utils import api_request, api_conditional_request, gather_with_concurrency
+
+# This mapping allows us to detect when the AI gets confused and uses Perfecto-style capabilities.
+# It also allows for reverse mapping from internal to capabilities from Perfecto.
+DUT_ATTRIBUTES = {
+    "real": {
+        "device_id": "deviceId"
+    },
+    "virtual": {
+        "platform_name": "platformName",
+        "manufacturer": "manufacturer",
+        "model": "model",
+        "platform_version": "platformVersion"
+    },
+    "desktop": {
+        "platform_name": "platformName",
+        "platform_version": "platformVersion",
+        "browser_name": "browserName",
+        "browser_version": "browserVersion",
+        "resolution": "resolution",
+        "location": "location"
+    }
+}
+UNTRACKED_EXECUTION_MESSAGE = "The submission response has no execution ID and the test name is unknown, " \
+                              "the execution can't be tracked with wait_for_executions, use list_live_executions"
+# Trees with more tests are patched out of the event loop
+LARGE_TEST_INDEX_SIZE = 1000
 
 
 class AiScriptlessManager(Manager):
+    test_indexes = CloudCache(ttl=300, max_age=3600)  # Static to share between different instance of AiScriptlessManager
+
     def __init__(self, token: Optional[PerfectoToken], ctx: Context):
         super().__init__(token, ctx)
 
+        self.max_concurrency = 8
+
+    @staticmethod
+    def _patch_test_index(index: ScriptlessTestIndex, tests: list[dict[str, Any]]) -> ScriptlessTestIndex:
+        patched = index.copy()
+        patched.patch(tests)
+        return patched
+
+    async def _load_test_index(self) -> BaseResult:
+        """
+        Refresh the cached index with a conditional request of the tree, patching it in place when it changed.
+        """
+        tree_url = perfecto.get_ai_scriptless_api_url(self.token.cloud_name)
+        tree_url = tree_url + "/scripts/tree"
+        cached = AiScriptlessManager.test_indexes.peek(self.token.cloud_name)
+        index = cached.result if cached is not None else None
+        tests_result, validators = await api_conditional_request(
+            self.token, "GET", endpoint=tree_url, validators=index.validators if index is not None else None,
+            result_formatter=get_ai_scriptless_test_items
+        )
+        if tests_result is None:  # Not modified
+            return cached
+        if tests_result.error is not None:
+            return tests_result
+        if index is None:
+            # Indexing tens of thousands of tests takes a while, it's done out of the event loop
+            index = await asyncio.to_thread(ScriptlessTestIndex, tests_result.result)
+        elif len(tests_result.result) > LARGE_TEST_INDEX_SIZE:
+            # Patched as a copy out of the event loop, the cached index keeps serving searches meanwhile
+            index = await asyncio.to_thread(self._patch_test_index, index, tests_result.result)
+        else:
+            index.patch(tests_result.result)
+        index.validators = validators
+        return BaseResult(
+            result=index,
+        )
+
+    async def _get_test_index(self) -> BaseResult:
+        return await AiScriptlessManager.test_indexes.get(self.token.cloud_name, self._load_test_index)
+
+    async def _get_test_index_with(self, test_id: str) -> BaseResult:
+        """
+        The tests index, reloaded when it doesn't have the test (it could be created after the index was cached).
+        """
+        index_result = await self._get_test_index()
+        if index_result.error is None and test_id not in index_result.result.tests:
+            AiScriptlessManager.test_indexes.invalidate(self.token.cloud_name)
+            index_result = await self._get_test_index()
+        return index_result
+
     @token_verify
     async def list_tests(self, args: dict[str, Any]) -> BaseResult:
         page_size = 50
         page_index = args.get("page_index", 1)
         skip = (page_size * page_index) - page_size
 
-        tree_url = perfecto.get_ai_scriptless_api_url(self.token.cloud_name)
-        tree_url = tree_url + "/scripts/tree"
-        tests_result = await api_request(self.token, "GET", endpoint=tree_url,
-                                         result_formatter=format_ai_scriptless_tests,
-                                         result_formatter_params={"page_size": page_size, "skip": skip,
-                                                                  "filters": args})
+        index_result = await self._get_test_index()
+        if index_result.error is not None:
+            return index_result
+        index = index_result.result
+        tests = index.search(args.get("test_name"), args.get("visibility"), args.get("owner_list"))
+
+        warnings = None
+        if len(tests) == 0 and args.get("test_name"):
+            similar_names = index.similar_names(args["test_name"])
+            if len(similar_names) > 0:
+                warnings = [f"No test name contains {args['test_name']}, similar test names: "
+                            f"{', '.join(similar_names)}"]
 
+        items = [format_ai_scriptless_test(test) for test in tests[skip:skip + page_size]]
         page_result = PaginationResult(
-            items=tests_result.result,
-            count=len(tests_result.result),
+            items=items,
+            count=len(items),
+            total=len(tests),
             page=page_index,
             offset=skip,
             next_offset=skip + page_size,
-            has_more=page_size - len(tests_result.result) <= 0,
+            has_more=skip + page_size < len(tests),
         )
 
         return BaseResult(
             result=page_result,
-            error=tests_result.error,
-            warning=tests_result.warning,
-            info=tests_result.info,
+            warning=warnings,
         )
 
     @token_verify
     async def list_filter_values(self, filter_names: list[str]) -> BaseResult:
-        tree_url = perfecto.get_ai_scriptless_api_url(self.token.cloud_name)
-        tree_url = tree_url + "/scripts/tree"
-        filter_values_result = await api_request(self.token, "GET", endpoint=tree_url,
-                                                 result_formatter=format_ai_scriptless_tests_filter_values)
+        index_result = await self._get_test_index()
+        if index_result.error is not None:
+            return index_result
+        all_filter_values = index_result.result.filter_values()
         filter_values = {}
         filter_not_found = []
         for filter_name in filter_names:
-            if filter_name in filter_values_result.result:
-                filter_values[filter_name] = filter_values_result.result[filter_name]
+            if filter_name in all_filter_values:
+                filter_values[filter_name] = all_filter_values[filter_name]
             else:
                 filter_not_found.append(filter_name)
 
@@ -75,73 +168,240 @@ class AiScriptlessManager(Manager):
             warning=warnings,
         )
 
-    @token_verify
-    async def execute_test(self, test_id: str, device_type: str, device_under_test: dict[str, Any]) -> BaseResult:
-        execute_url = perfecto.get_ai_scriptless_execution_api_url(self.token.cloud_name)
-
-        # This mapping allows us to detect when the AI gets confused and uses Perfecto-style capabilities.
-        # It also allows for reverse mapping from internal to capabilities from Perfecto.
-        att_map = {
-            "real": {
-                "device_id": "deviceId"
-            },
-            "virtual": {
-                "platform_name": "platformName",
-                "manufacturer": "manufacturer",
-                "model": "model",
-                "platform_version": "platformVersion"
-            },
-            "desktop": {
-                "platform_name": "platformName",
-                "platform_version": "platformVersion",
-                "browser_name": "browserName",
-                "browser_version": "browserVersion",
-                "resolution": "resolution",
-                "location": "location"
-            }
-        }
-
-        dut = None
-        remapped_device_under_test = {}
+    @staticmethod
+    def _remap_device_under_test(device_type: str, device_under_test: dict[str, Any]) -> dict[str, Any]:
         # Remap the attributes to Perfecto Capabilities format
-        if device_type in att_map.keys():
-            for key in att_map[device_type].keys():
-                alt_key = att_map[device_type][key]
-                remapped_device_under_test[alt_key] = device_under_test.get(key, device_under_test.get(alt_key, None))
+        remapped_device_under_test = {}
+        for key, alt_key in DUT_ATTRIBUTES.get(device_type, {}).items():
+            remapped_device_under_test[alt_key] = device_under_test.get(key, device_under_test.get(alt_key, None))
+        return remapped_device_under_test
 
+    def _build_dut(self, device_type: str, device_under_test: dict[str, Any]) -> BaseResult:
+        """
+        The DUT parameter of the execution of a device: the device ID for real devices,
+        or the JSON of the capabilities for virtual and desktop devices.
+        """
+        remapped_device_under_test = self._remap_device_under_test(device_type, device_under_test)
         if device_type == "real":
             dut = remapped_device_under_test.get("deviceId", None)
             if dut is None:
                 return BaseResult(
                     error="Invalid value for device_under_test. The key device_id could not be found."
                 )
+            return BaseResult(result=dut)
         elif device_type in ["virtual", "desktop"]:
             # Verify if all the needed keys exist on the remapped version
-            key_not_found = []
-            for key in att_map[device_type].keys():
-                alt_key = att_map[device_type][key]
-                if alt_key not in remapped_device_under_test:
-                    key_not_found.append(key)
-            if len(key_not_found) == 0:
-                dut = json.dumps(remapped_device_under_test, separators=(',', ':'))
-            else:
+            key_not_found = [key for key, alt_key in DUT_ATTRIBUTES[device_type].items()
+                             if remapped_device_under_test.get(alt_key) is None]
+            if len(key_not_found) > 0:
                 keys_not_found_str = ",".join(key_not_found)
                 return BaseResult(
                     error=f"Invalid value for device_under_test. The keys [{keys_not_found_str}] could not be found."
                 )
-        if dut is not None and len(dut) > 0:
-            body = {
-                "params": {
-                    "DUT": dut
-                },
-                "testKey": test_id,
-                "triggerType": "Manual"
-            }
-            return await api_request(self.token, "POST", endpoint=execute_url, json=body)
+            return BaseResult(result=json.dumps(remapped_device_under_test, separators=(',', ':')))
+        return BaseResult(
+            error="Invalid device_type or device_under_test value."
+        )
+
+    @staticmethod
+    def _get_entry_values(entry: CatalogueDevice, key: str) -> list[Any]:
+        return (entry.resolution or []) if key == "resolution" else [getattr(entry, key)]
+
+    @staticmethod
+    def _validate_dut(device_type: str, device_under_test: dict[str, Any],
+                      catalogue: DeviceCatalogue) -> Optional[str]:
+        """
+        Error message when the device isn't in the devices catalogue (or the real device isn't free), None if valid.
+        The message suggests the closest valid values of the first attribute that doesn't match.
+        """
+        device = {key: device_under_test.get(key, device_under_test.get(alt_key))
+                  for key, alt_key in DUT_ATTRIBUTES[device_type].items()}
+        if device_type == "real":
+            device_id = str(device["device_id"])
+            entries = catalogue.search({"device_type": "real", "device_id": device_id})
+            if len(entries) == 0:
+                real_device_ids = [entry.device_id for entry in catalogue.search({"device_type": "real"})]
+                suggestions = resolve_value(device_id, real_device_ids)
+                did_you_mean = f", did you mean {', '.join(suggestions)}?" if suggestions else ""
+                return f"The real device {device_id} doesn't exist{did_you_mean}"
+            entry = entries[0]
+            if not entry.available or entry.in_use:
+                free_entries = catalogue.search({"device_type": "real", "model": entry.model, "available": True,
+                                                 "in_use": False})
+                alternatives = f", free devices of the same model: " \
+                               f"{', '.join(e.device_id for e in free_entries[:5])}" if free_entries else ""
+                return f"The real device {device_id} is not available or it's in use{alternatives}"
+            return None
+
+        # Narrow the devices attribute by attribute, so the first attribute that doesn't match is reported
+        entries = catalogue.search({"device_type": device_type})
+        matched = {}
+        for key in DUT_ATTRIBUTES[device_type].keys():
+            value = str(device[key])
+            matching = [entry for entry in entries
+                        if any(str(v).casefold() == value.casefold()
+                               for v in AiScriptlessManager._get_entry_values(entry, key))]
+            if len(matching) == 0:
+                candidates = sorted({str(v) for entry in entries
+                                     for v in AiScriptlessManager._get_entry_values(entry, key) if v is not None})
+                suggestions = resolve_value(value, candidates)
+                if suggestions:
+                    hint = f"did you mean {', '.join(suggestions)}?"
+                else:
+                    hint = f"valid values: {', '.join(candidates[:20])}{'...' if len(candidates) > 20 else ''}"
+                return f"Invalid {device_type} device_under_test, {key}='{value}' not found" \
+                       f"{' for ' + str(matched) if matched else ''}, {hint}"
+            matched[key] = value
+            entries = matching
+        return None
+
+    async def _submit_test(self, test_id: str, dut: str) -> BaseResult:
+        execute_url = perfecto.get_ai_scriptless_execution_api_url(self.token.cloud_name)
+        body = {
+            "params": {
+                "DUT": dut
+            },
+            "testKey": test_id,
+            "triggerType": "Manual"
+        }
+        return await api_request(self.token, "POST", endpoint=execute_url, json=body)
+
+    def _get_execution_handle(self, index: Optional[ScriptlessTestIndex], test_id: str, device_type: str,
+                              device_under_test: dict[str, Any], response: Any,
+                              submitted_at: int) -> Optional[str]:
+        test = index.tests.get(test_id) if index is not None else None
+        remapped_device_under_test = self._remap_device_under_test(device_type, device_under_test)
+        return format_scriptless_execution_handle(response, {
+            "test_name": get_ai_scriptless_test_name(test["name"]) if test is not None else None,
+            "device_id": remapped_device_under_test.get("deviceId"),
+            "model": remapped_device_under_test.get("model"),
+            "platform_version": remapped_device_under_test.get("platformVersion")
+            if device_type == "virtual" else None,
+            "browser_name": remapped_device_under_test.get("browserName"),
+            "browser_version": remapped_device_under_test.get("browserVersion"),
+            "submitted_at": submitted_at,
+        })
+
+    async def _get_device_catalogue(self) -> BaseResult:
+        """
+        The devices catalogue to validate the devices, any failure reading it is returned as error.
+        """
+        try:
+            return await DeviceManager(self.token, self.ctx).get_device_catalogue()
+        except Exception as e:
+            return BaseResult(
+                error=f"Error: {e!r}"
+            )
+
+    @token_verify
+    async def execute_test(self, test_id: str, device_type: str, device_under_test: dict[str, Any]) -> BaseResult:
+        dut_result = self._build_dut(device_type, device_under_test)
+        if dut_result.error is not None:
+            return dut_result
+        # Validated locally, an invalid device fails before the slow submission
+        warnings = None
+        catalogue_result = await self._get_device_catalogue()
+        if catalogue_result.error is None:
+            validation_error = self._validate_dut(device_type, device_under_test, catalogue_result.result)
+            if validation_error is not None:
+                return BaseResult(
+                    error=validation_error
+                )
         else:
+            warnings = [f"The device could not be validated, the devices catalogue could not be read: "
+                        f"{catalogue_result.error}"]
+        submitted_at = round(time.time())
+        submit_result = await self._submit_test(test_id, dut_result.result)
+        if submit_result.error is not None:
+            return submit_result
+        # The test name of the handle finds the execution between the reports
+        index_result = await self._get_test_index_with(test_id)
+        index = index_result.result if index_result.error is None else None
+        handle = self._get_execution_handle(index, test_id, device_type, device_under_test, submit_result.result,
+                                            submitted_at)
+        result = BaseResult(
+            result=ScriptlessExecution(
+                device_type=device_type,
+                device_under_test=device_under_test,
+                result=submit_result.result,
+                handle=handle,
+            ),
+            warning=warnings,
+        )
+        if handle is not None:
+            result.append_info(["Use wait_for_executions with the handle to wait for the execution to finish"])
+        else:
+            result.append_warnings([UNTRACKED_EXECUTION_MESSAGE])
+        return result
+
+    @token_verify
+    async def execute_test_matrix(self, test_id: str, devices: list[dict[str, Any]],
+                                  skip_invalid: bool = False) -> BaseResult:
+        if len(devices) == 0:
+            return BaseResult(
+                warning=["No list of devices to execute the test was indicated."]
+            )
+        warnings = []
+        index_result = await self._get_test_index_with(test_id)
+        if index_result.error is None and test_id not in index_result.result.tests:
             return BaseResult(
-                error="Invalid device_type or device_under_test value."
+                error=f"The test {test_id} doesn't exist, use list_tests to get a valid test_id"
             )
+        catalogue_result = await self._get_device_catalogue()
+        catalogue = catalogue_result.result if catalogue_result.error is None else None
+        if catalogue is None:
+            warnings.append(f"The devices could not be validated, the devices catalogue could not be read: "
+                            f"{catalogue_result.error}")
+
+        # Validate every device before submitting any execution
+        executions = []
+        duts = []
+        for device in devices:
+            device_type = device.get("device_type", "real")
+            device_under_test = device.get("device_under_test", {})
+            execution = ScriptlessExecution(device_type=device_type, device_under_test=device_under_test)
+            dut_result = self._build_dut(device_type, device_under_test)
+            if dut_result.error is not None:
+                execution.error = dut_result.error
+            elif dut_result.result in duts:
+                execution.error = "The device is listed more than once"
+            elif catalogue is not None:
+                execution.error = self._validate_dut(device_type, device_under_test, catalogue)
+            executions.append(execution)
+            duts.append(dut_result.result)
+        invalid = [execution for execution in executions if execution.error is not None]
+        if len(invalid) > 0 and not skip_invalid:
+            return BaseResult(
+                result=invalid,
+                error=f"{len(invalid)} of {len(executions)} devices are invalid, no execution was submitted "
+                      f"(use skip_invalid=true to submit only the valid devices)",
+            )
+
+        valid = [(execution, dut) for execution, dut in zip(executions, duts) if execution.error is None]
+        submitted_at = round(time.time())
+        results = await gather_with_concurrency(
+            self.max_concurrency, (self._submit_test(test_id, dut) for _, dut in valid)
+        )
+        for (execution, _), result in zip(valid, results):
+            if isinstance(result, BaseException):
+                execution.error = f"Error: {result!r}"
+            else:
+                execution.result = result.result
+                execution.error = result.error
+            if execution.error is None:
+                execution.handle = self._get_execution_handle(
+                    index_result.result if index_result.error is None else None, test_id,
+                    execution.device_type, execution.device_under_test, execution.result, submitted_at
+                )
+        submitted = sum(1 for execution, _ in valid if execution.error is None)
+        if any(execution.error is None and execution.handle is None for execution, _ in valid):
+            warnings.append(UNTRACKED_EXECUTION_MESSAGE)
+        return BaseResult(
+            result=executions,
+            info=[f"{submitted} of {len(executions)} executions submitted, use wait_for_executions with their "
+                  f"handles to wait for them to finish"],
+            warning=warnings or None,
+        )
 
 
 def register(mcp, token: Optional[PerfectoToken]):
@@ -152,7 +412,7 @@ Operations on AI Scriptless information.
 Actions:
 - list_tests: List all available AI Scriptless Test from Perfecto.
     args(dict): Dictionary with the following optional filter parameters:
-        test_name (str): The test name to filter.
+        test_name (str): The test name to filter (case-insensitive, any part of the name).
         visibility (str, default='PRIVATE' values=['PUBLIC', 'PRIVATE']): The visibility, PUBLIC=All Public Tests, PRIVATE=My private tests.
         owner_list (list[str], values= use first list_filter_values tool with 'owner_list'): The list of users to filter tests (owners).
         page_index (int, default=1), The current page number. If the result mention has_next_page in true, asks the user if they want to see the next page.
@@ -160,6 +420,8 @@ Actions:
     args(dict): Dictionary with the following required filter parameters:
         filter_names (list[str], values=['test_name', 'owner_list']): The filter name list.
 - execute_test: Execute a preconfigured AI Scriptless Test.
+    The device is validated before submitting the execution (it must exist, and a real device must be available 
+    and not in use), an invalid device fails with the closest valid values.
     args(dict): Dictionary with the following required parameters:
         test_id (str): Test ID from list_tests()
         device_type (str, default='real', values=['real', 'virtual', 'desktop']: The device type. 
@@ -168,20 +430,24 @@ Actions:
             When device_type='virtual': {platform_name: str, manufacturer: str, model: str, platform_version: str} (Get from list_virtual_devices()).
             When device_type='desktop': {platform_name: str, platform_version: str, browser_name: str, 
                           browser_version: str, resolution: str, location: str} (Get from list_desktop_devices()).
+- execute_test_matrix: Execute a preconfigured AI Scriptless Test on several devices at once.
+    All the devices are validated against the devices catalogue before submitting any execution 
+    (real devices must be available and not in use), then the executions are submitted concurrently.
+    args(dict): Dictionary with the following parameters:
+        test_id (str, required): Test ID from list_tests()
+        devices (list[dict], required): The devices, each one as {device_type: str, device_under_test: dict} 
+            with the same values as execute_test (search_device_catalogue() returns both for any device).
+        skip_invalid (bool, default=False): Submit the valid devices even when some devices are invalid.
 Hints:
 - IMPORTANT: Always call list_filter_values first to get valid filter values before using any filters in list_tests. 
   This ensures you're using the correct test name, list of owners users or other filter values that actually exist in the system.
 - If in any result has_next_page is true, ask the user if they want to see the next page or access all pages before making a subsequent call.
-- Before executing a test, follow this validation workflow:
-  1. list_tests() (get and validate test_id).
-  2. Get device configuration based on device_type:
-     - 'real': list_real_devices() (get device_id).
-     - 'virtual': list_virtual_devices() (get platform_name, manufacturer, model, platform_version).
-     - 'desktop': list_desktop_devices() (get platform_name, platform_version, browser_name, browser_version, resolution, location).
-  3. On real device use read_real_device_info() (verify device is available and not in use).
-  4. execute_test() (execute the test).
-  5. list_report_executions() with report name equal to test name and list_live_executions() when the device it's in use (monitor execution progress).
-- Always check before running a test_id if the device_type and device_under_test exist and is available (when it's a real device), not use device in use or malfunctioning.
+- Workflow to execute a test:
+  1. list_tests() (get test_id).
+  2. execute_test() (execute the test). The device is validated locally, when it's invalid the error suggests 
+     the closest valid values; to explore the devices use search_device_catalogue() (get device_type and 
+     device_under_test) or select_device() (get the best free real device).
+  3. wait_for_executions() with the handle of the result (monitor execution progress until the report is available).
 - Always monitor a real device's operation while it's in use by checking the information with read_real_device_info().
 - Always stop the execution by stopping the live execution (make sure it's the correct execution, such as the execution name or user ID).
 """
@@ -204,6 +470,10 @@ Hints:
                     return await ai_scriptless_manager.execute_test(args.get("test_id", ""),
                                                                     args.get("device_type", ""),
                                                                     args.get("device_under_test", {}))
+                case "execute_test_matrix":
+                    return await ai_scriptless_manager.execute_test_matrix(args.get("test_id", ""),
+                                                                           args.get("devices", []),
+                                                                           args.get("skip_invalid", False))
                 case _:
                     return BaseResult(
                         error=f"Action {action} not found in AI Scriptless manager tool"
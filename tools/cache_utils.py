@@ -0,0 +1,122 @@
+"""
+Cache utilities shared between the instances of the Perfecto MCP tools managers.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional, Callable, Awaitable, Any
+
+from models.result import BaseResult
+from tools.utils import create_background_task
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    __slots__ = ("result", "loaded_at", "version")
+
+    def __init__(self, result: BaseResult, loaded_at: float, version: int):
+        self.result = result
+        self.loaded_at = loaded_at
+        self.version = version
+
+
+class CloudCache:
+    """
+    Cache of results by key (usually the cloud name).
+    Results older than ttl are still served while a background task refreshes them (stale-while-revalidate),
+    results older than max_age are reloaded before being returned. Results with error are never cached.
+    """
+
+    def __init__(self, ttl: float, max_age: Optional[float] = None):
+        self.ttl = ttl
+        self.max_age = max_age if max_age is not None else ttl * 10
+        self._entries: dict[str, CacheEntry] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self._version = 0
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[BaseResult]]) -> BaseResult:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.loaded_at
+            if age < self.ttl:
+                return entry.result
+            if age < self.max_age:
+                self._schedule_refresh(key, loader)
+                return entry.result
+        return await self._load(key, loader)
+
+    def peek(self, key: str) -> Optional[BaseResult]:
+        entry = self._entries.get(key)
+        return entry.result if entry is not None else None
+
+    def get_version(self, key: str) -> Optional[int]:
+        """
+        Version of the cached result, it changes every time the result is reloaded.
+        """
+        entry = self._entries.get(key)
+        return entry.version if entry is not None else None
+
+    def invalidate(self, key: Optional[str] = None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[BaseResult]]) -> BaseResult:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller could have loaded it while waiting for the lock
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.loaded_at < self.ttl:
+                return entry.result
+            result = await loader()
+            if result.error is None:
+                self._version += 1
+                self._entries[key] = CacheEntry(result, time.monotonic(), self._version)
+            return result
+
+    def _schedule_refresh(self, key: str, loader: Callable[[], Awaitable[BaseResult]]):
+        task = self._refresh_tasks.get(key)
+        if task is not None and not task.done():
+            return
+
+        async def refresh():
+            try:
+                await self._load(key, loader)
+            except Exception:
+                logger.debug(f"Background refresh of {key} failed", exc_info=True)
+
+        self._refresh_tasks[key] = create_background_task(refresh())
+
+
+class BackgroundPoller:
+    """
+    Runs a poll coroutine on an interval in background by key (usually the cloud name).
+    The polling of a key stops when it's not touched for idle_timeout seconds, and it's restarted on the next touch.
+    """
+
+    def __init__(self, interval: float, idle_timeout: float):
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._touched_at: dict[str, float] = {}
+
+    def touch(self, key: str, poll: Callable[[], Awaitable[Any]]):
+        self._touched_at[key] = time.monotonic()
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            self._tasks[key] = create_background_task(self._run(key, poll))
+
+    def is_running(self, key: str) -> bool:
+        task = self._tasks.get(key)
+        return task is not None and not task.done()
+
+    async def _run(self, key: str, poll: Callable[[], Awaitable[Any]]):
+        while time.monotonic() - self._touched_at[key] < self.idle_timeout:
+            await asyncio.sleep(self.interval)
+            try:
+                await poll()
+            except Exception:
+                logger.debug(f"Background poll of {key} failed", exc_info=True)
@@ -0,0 +1,209 @@
+"""
+In memory device inventory shared between the instances of the Perfecto MCP tools managers.
+"""
+import asyncio
+import fnmatch
+import re
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Optional, Iterable
+
+from tools.utils import encode_cursor, decode_cursor, get_date_time_iso
+
+REAL_DEVICE_TRACKED_FIELDS = ["status", "inUse", "available"]
+# Indexed attributes of the formatted real devices and the attribute of the API that holds them
+REAL_DEVICE_INDEXED_FIELDS = {
+    "platform_name": "os",
+    "manufacturer": "manufacturer",
+    "model": "model",
+    "location": "location",
+    "status": "status",
+    "in_use": "inUse",
+    "available": "available",
+}
+# Sortable attributes of the formatted real devices and the attribute of the API that holds them
+REAL_DEVICE_API_FIELDS = {
+    "device_id": "deviceId",
+    "platform_version": "osVersion",
+    "description": "description",
+    **REAL_DEVICE_INDEXED_FIELDS,
+}
+# Indexed attributes of the device catalogue entries
+CATALOGUE_INDEXED_FIELDS = {
+    "device_type": "device_type",
+    "device_id": "device_id",
+    "platform_name": "platform_name",
+    "manufacturer": "manufacturer",
+    "model": "model",
+    "browser_name": "browser_name",
+    "browser_version": "browser_version",
+    "location": "location",
+    "available": "available",
+    "in_use": "in_use",
+}
+
+
+def parse_version(version: Optional[str]) -> tuple[int, ...]:
+    """
+    Comparable tuple of a version string ("17.4.1" -> (17, 4, 1)), non-numeric parts are ignored.
+    """
+    if version is None:
+        return ()
+    return tuple(int(part) for part in re.findall(r"\d+", str(version)))
+
+
+class DeviceIndex:
+    """
+    Inverted indexes over devices to answer compound queries without scanning every device.
+    indexed_fields maps each queryable field to the attribute of the devices that holds it.
+    """
+
+    def __init__(self, devices: dict[str, dict[str, Any]], indexed_fields: dict[str, str], version_field: str):
+        self.devices = devices
+        self.fields: dict[str, dict[str, set[str]]] = {field: {} for field in indexed_fields.keys()}
+        versions = []
+        for device_id, item in devices.items():
+            for field, item_field in indexed_fields.items():
+                value = item.get(item_field)
+                value = str(value if value is not None else "").casefold()
+                self.fields[field].setdefault(value, set()).add(device_id)
+            versions.append((parse_version(item.get(version_field)), device_id))
+        versions.sort()
+        self._versions = [version for version, _ in versions]
+        self._version_device_ids = [device_id for _, device_id in versions]
+
+    def match(self, field: str, values: Iterable[str]) -> set[str]:
+        """
+        Devices with any of the values on the field (case-insensitive, values can use * wildcards).
+        """
+        index = self.fields[field]
+        device_ids = set()
+        for value in values:
+            value = str(value).casefold()
+            if "*" in value or "?" in value:
+                for indexed_value, ids in index.items():
+                    if fnmatch.fnmatchcase(indexed_value, value):
+                        device_ids |= ids
+            else:
+                device_ids |= index.get(value, set())
+        return device_ids
+
+    def version_range(self, min_version: Optional[str] = None, max_version: Optional[str] = None) -> set[str]:
+        start = bisect_left(self._versions, parse_version(min_version)) if min_version else 0
+        if max_version:
+            # Inclusive on the given precision: max_version 17 includes 17.4.1
+            upper = parse_version(max_version)
+            end = bisect_right(self._versions, upper + (float("inf"),))
+        else:
+            end = len(self._versions)
+        return set(self._version_device_ids[start:end])
+
+    def query(self, filters: dict[str, Any], min_version: Optional[str] = None,
+              max_version: Optional[str] = None) -> set[str]:
+        """
+        Devices matching all the filters (a value or list of values by field) and the version range.
+        """
+        candidates = [self.match(field, value if isinstance(value, list) else [value])
+                      for field, value in filters.items()]
+        if min_version or max_version:
+            candidates.append(self.version_range(min_version, max_version))
+        # Intersect the smallest candidate sets first
+        candidates.sort(key=len)
+        device_ids = set(candidates[0]) if candidates else set(self.devices.keys())
+        for candidate in candidates[1:]:
+            device_ids &= candidate
+        return device_ids
+
+
+class RealDeviceSnapshot:
+    """
+    Latest real devices inventory of a cloud.
+    Each refresh increments the version when any device is added, removed or changes its tracked fields,
+    so the changes since a previous version can be served without re-reading the whole inventory.
+    """
+
+    def __init__(self):
+        self.snapshot_id = uuid.uuid4().hex[:8]  # Tokens from other snapshots (or processes) are not valid
+        self.version = 0
+        self.devices: dict[str, dict[str, Any]] = {}
+        self.changed_at: dict[str, int] = {}
+        self.removed_at: dict[str, int] = {}
+        self.refreshed_at: Optional[float] = None
+        self.refreshed_at_time: Optional[float] = None
+        self.lock = asyncio.Lock()
+        self._index: Optional[DeviceIndex] = None
+
+    def is_stale(self, max_age: float) -> bool:
+        return self.refreshed_at is None or time.monotonic() - self.refreshed_at > max_age
+
+    def update(self, device_items: List[dict[str, Any]]) -> List[str]:
+        """
+        Replace the inventory and return the IDs of the added, changed or removed devices.
+        """
+        devices = {item.get("deviceId"): item for item in device_items if item.get("deviceId")}
+        changed = [device_id for device_id, item in devices.items()
+                   if device_id not in self.devices or
+                   any(item.get(field) != self.devices[device_id].get(field) for field in REAL_DEVICE_TRACKED_FIELDS)]
+        removed = [device_id for device_id in self.devices.keys() if device_id not in devices]
+        if changed or removed:
+            self.version += 1
+            for device_id in changed:
+                self.changed_at[device_id] = self.version
+                self.removed_at.pop(device_id, None)
+            for device_id in removed:
+                self.removed_at[device_id] = self.version
+                self.changed_at.pop(device_id, None)
+        self.devices = devices
+        self._index = None
+        self.refreshed_at = time.monotonic()
+        self.refreshed_at_time = time.time()
+        return changed + removed
+
+    def get_index(self) -> DeviceIndex:
+        if self._index is None:
+            self._index = DeviceIndex(self.devices, REAL_DEVICE_INDEXED_FIELDS, "osVersion")
+        return self._index
+
+    def get_token(self) -> str:
+        return encode_cursor({"s": self.snapshot_id, "v": self.version})
+
+    def get_token_version(self, token: str) -> Optional[int]:
+        """
+        Version of a token of this snapshot, None when the token is invalid or from another snapshot.
+        """
+        try:
+            state = decode_cursor(token)
+        except ValueError:
+            return None
+        if not isinstance(state, dict) or state.get("s") != self.snapshot_id:
+            return None
+        return state.get("v")
+
+    def changes_since(self, version: int) -> tuple[List[dict[str, Any]], List[str]]:
+        changed = [self.devices[device_id] for device_id, changed_version in self.changed_at.items()
+                   if changed_version > version]
+        removed = [device_id for device_id, removed_version in self.removed_at.items() if removed_version > version]
+        return changed, removed
+
+    def get_refreshed_at_iso(self) -> Optional[str]:
+        return get_date_time_iso(round(self.refreshed_at_time)) if self.refreshed_at_time else None
+
+
+class DeviceCatalogue:
+    """
+    Indexed catalogue of the real, virtual and desktop devices of a cloud.
+    It's rebuilt only when any of its sources changes (identified by its key).
+    """
+
+    def __init__(self, key: tuple, entries: List[Any]):
+        self.key = key
+        self.entries = entries
+        self.index = DeviceIndex({str(i): entry.model_dump() for i, entry in enumerate(entries)},
+                                 CATALOGUE_INDEXED_FIELDS, "platform_version")
+
+    def search(self, filters: dict[str, Any], min_version: Optional[str] = None,
+               max_version: Optional[str] = None) -> List[Any]:
+        entry_ids = self.index.query(filters, min_version, max_version)
+        # Keep the catalogue order: real, virtual and desktop devices
+        return [self.entries[i] for i in sorted(int(entry_id) for entry_id in entry_ids)]
@@ -1,47 +1,378 @@
+import asyncio
+import logging
+import time
 import traceback
+import weakref
+from collections import deque
 from typing import Optional, Any, Dict
 
 import httpx
 from mcp.server.fastmcp import Context
-from pydantic import Field
+from mcp.server.session import ServerSession
+from pydantic import Field, AnyUrl
 
 from config import perfecto
 from config.perfecto import TOOLS_PREFIX, SUPPORT_MESSAGE
 from config.token import PerfectoToken, token_verify
-from formatters.device import format_real_device, format_virtual_device
-from formatters.grid import format_grid_info
+from formatters.device import format_virtual_device, get_real_device_items, format_real_device_item, \
+    format_desktop_device, format_catalogue_devices
+from formatters.execution import add_device_usage
+from formatters.grid import format_grid_info, format_grid_capacity
+from models.device import RealDeviceChanges, RealDevice, DeviceCandidate, DeviceSelection, RealDeviceInfo, \
+    DesktopDevice
+from models.grid import GridCapacity
 from models.manager import Manager
 from models.result import BaseResult
-from tools.utils import api_request
+from tools.cache_utils import BackgroundPoller, CloudCache
+from tools.device_cache import RealDeviceSnapshot, REAL_DEVICE_INDEXED_FIELDS, REAL_DEVICE_API_FIELDS, parse_version, \
+    DeviceCatalogue, CATALOGUE_INDEXED_FIELDS
+from tools.execution_manager import ExecutionManager
+from tools.utils import api_request, gather_with_concurrency
+
+logger = logging.getLogger(__name__)
+
+REAL_DEVICES_RESOURCE_URI = "perfecto://devices/real"
+REAL_DEVICE_RESOURCE_URI = "perfecto://devices/{device_id}"
 
 
 class DeviceManager(Manager):
+    # Static to share between different instance of DeviceManager
+    real_device_snapshots: dict[str, RealDeviceSnapshot] = {}
+    real_device_poller = BackgroundPoller(interval=30, idle_timeout=600)
+    device_usage_cache = CloudCache(ttl=300, max_age=1800)
+    supported_devices_cache = CloudCache(ttl=3600, max_age=86400)  # Virtual and desktop devices barely change
+    device_catalogues: dict[str, DeviceCatalogue] = {}
+    tenant_cache = CloudCache(ttl=43200, max_age=86400)  # The grid URL and region don't change during a session
+    grid_status_poller = BackgroundPoller(interval=15, idle_timeout=600)
+    grid_statuses: dict[str, dict] = {}  # Latest Selenium Grid Status by cloud
+    grid_capacity_history: dict[str, deque[GridCapacity]] = {}
+    # Subscribed sessions by resource URI, weakly referenced so the closed sessions are dropped with them
+    resource_subscriptions: dict[str, weakref.WeakSet[ServerSession]] = {}
+
     def __init__(self, token: Optional[PerfectoToken], ctx: Context):
         super().__init__(token, ctx)
 
-    @token_verify
-    async def read_selenium_grid_info(self) -> BaseResult:
-        tenant_url = perfecto.get_tenant_management_api_url(self.token.cloud_name)
-        tenant_response = await api_request(self.token, "GET", endpoint=tenant_url, result_formatter=format_grid_info)
+        self.max_concurrency = 8
+        self.selection_weights = {"reliability": 0.5, "idle": 0.3, "fit": 0.2}
+        self.status_fields = ["deviceId", "status", "inUse", "available"]
 
-        if tenant_response.error is None:
-            selenium_grid_url = tenant_response.result[0].selenium_grid_url
-            # Expand the Selenium Grid Status
-            selenium_grid_status_response = await api_request(self.token, "GET", endpoint=f"{selenium_grid_url}/status")
-            tenant_response.result[0].selenium_grid_status = selenium_grid_status_response.result
+    async def _get_tenant(self) -> BaseResult:
+        tenant_url = perfecto.get_tenant_management_api_url(self.token.cloud_name)
+        return await DeviceManager.tenant_cache.get(
+            self.token.cloud_name,
+            lambda: api_request(self.token, "GET", endpoint=tenant_url, result_formatter=format_grid_info)
+        )
 
-        return tenant_response
+    async def _sample_selenium_grid_status(self) -> BaseResult:
+        tenant_result = await self._get_tenant()
+        if tenant_result.error is not None:
+            return tenant_result
+        selenium_grid_url = tenant_result.result[0].selenium_grid_url
+        status_result = await api_request(self.token, "GET", endpoint=f"{selenium_grid_url}/status")
+        if status_result.error is not None:
+            return status_result
+        cloud_name = self.token.cloud_name
+        DeviceManager.grid_statuses[cloud_name] = status_result.result
+        history = DeviceManager.grid_capacity_history.setdefault(cloud_name, deque(maxlen=240))
+        history.append(format_grid_capacity(status_result.result, {"sampled_at": round(time.time())}))
+        return BaseResult(result=status_result.result)
 
     @token_verify
-    async def list_real_devices(self) -> BaseResult:
-        devices_url = perfecto.get_real_device_management_api_url(self.token.cloud_name)
-        # List all devices
-        body = {
-            "device": {
+    async def read_selenium_grid_info(self, history: int = 0) -> BaseResult:
+        cloud_name = self.token.cloud_name
+        tenant_result = await self._get_tenant()
+        if tenant_result.error is not None:
+            return tenant_result
+
+        # The grid status is sampled in background, only the first call waits for it
+        DeviceManager.grid_status_poller.touch(cloud_name, self._sample_selenium_grid_status)
+        warnings = []
+        if cloud_name not in DeviceManager.grid_statuses:
+            status_result = await self._sample_selenium_grid_status()
+            if status_result.error is not None:
+                warnings.append(f"The Selenium Grid Status could not be read: {status_result.error}")
+
+        samples = list(DeviceManager.grid_capacity_history.get(cloud_name, []))
+        grid = tenant_result.result[0].model_copy(update={
+            "selenium_grid_status": DeviceManager.grid_statuses.get(cloud_name, {}),
+            "selenium_grid_capacity": samples[-1] if samples else None,
+            "selenium_grid_capacity_history": samples[-history - 1:-1] if history > 0 else None,
+        })
+        return BaseResult(
+            result=[grid],
+            info=[f"Selenium Grid Status sampled at {samples[-1].sampled_at}, every "
+                  f"{DeviceManager.grid_status_poller.interval} seconds in background"] if samples else None,
+            warning=warnings or None,
+        )
+
+    async def _refresh_real_devices_snapshot(self) -> BaseResult:
+        snapshot = DeviceManager.real_device_snapshots.setdefault(self.token.cloud_name, RealDeviceSnapshot())
+        async with snapshot.lock:
+            if not snapshot.is_stale(1):  # Refreshed by another caller while waiting for the lock
+                return BaseResult(result=snapshot)
+            devices_url = perfecto.get_real_device_management_api_url(self.token.cloud_name)
+            # List all devices
+            body = {
+                "device": {
+                }
             }
-        }
-        return await api_request(self.token, "POST", endpoint=devices_url, json=body,
-                                 result_formatter=format_real_device)
+            devices_result = await api_request(self.token, "POST", endpoint=devices_url, json=body,
+                                               result_formatter=get_real_device_items)
+            if devices_result.error is not None:
+                return devices_result
+            changed = snapshot.update(devices_result.result)
+        if len(changed) > 0:
+            await self._notify_real_devices_updated(changed)
+        return BaseResult(result=snapshot)
+
+    async def _poll_real_devices_snapshot(self):
+        if self.has_resource_subscriptions():  # Subscribed clients keep the background refresh alive
+            DeviceManager.real_device_poller.touch(self.token.cloud_name, self._poll_real_devices_snapshot)
+        await self._refresh_real_devices_snapshot()
+
+    async def _notify_real_devices_updated(self, device_ids: list[str]):
+        uris = [REAL_DEVICES_RESOURCE_URI] + [REAL_DEVICE_RESOURCE_URI.format(device_id=device_id)
+                                              for device_id in device_ids]
+        for uri in uris:
+            for session in list(DeviceManager.resource_subscriptions.get(uri, ())):
+                try:
+                    await session.send_resource_updated(AnyUrl(uri))
+                except Exception:
+                    logger.debug(f"Resource updated notification of {uri} failed, unsubscribing", exc_info=True)
+                    self.unsubscribe_resource(uri, session)
+
+    @token_verify
+    def subscribe_resource(self, uri: str, session: ServerSession):
+        DeviceManager.resource_subscriptions.setdefault(uri, weakref.WeakSet()).add(session)
+        DeviceManager.real_device_poller.touch(self.token.cloud_name, self._poll_real_devices_snapshot)
+
+    @staticmethod
+    def unsubscribe_resource(uri: str, session: ServerSession):
+        sessions = DeviceManager.resource_subscriptions.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if len(sessions) == 0:
+                del DeviceManager.resource_subscriptions[uri]
+
+    @staticmethod
+    def has_resource_subscriptions() -> bool:
+        # The URIs whose sessions were all closed are removed
+        for uri, sessions in list(DeviceManager.resource_subscriptions.items()):
+            if len(sessions) == 0:
+                del DeviceManager.resource_subscriptions[uri]
+        return len(DeviceManager.resource_subscriptions) > 0
+
+    @token_verify
+    async def get_real_devices_snapshot(self) -> BaseResult:
+        """
+        Real devices inventory served from memory, refreshed in background while it keeps being used.
+        """
+        cloud_name = self.token.cloud_name
+        snapshot = DeviceManager.real_device_snapshots.setdefault(cloud_name, RealDeviceSnapshot())
+        poller = DeviceManager.real_device_poller
+        poller.touch(cloud_name, self._poll_real_devices_snapshot)
+        if snapshot.is_stale(poller.interval * 2):  # Never loaded, or the background refresh was stopped
+            return await self._refresh_real_devices_snapshot()
+        return BaseResult(result=snapshot)
+
+    @token_verify
+    async def list_real_devices(self, since: Optional[str] = None) -> BaseResult:
+        snapshot_result = await self.get_real_devices_snapshot()
+        if snapshot_result.error is not None:
+            return snapshot_result
+        snapshot = snapshot_result.result
+
+        if since:
+            since_version = snapshot.get_token_version(since)
+            if since_version is not None:
+                changed, removed = snapshot.changes_since(since_version)
+                return BaseResult(
+                    result=RealDeviceChanges(
+                        devices=[format_real_device_item(d, {"include_available": True}) for d in changed],
+                        removed_device_ids=removed,
+                        since=snapshot.get_token(),
+                        refreshed_at=snapshot.get_refreshed_at_iso(),
+                    )
+                )
+            warning = ["The since token has expired, the complete list of available devices is returned"]
+        else:
+            warning = None
+
+        return BaseResult(
+            result=[format_real_device_item(d) for d in snapshot.devices.values() if d.get("available") == "true"],
+            info=[f"Inventory refreshed at {snapshot.get_refreshed_at_iso()}, use since='{snapshot.get_token()}' "
+                  f"to get only the devices changed after this list"],
+            warning=warning,
+        )
+
+    @token_verify
+    async def find_devices(self, args: dict[str, Any]) -> BaseResult:
+        snapshot_result = await self.get_real_devices_snapshot()
+        if snapshot_result.error is not None:
+            return snapshot_result
+        snapshot = snapshot_result.result
+        device_ids = self._match_real_devices(snapshot, args)
+
+        sort_by = args.get("sort_by", "device_id")
+        sort_field = sort_by.lstrip("-")
+        if sort_field not in REAL_DEVICE_API_FIELDS:
+            return BaseResult(
+                error=f"Invalid sort_by value {sort_by}, valid values: {', '.join(REAL_DEVICE_API_FIELDS.keys())}"
+            )
+        # Sorted over the API attributes, only the returned devices are formatted
+        api_field = REAL_DEVICE_API_FIELDS[sort_field]
+        items = [snapshot.devices[device_id] for device_id in device_ids]
+        if sort_field == "platform_version":
+            items.sort(key=lambda d: (parse_version(d.get(api_field)), d.get("deviceId")),
+                       reverse=sort_by.startswith("-"))
+        else:
+            items.sort(key=lambda d: (str(d.get(api_field) or "").casefold(), d.get("deviceId")),
+                       reverse=sort_by.startswith("-"))
+
+        limit = args.get("limit", 50)
+        fields = args.get("fields")
+        invalid_fields = [field for field in fields or [] if field not in RealDevice.model_fields]
+        if len(invalid_fields) > 0:
+            return BaseResult(
+                error=f"Invalid fields {', '.join(invalid_fields)}, valid values: "
+                      f"{', '.join(RealDevice.model_fields.keys())}"
+            )
+        devices = [format_real_device_item(item, {"include_available": True}) for item in items[:limit]]
+        result = [device.model_dump(include=set(fields)) if fields else device for device in devices]
+        return BaseResult(
+            result=result,
+            info=[f"{len(items)} devices matched, {len(result)} returned"],
+        )
+
+    def _match_real_devices(self, snapshot: RealDeviceSnapshot, args: dict[str, Any]) -> set[str]:
+        filters = {field: args[field] for field in REAL_DEVICE_INDEXED_FIELDS.keys() if args.get(field) is not None}
+        if not args.get("include_unavailable", False):
+            filters.setdefault("available", "true")
+        return snapshot.get_index().query(filters, args.get("min_version"), args.get("max_version"))
+
+    async def _get_device_usage(self, time_frame: str) -> BaseResult:
+        """
+        Runs, failures and latest run by device of the executions in the time frame, cached by cloud.
+        """
+        max_executions = 2000
+
+        async def load() -> BaseResult:
+            execution_manager = ExecutionManager(self.token, self.ctx)
+            devices_usage = {}
+            async for page in execution_manager.iter_report_executions({"time_frame": time_frame}, max_executions):
+                if page.error is not None:
+                    return page
+                add_device_usage(devices_usage, page.result)
+            return BaseResult(result=devices_usage)
+
+        return await DeviceManager.device_usage_cache.get(f"{self.token.cloud_name}:{time_frame}", load)
+
+    def _score_device_candidates(self, items: list[dict[str, Any]],
+                                 devices_usage: dict[str, dict[str, Any]]) -> list[DeviceCandidate]:
+        weights = self.selection_weights
+        now = time.time() * 1000
+        # Best fit: the lowest platform versions meeting the requirements first, leaving the newer devices free
+        versions = sorted({parse_version(item.get("osVersion")) for item in items})
+        version_rank = {version: i for i, version in enumerate(versions)}
+        candidates = []
+        for item in items:
+            usage = devices_usage.get(item.get("deviceId"), {})
+            runs = usage.get("runs", 0)
+            # Laplace smoothing, so a single failed run doesn't discard a device
+            failure_rate = (usage.get("failures", 0) + 1) / (runs + 2)
+            last_run = usage.get("last_run")
+            idle_hours = (now - last_run) / 1000 / 3600 if last_run is not None else None
+            idle = min(idle_hours / 24, 1.0) if idle_hours is not None else 1.0
+            fit = 1 - version_rank[parse_version(item.get("osVersion"))] / max(len(versions) - 1, 1)
+            score = weights["reliability"] * (1 - failure_rate) + weights["idle"] * idle + weights["fit"] * fit
+            candidates.append(DeviceCandidate(
+                device=format_real_device_item(item),
+                score=round(score, 3),
+                fit=round(fit, 3),
+                failure_rate=round(failure_rate, 3),
+                runs=runs,
+                idle_hours=round(idle_hours, 2) if idle_hours is not None else None,
+                verified=False,
+            ))
+        candidates.sort(key=lambda c: (-c.score, c.device.device_id))
+        return candidates
+
+    @token_verify
+    async def select_device(self, args: dict[str, Any]) -> BaseResult:
+        count = args.get("count", 1)
+        snapshot_result = await self.get_real_devices_snapshot()
+        if snapshot_result.error is not None:
+            return snapshot_result
+        snapshot = snapshot_result.result
+
+        requirements = {field: args[field] for field in ["platform_name", "manufacturer", "model", "location",
+                                                         "min_version", "max_version"] if args.get(field) is not None}
+        device_ids = self._match_real_devices(snapshot, {**requirements, "in_use": "false"})
+        items = [snapshot.devices[device_id] for device_id in device_ids]
+        if len(items) == 0:
+            return BaseResult(
+                error=f"No free device meets the requirements {requirements}, use find_devices with "
+                      f"include_unavailable=true to review the matching devices"
+            )
+
+        warnings = []
+        usage_result = await self._get_device_usage(args.get("time_frame", "last24"))
+        if usage_result.error is None:
+            devices_usage = usage_result.result
+        else:
+            devices_usage = {}
+            warnings.append(f"The execution history could not be read, devices scored only by fit: "
+                            f"{usage_result.error}")
+        candidates = self._score_device_candidates(items, devices_usage)
+
+        # Verify the top candidates with the live device information, the inventory can be 30 seconds old
+        allocation = []
+        rejected = []
+        verify_count = args.get("verify_count", max(count, min(count * 3, 10)))
+        to_verify = candidates[:verify_count]
+        results = await gather_with_concurrency(
+            self.max_concurrency, (self.read_real_device_info(c.device.device_id) for c in to_verify)
+        )
+        for candidate, result in zip(to_verify, results):
+            if isinstance(result, BaseException) or result.error is not None or not isinstance(result.result, dict):
+                warnings.append(f"Device {candidate.device.device_id} could not be verified")
+                continue
+            if result.result.get("inUse", "false") != "false" or result.result.get("available", "true") != "true":
+                rejected.append(candidate.device.device_id)
+                continue
+            candidate.verified = True
+            allocation.append(candidate)
+            if len(allocation) == count:
+                break
+        if len(allocation) < count:
+            warnings.append(f"Only {len(allocation)} of {count} devices were verified as free")
+
+        return BaseResult(
+            result=DeviceSelection(
+                allocation=allocation,
+                rejected_device_ids=rejected,
+                candidates=len(candidates),
+            ),
+            warning=warnings or None,
+        )
+
+    @token_verify
+    async def read_real_devices_resource(self) -> list[RealDevice]:
+        snapshot_result = await self.get_real_devices_snapshot()
+        if snapshot_result.error is not None:
+            raise ValueError(snapshot_result.error)
+        snapshot = snapshot_result.result
+        return [format_real_device_item(d, {"include_available": True}) for d in snapshot.devices.values()]
+
+    @token_verify
+    async def read_real_device_resource(self, device_id: str) -> RealDevice:
+        snapshot_result = await self.get_real_devices_snapshot()
+        if snapshot_result.error is not None:
+            raise ValueError(snapshot_result.error)
+        device = snapshot_result.result.devices.get(device_id)
+        if device is None:
+            raise ValueError(f"Device {device_id} not found in the real devices inventory")
+        return format_real_device_item(device, {"include_available": True})
 
     @token_verify
     async def read_real_device_info(self, device_id: str) -> BaseResult:
@@ -49,15 +380,107 @@ class DeviceManager(Manager):
         devices_url = f"{devices_url}/{device_id}"
         return await api_request(self.token, "GET", endpoint=devices_url)
 
+    @token_verify
+    async def read_real_devices_info(self, device_id_list: list[str], status_only: bool = False) -> BaseResult:
+        if len(device_id_list) == 0:
+            return BaseResult(
+                warning=["No list of device IDs to be read was indicated."]
+            )
+        device_id_list = list(dict.fromkeys(device_id_list))
+        results = await gather_with_concurrency(
+            self.max_concurrency, (self.read_real_device_info(device_id) for device_id in device_id_list)
+        )
+
+        devices = []
+        for device_id, result in zip(device_id_list, results):
+            if isinstance(result, BaseException):
+                devices.append(RealDeviceInfo(device_id=device_id, error=f"Error: {result!r}"))
+                continue
+            info = result.result
+            if status_only and isinstance(info, dict):
+                info = {field: info.get(field) for field in self.status_fields}
+            devices.append(RealDeviceInfo(device_id=device_id, result=info, error=result.error))
+        errors = sum(1 for device in devices if device.error is not None)
+        return BaseResult(
+            result=devices,
+            info=[f"{len(devices) - errors} of {len(devices)} devices read"],
+        )
+
     @token_verify
     async def list_virtual_devices(self) -> BaseResult:
         virtual_device_url = perfecto.get_virtual_device_management_api_url(self.token.cloud_name)
-        return await api_request(self.token, "GET", endpoint=virtual_device_url, result_formatter=format_virtual_device)
+        return await DeviceManager.supported_devices_cache.get(
+            f"{self.token.cloud_name}:virtual",
+            lambda: api_request(self.token, "GET", endpoint=virtual_device_url, result_formatter=format_virtual_device)
+        )
 
     @token_verify
     async def list_desktop_devices(self) -> BaseResult:
         virtual_web_url = perfecto.get_web_desktop_management_api_url(self.token.cloud_name)
-        return await api_request(self.token, "GET", endpoint=virtual_web_url)
+        return await DeviceManager.supported_devices_cache.get(
+            f"{self.token.cloud_name}:desktop",
+            lambda: api_request(self.token, "GET", endpoint=virtual_web_url, result_formatter=format_desktop_device)
+        )
+
+    @token_verify
+    async def get_device_catalogue(self) -> BaseResult:
+        snapshot_result, virtual_result, desktop_result = [
+            BaseResult(error=f"Error: {result!r}") if isinstance(result, BaseException) else result
+            for result in await asyncio.gather(
+                self.get_real_devices_snapshot(), self.list_virtual_devices(), self.list_desktop_devices(),
+                return_exceptions=True
+            )
+        ]
+        if snapshot_result.error is not None:
+            return snapshot_result
+        snapshot = snapshot_result.result
+        warnings = [f"The {device_type} devices could not be read: {result.error}"
+                    for device_type, result in [("virtual", virtual_result), ("desktop", desktop_result)]
+                    if result.error is not None]
+
+        desktop_devices = desktop_result.result or []
+        if not all(isinstance(d, DesktopDevice) for d in desktop_devices):
+            desktop_devices = []
+            warnings.append("The desktop devices have an unknown format, use list_desktop_devices to review them")
+
+        cloud_name = self.token.cloud_name
+        # Rebuilt only when any of the sources was reloaded
+        key = (snapshot.snapshot_id, snapshot.version,
+               DeviceManager.supported_devices_cache.get_version(f"{cloud_name}:virtual"),
+               DeviceManager.supported_devices_cache.get_version(f"{cloud_name}:desktop"))
+        catalogue = DeviceManager.device_catalogues.get(cloud_name)
+        if catalogue is None or catalogue.key != key:
+            real_devices = [format_real_device_item(d, {"include_available": True}) for d in snapshot.devices.values()]
+            catalogue = DeviceCatalogue(key, format_catalogue_devices(real_devices, virtual_result.result or [],
+                                                                      desktop_devices))
+            DeviceManager.device_catalogues[cloud_name] = catalogue
+        return BaseResult(
+            result=catalogue,
+            warning=warnings or None,
+        )
+
+    @token_verify
+    async def search_device_catalogue(self, args: dict[str, Any]) -> BaseResult:
+        catalogue_result = await self.get_device_catalogue()
+        if catalogue_result.error is not None:
+            return catalogue_result
+        catalogue = catalogue_result.result
+
+        filters = {field: args[field] for field in CATALOGUE_INDEXED_FIELDS.keys() if args.get(field) is not None}
+        if not args.get("include_unavailable", False):
+            # Virtual and desktop devices have no availability, they're started on demand
+            filters.setdefault("available", ["true", ""])
+        entries = catalogue.search(filters, args.get("min_version"), args.get("max_version"))
+        limit = args.get("limit", 50)
+        counts = {}
+        for entry in entries:
+            counts[entry.device_type] = counts.get(entry.device_type, 0) + 1
+        counts_str = ", ".join(f"{count} {device_type}" for device_type, count in counts.items())
+        return BaseResult(
+            result=entries[:limit],
+            info=[f"{len(entries)} devices matched ({counts_str or 'none'}), {min(len(entries), limit)} returned"],
+            warning=catalogue_result.warning,
+        )
 
 
 def register(mcp, token: Optional[PerfectoToken]):
@@ -66,13 +489,58 @@ def register(mcp, token: Optional[PerfectoToken]):
         description="""
 Operations on Perfecto devices information.
 Actions:
-- read_selenium_grid_info: Read the main Selenium Grid information like the Selenium Grid URL (for Selenium or Appium).
+- read_selenium_grid_info: Read the main Selenium Grid information like the Selenium Grid URL (for Selenium or Appium),
+    the Selenium Grid Status and its capacity (total, busy and free slots by browser and queue length).
+    The status is sampled in background every 15 seconds.
+    args(dict): Dictionary with the following optional parameters:
+        history (int, default=0): Also return the capacity of up to this number of previous samples 
+            (to review the saturation trend).
 - list_real_devices: List all real available devices (iOS and Android devices, Mobile and Tablet).
+    The inventory is served from memory and refreshed in background every 30 seconds.
+    args(dict): Dictionary with the following optional parameters:
+        since (str): The token from the info of a previous list_real_devices result, returns only the devices 
+            added, removed or with status, in use or availability changed after it (and a new since token).
+- find_devices: Find real devices with compound filters over the in memory inventory (all the filters must match).
+    args(dict): Dictionary with the following optional parameters:
+        platform_name, manufacturer, model, location, status, in_use (str or list[str]): Values to match 
+            (case-insensitive, any value of a list, supports * wildcards, e.g. model='iPhone 1*').
+        min_version (str): The minimum platform version (semantic comparison, e.g. '16.4').
+        max_version (str): The maximum platform version (inclusive, '17' includes '17.4.1').
+        include_unavailable (bool, default=False): Include the devices that are not available.
+        sort_by (str, default='device_id'): The attribute to sort by, prefix with '-' for descending order (e.g. '-platform_version').
+        limit (int, default=50): The maximum number of devices to return.
+        fields (list[str]): Only return these attributes of each device (e.g. ['device_id', 'model', 'in_use']).
+- select_device: Select the best free real devices for a test, scored by fit (the lowest platform version meeting 
+    the requirements first), recent failure rate and idle time, and verified with the live device information.
+    args(dict): Dictionary with the following optional parameters:
+        platform_name, manufacturer, model, location (str or list[str]): Required values (same matching as find_devices).
+        min_version (str): The minimum platform version (semantic comparison, e.g. '16.4').
+        max_version (str): The maximum platform version (inclusive).
+        count (int, default=1): The number of devices to allocate.
+        time_frame (str, default='last24'): The execution history used for the failure rate and idle time, 
+            one of latest, last24, lastWeek or lastMonth.
+        verify_count (int, default=max(count, min(count*3, 10))): The number of top candidates verified concurrently.
 - read_real_device_info: Read the real device information.
-    args(dict): Dictionary with the following required parameters:
+    args(dict): Dictionary with the following parameters:
         device_id (str): The device Id to show detailed information.
+        device_id_list (list[str]): Read several devices concurrently instead of a single device_id 
+            (each device has its own result or error).
+        status_only (bool, default=False): With device_id_list, only return the device ID, status, 
+            in use and availability of each device (for health checks of a device pool).
 - list_virtual_devices: List all available virtual devices (iOS Simulators and Android Emulators).
 - list_desktop_devices: List all desktop browser devices (Desktop Web Browsers).
+- search_device_catalogue: Search a single catalogue of real, virtual and desktop devices with a common schema,
+    with an entry by real device, by virtual device version and by desktop browser version and location. 
+    Each entry includes the Appium/Selenium capabilities and the device_under_test for AI Scriptless execute_test.
+    args(dict): Dictionary with the following optional parameters:
+        device_type (str or list[str], values=['real', 'virtual', 'desktop']): The device types.
+        platform_name, manufacturer, model, browser_name, browser_version, location (str or list[str]): Values to 
+            match (case-insensitive, any value of a list, supports * wildcards, e.g. browser_name='chrome').
+        available, in_use (bool): Match only real devices with this availability or use.
+        min_version (str): The minimum platform version (semantic comparison, e.g. '16.4').
+        max_version (str): The maximum platform version (inclusive, '17' includes '17.4.1').
+        include_unavailable (bool, default=False): Include the real devices that are not available.
+        limit (int, default=50): The maximum number of devices to return.
 """
     )
     async def devices(
@@ -86,15 +554,24 @@ Actions:
         try:
             match action:
                 case "read_selenium_grid_info":
-                    return await device_manager.read_selenium_grid_info()
+                    return await device_manager.read_selenium_grid_info(args.get("history", 0))
                 case "list_real_devices":
-                    return await device_manager.list_real_devices()
+                    return await device_manager.list_real_devices(args.get("since"))
+                case "find_devices":
+                    return await device_manager.find_devices(args)
+                case "select_device":
+                    return await device_manager.select_device(args)
                 case "read_real_device_info":
+                    if "device_id_list" in args:
+                        return await device_manager.read_real_devices_info(args["device_id_list"],
+                                                                           args.get("status_only", False))
                     return await device_manager.read_real_device_info(args["device_id"])
                 case "list_virtual_devices":
                     return await device_manager.list_virtual_devices()
                 case "list_desktop_devices":
                     return await device_manager.list_desktop_devices()
+                case "search_device_catalogue":
+                    return await device_manager.search_device_catalogue(args)
                 case _:
                     return BaseResult(
                         error=f"Action {action} not found in device manager tool"
@@ -107,3 +584,31 @@ Actions:
             return BaseResult(
                 error=f"Error: {traceback.format_exc()}\n{SUPPORT_MESSAGE}"
             )
+
+    @mcp.resource(
+        REAL_DEVICES_RESOURCE_URI,
+        name="real_devices",
+        description="All the real devices with their status, in use and availability, served from the in memory "
+                    "inventory. Subscribe to be notified when any device changes.",
+        mime_type="application/json",
+    )
+    async def real_devices_resource() -> list[RealDevice]:
+        return await DeviceManager(token, None).read_real_devices_resource()
+
+    @mcp.resource(
+        REAL_DEVICE_RESOURCE_URI,
+        name="real_device",
+        description="A real device with its status, in use and availability, served from the in memory inventory. "
+                    "Subscribe to be notified when the device changes (e.g. when it becomes free).",
+        mime_type="application/json",
+    )
+    async def real_device_resource(device_id: str) -> RealDevice:
+        return await DeviceManager(token, None).read_real_device_resource(device_id)
+
+    @mcp._mcp_server.subscribe_resource()
+    async def subscribe_resource(uri: AnyUrl):
+        DeviceManager(token, None).subscribe_resource(str(uri), mcp.get_context().session)
+
+    @mcp._mcp_server.unsubscribe_resource()
+    async def unsubscribe_resource(uri: AnyUrl):
+        DeviceManager.unsubscribe_resource(str(uri), mcp.get_context().session)
@@ -1,6 +1,12 @@
+import asyncio
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
 import traceback
 from datetime import datetime, timedelta
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Callable, AsyncIterator
 
 import httpx
 from mcp.server.fastmcp import Context
@@ -9,16 +15,33 @@ from pydantic import Field
 from config import perfecto
 from config.perfecto import TOOLS_PREFIX, SUPPORT_MESSAGE
 from config.token import PerfectoToken, token_verify
-from formatters.execution import format_executions
+from formatters.execution import format_executions, format_failure_clusters, get_failure_message, \
+    get_executions_total, format_export_execution_rows, EXPORT_EXECUTION_COLUMNS, \
+    format_live_executions, format_live_execution_changes, format_live_execution_change_message, \
+    format_execution_commands_summary, format_execution_commands, is_failed_status, format_execution_trends, \
+    add_device_usage, format_device_utilization, format_job_summary, format_execution_comparison, \
+    get_execution_timing, get_timestamp, format_scriptless_run_summary
+from models.execution import LiveExecutionWatchSummary, ExecutionReport, ExecutionExport, LiveExecution, \
+    LiveExecutionStop, TrackedExecution, ExecutionWaitSummary, Execution, ExecutionPlatform
 from models.manager import Manager
 from models.result import BaseResult, PaginationResult
-from tools.utils import api_request
+from tools.cache_utils import CloudCache
+from tools.export_utils import open_rows_writer, EXPORT_FORMATS
+from tools.text_utils import cluster_messages, resolve_value
+from tools.utils import api_request, gather_with_concurrency, encode_cursor, decode_cursor, AdaptivePolling
 
 
 class ExecutionManager(Manager):
+    metadata_cache = CloudCache(ttl=300, max_age=3600)  # Static to share between different instance of ExecutionManager
+    live_executions_cache = CloudCache(ttl=2, max_age=2)  # A single live search for all the concurrent waits
+
     def __init__(self, token: Optional[PerfectoToken], ctx: Context):
         super().__init__(token, ctx)
 
+        self.max_concurrency = 8
+        self.max_cursor_reads = 20
+        self.stop_batch_size = 50
+        self.stop_predicates = ["owner", "job_name", "device_id", "test_name_pattern"]
         self.metadata_map = {
             "tag_list": "tags_v2",
             "device_id_list": "devices_v2",
@@ -35,6 +58,8 @@ class ExecutionManager(Manager):
         self.metadata_in_root = [
             "failureReasons"
         ]
+        # Identifiers and numbers are never replaced by similar values, only matched exactly or case-insensitively
+        self.exact_filters = ["device_id_list", "job_number_list", "os_version_list", "failure_reason_list"]
         self.filter_map = {
             "tag_list": "tags",
             "device_id_list": "deviceId",
@@ -55,6 +80,324 @@ class ExecutionManager(Manager):
         execution_management_url = execution_management_url + "/search"
         return await api_request(self.token, "POST", endpoint=execution_management_url)
 
+    async def _search_live_executions(self) -> BaseResult:
+        execution_management_url = perfecto.get_execution_management_api_url(self.token.cloud_name)
+        execution_management_url = execution_management_url + "/search"
+        return await api_request(self.token, "POST", endpoint=execution_management_url,
+                                 result_formatter=format_live_executions)
+
+    @token_verify
+    async def watch_live_executions(self, args: dict[str, Any]) -> BaseResult:
+        duration = min(float(args.get("duration", 60)), 600.0)
+        stop_when_empty = args.get("stop_when_empty", False)
+
+        polling = AdaptivePolling(duration)
+        previous = None
+        initial_count = 0
+        changes = []
+        polls = 0
+        while True:
+            live_result = await self._search_live_executions()
+            if live_result.error is not None:
+                return live_result
+            polls += 1
+            elapsed = round(polling.elapsed, 1)
+            current = {execution.execution_id: execution for execution in live_result.result}
+
+            poll_changes = []
+            if previous is None:
+                initial_count = len(current)
+                await self.ctx.report_progress(elapsed, duration, f"{initial_count} live executions")
+            else:
+                poll_changes = format_live_execution_changes(previous, current, elapsed)
+                if len(poll_changes) > 0:
+                    changes.extend(poll_changes)
+                    await self.ctx.report_progress(elapsed, duration,
+                                                   format_live_execution_change_message(poll_changes))
+            previous = current
+
+            if stop_when_empty and len(current) == 0:
+                break
+            if not await polling.wait_next(len(poll_changes) > 0):
+                break
+
+        summary = LiveExecutionWatchSummary(
+            duration=round(polling.elapsed, 1),
+            polls=polls,
+            initial_count=initial_count,
+            final_count=len(previous),
+            started=sum(1 for change in changes if change.change == "started"),
+            finished=sum(1 for change in changes if change.change == "finished"),
+            status_changed=sum(1 for change in changes if change.change == "status_changed"),
+            changes=changes,
+        )
+        return BaseResult(
+            result=summary,
+        )
+
+    async def _get_live_executions(self) -> BaseResult:
+        return await ExecutionManager.live_executions_cache.get(self.token.cloud_name, self._search_live_executions)
+
+    @staticmethod
+    def _decode_execution_handles(handles: list[str], state: str) -> BaseResult:
+        """
+        The tracked executions of the handles returned by the AI Scriptless executions, each one with its handle state.
+        """
+        tracked_executions = []
+        for handle in handles:
+            try:
+                handle_state = decode_cursor(handle) if isinstance(handle, str) else None
+            except ValueError:
+                handle_state = None
+            if not isinstance(handle_state, dict) or (handle_state.get("e") is None and handle_state.get("t") is None):
+                return BaseResult(
+                    error=f"Invalid execution handle {handle}, use the handle returned by execute_test"
+                )
+            tracked_executions.append((TrackedExecution(handle=handle, test_name=handle_state.get("t"),
+                                                        device_id=handle_state.get("d"), state=state,
+                                                        execution_id=handle_state.get("e")), handle_state))
+        return BaseResult(
+            result=tracked_executions,
+        )
+
+    @staticmethod
+    def _match_version(expected: str, version: Optional[str]) -> bool:
+        # 17 matches 17.0 and 17.0.1, and a version like latest or beta matches any version
+        if not version or not expected[:1].isdigit():
+            return True
+        return version == expected or version.startswith(expected + ".") or expected.startswith(version + ".")
+
+    @staticmethod
+    def _match_platform(platform: dict[str, Any], platforms: list[ExecutionPlatform]) -> bool:
+        """
+        Whether any of the platforms of a report execution is the virtual or desktop device of the handle.
+        """
+        def normalize(value: Any) -> str:
+            return "".join(c for c in str(value).casefold() if c.isalnum())
+
+        for execution_platform in platforms:
+            if "m" in platform and normalize(platform["m"]) != normalize(execution_platform.model or ""):
+                continue
+            if "v" in platform and not ExecutionManager._match_version(platform["v"], execution_platform.os_version):
+                continue
+            browser = execution_platform.browser or {}
+            browser_name = browser.get("browserType") or browser.get("browserName")
+            if "b" in platform and browser_name and normalize(platform["b"]) != normalize(browser_name):
+                continue
+            if "bv" in platform and not ExecutionManager._match_version(platform["bv"],
+                                                                         browser.get("browserVersion")):
+                continue
+            return True
+        return False
+
+    @staticmethod
+    def _match_tracked_execution(tracked: TrackedExecution, handle: dict[str, Any], execution_id: Optional[str],
+                                 name: Optional[str], device_ids: list[str], start_time: Optional[float],
+                                 platforms: Optional[list[ExecutionPlatform]] = None) -> bool:
+        """
+        Whether an execution is the tracked one, by execution ID or by test name, device and start time.
+        The model or browser of the virtual and desktop devices is only known by the report executions (platforms),
+        the live executions only have the device IDs.
+        """
+        if handle.get("e") is not None and handle["e"] == execution_id:
+            return True
+        if tracked.test_name is None or name is None or tracked.test_name.casefold() != name.casefold():
+            return False
+        if tracked.device_id is not None and tracked.device_id not in device_ids:
+            return False
+        if isinstance(handle.get("p"), dict) and platforms is not None and \
+                not ExecutionManager._match_platform(handle["p"], platforms):
+            return False
+        # Started after the submission (with a margin for clock differences)
+        return start_time is None or handle.get("s") is None or start_time >= handle["s"] - 60
+
+    async def _resolve_tracked_reports(self, tracked_executions: list[tuple[TrackedExecution, dict[str, Any]]],
+                                       claimed: set[str]) -> list[Optional[Execution]]:
+        """
+        Complete the tracked executions with their report execution, with one search by test name.
+        Returns the report execution of each tracked execution (None when not found yet).
+        """
+        test_names = list(dict.fromkeys(tracked.test_name for tracked, _ in tracked_executions if tracked.test_name))
+        results = await gather_with_concurrency(
+            self.max_concurrency,
+            (self._read_report_executions_page({"report_name": test_name, "time_frame": "last24"}, 50)
+             for test_name in test_names)
+        )
+        reports: list[Execution] = []
+        for result in results:
+            if not isinstance(result, BaseException) and result.error is None:
+                reports.extend(result.result.items)
+        matched_reports = []
+        for tracked, handle in tracked_executions:
+            matched_reports.append(None)
+            for report in reports:
+                if report.test_id in claimed:
+                    continue
+                start_time, duration = get_execution_timing(report)
+                device_ids = [platform.device_id for platform in report.platforms if platform.device_id]
+                if self._match_tracked_execution(tracked, handle, report.execution_id, report.test_name, device_ids,
+                                                 start_time, report.platforms):
+                    claimed.add(report.test_id)
+                    tracked.state = "finished"
+                    tracked.execution_id = report.execution_id
+                    tracked.status = report.status
+                    tracked.execution_url = report.execution_url
+                    tracked.duration = round(duration, 1) if duration is not None else None
+                    tracked.failure_reason = get_failure_message(report) if is_failed_status(report.status) else None
+                    matched_reports[-1] = report
+                    break
+        return matched_reports
+
+    @token_verify
+    async def wait_for_executions(self, args: dict[str, Any]) -> BaseResult:
+        handles = args.get("handles") or []
+        handles = [handles] if isinstance(handles, str) else handles
+        if len(handles) == 0:
+            return BaseResult(
+                warning=["No list of execution handles to wait for was indicated."]
+            )
+        try:
+            timeout = min(max(float(args.get("timeout", 600)), 0.0), 1800.0)
+        except (TypeError, ValueError):
+            return BaseResult(
+                error=f"Invalid value for timeout: {args.get('timeout')!r}, it must be a number of seconds."
+            )
+
+        handles_result = self._decode_execution_handles(handles, "queued")
+        if handles_result.error is not None:
+            return handles_result
+        tracked_executions = handles_result.result
+
+        polling = AdaptivePolling(timeout)
+        polls = 0
+        live_ids: list[Optional[str]] = [None] * len(tracked_executions)  # Live execution of each tracked execution
+        report_claimed = set()
+        while True:
+            live_result = await self._get_live_executions()
+            if live_result.error is not None:
+                return live_result
+            polls += 1
+            live = {execution.execution_id: execution for execution in live_result.result}
+            messages = []
+            to_resolve = []
+            for i, (tracked, handle) in enumerate(tracked_executions):
+                if tracked.status is not None:
+                    continue
+                live_id = live_ids[i]
+                if live_id is None:
+                    live_id = next((execution.execution_id for execution in live.values()
+                                    if execution.execution_id not in live_ids and
+                                    self._match_tracked_execution(tracked, handle, execution.execution_id,
+                                                                  execution.name, execution.device_ids,
+                                                                  get_timestamp(execution.start_time))), None)
+                    live_ids[i] = live_id
+                if live_id is not None and live_id in live:
+                    if tracked.test_name is None:
+                        # Handle without test name, the report is searched with the name of the live execution
+                        tracked.test_name = live[live_id].name
+                    if tracked.state != "running" or tracked.live_status != live[live_id].status:
+                        messages.append(f"{tracked.test_name or live_id} on {tracked.device_id or 'device'}: "
+                                        f"{live[live_id].status}")
+                    tracked.state = "running"
+                    tracked.live_status = live[live_id].status
+                elif live_id is not None or polling.idle:
+                    # Finished, or never seen while queued (it could have finished between polls)
+                    if live_id is not None:
+                        tracked.state = "finished"
+                    to_resolve.append((tracked, handle))
+            if len(to_resolve) > 0:
+                await self._resolve_tracked_reports(to_resolve, report_claimed)
+                messages.extend(f"{tracked.test_name} on {tracked.device_id or 'device'}: finished {tracked.status}"
+                                for tracked, _ in to_resolve if tracked.status is not None)
+
+            finished = sum(1 for tracked, _ in tracked_executions if tracked.status is not None)
+            # Without test name the report can't be searched, they aren't waited for once the polls back off
+            unresolvable = sum(1 for i, (tracked, _) in enumerate(tracked_executions)
+                               if tracked.status is None and tracked.test_name is None and live_ids[i] not in live
+                               and polling.idle)
+            if len(messages) > 0:
+                await self.ctx.report_progress(finished, len(tracked_executions), "; ".join(messages))
+            if finished + unresolvable == len(tracked_executions) or not await polling.wait_next(len(messages) > 0):
+                break
+
+        executions = [tracked for tracked, _ in tracked_executions]
+        pending = len(executions) - finished
+        result = BaseResult(
+            result=ExecutionWaitSummary(
+                duration=round(polling.elapsed, 1),
+                polls=polls,
+                finished=finished,
+                pending=pending,
+                executions=executions,
+            ),
+            warning=[f"{pending} executions did not finish before the timeout of {timeout} seconds, "
+                     f"call wait_for_executions again with their handles"] if pending > unresolvable else None,
+        )
+        if unresolvable > 0:
+            result.append_warnings([f"{unresolvable} executions have a handle without test name and were not seen "
+                                    f"running, their reports can't be found. Review them with list_live_executions "
+                                    f"or list_report_executions"])
+        return result
+
+    @token_verify
+    async def scriptless_run_summary(self, args: dict[str, Any]) -> BaseResult:
+        handles = args.get("handles") or []
+        handles = [handles] if isinstance(handles, str) else handles
+        test_names = args.get("test_name", [])
+        test_names = [test_names] if isinstance(test_names, str) else test_names
+        max_executions = args.get("max_executions", 500)
+        warnings = []
+
+        if len(handles) > 0:
+            handles_result = self._decode_execution_handles(handles, "finished")
+            if handles_result.error is not None:
+                return handles_result
+            tracked_executions = handles_result.result
+            unnamed = sum(1 for tracked, _ in tracked_executions if tracked.test_name is None)
+            if unnamed > 0:
+                warnings.append(f"{unnamed} handles have no test name, their reports can't be found. "
+                                f"Use the test_name instead")
+            reports = await self._resolve_tracked_reports(tracked_executions, set())
+            executions = [report for report in reports if report is not None]
+            if len(executions) < len(handles):
+                warnings.append(f"{len(handles) - len(executions)} of {len(handles)} executions have no report yet, "
+                                f"use wait_for_executions to wait for them")
+        elif len(test_names) > 0:
+            summary_args = {"time_frame": "last24", **args}
+            summary_args.pop("test_name", None)
+            resolved_args = await self._resolve_filter_values(summary_args)
+            warnings.extend(resolved_args.warning or [])
+            # Every test is read concurrently, with its own limit of executions
+            results = await gather_with_concurrency(
+                self.max_concurrency,
+                (self._collect_report_executions({**resolved_args.result, "report_name": test_name}, max_executions)
+                 for test_name in test_names)
+            )
+            executions = []
+            for test_name, result in zip(test_names, results):
+                if isinstance(result, BaseException):
+                    warnings.append(f"The executions of {test_name} could not be read: {result!r}")
+                elif result.error is not None:
+                    warnings.append(f"The executions of {test_name} could not be read: {result.error}")
+                else:
+                    # The report name search matches any part of the name
+                    test_executions = [execution for execution in result.result
+                                       if execution.test_name.casefold() == test_name.casefold()]
+                    executions.extend(test_executions)
+                    if len(test_executions) == 0:
+                        warnings.append(f"No executions of {test_name} found, the test name must be the exact name")
+                    if len(result.result) >= max_executions:
+                        warnings.append(f"Only the latest {max_executions} executions of {test_name} were analyzed")
+        else:
+            return BaseResult(
+                error="Indicate the test_name or the handles of the executions to summarize"
+            )
+
+        return BaseResult(
+            result=format_scriptless_run_summary(executions),
+            warning=warnings or None,
+        )
+
     @token_verify
     async def stop_live_executions(self, execution_id_list: list[str]) -> BaseResult:
         execution_management_url = perfecto.get_execution_management_api_url(self.token.cloud_name)
@@ -70,30 +413,197 @@ class ExecutionManager(Manager):
             return await api_request(self.token, "POST", endpoint=execution_management_url, json=body)
         else:
             return BaseResult(
-                warning=["No list of execution IDs to be stopped was indicated."]
+                error="The execution_id_list is empty, indicate the execution IDs to be stopped "
+                      "(or the predicates without execution_id_list)."
             )
 
+    @staticmethod
+    def _match_live_execution(execution: LiveExecution, predicates: dict[str, str]) -> bool:
+        values = {
+            "owner": [execution.owner],
+            "job_name": [execution.job_name],
+            "device_id": execution.device_ids,
+            "test_name_pattern": [execution.name],
+        }
+        for predicate, pattern in predicates.items():
+            if not any(value is not None and fnmatch.fnmatch(str(value).casefold(), pattern.casefold())
+                       for value in values[predicate]):
+                return False
+        return True
+
+    @token_verify
+    async def stop_matching_live_executions(self, args: dict[str, Any]) -> BaseResult:
+        predicates = {key: args[key] for key in self.stop_predicates if args.get(key)}
+        if len(predicates) == 0:
+            return BaseResult(
+                warning=[f"No predicate to select the executions to be stopped was indicated, "
+                         f"use any of: {', '.join(self.stop_predicates)}"]
+            )
+        match_all = [predicate for predicate, pattern in predicates.items() if not str(pattern).strip("*? ")]
+        if len(match_all) > 0:
+            return BaseResult(
+                error=f"Invalid value for {', '.join(match_all)}, a pattern with only wildcards matches every "
+                      f"live execution. Use a more specific pattern."
+            )
+        dry_run = args.get("dry_run", True)
+
+        live_result = await self._search_live_executions()
+        if live_result.error is not None:
+            return live_result
+        executions = [execution for execution in live_result.result
+                      if self._match_live_execution(execution, predicates)]
+
+        stopped = 0
+        errors = []
+        if not dry_run and len(executions) > 0:
+            execution_ids = [execution.execution_id for execution in executions]
+            batches = [execution_ids[i:i + self.stop_batch_size]
+                       for i in range(0, len(execution_ids), self.stop_batch_size)]
+            results = await gather_with_concurrency(
+                self.max_concurrency,
+                (self.stop_live_executions(batch) for batch in batches)
+            )
+            for batch, result in zip(batches, results):
+                if isinstance(result, BaseException):
+                    errors.append(f"Error stopping {','.join(batch)}: {result!r}")
+                elif result.error is not None:
+                    errors.append(f"Error stopping {','.join(batch)}: {result.error}")
+                else:
+                    stopped += len(batch)
+
+        return BaseResult(
+            result=LiveExecutionStop(
+                dry_run=dry_run,
+                matched=len(executions),
+                stopped=stopped,
+                executions=executions,
+                errors=errors,
+            ),
+        )
+
     @token_verify
     async def list_report_names(self) -> BaseResult:
         report_management_url = perfecto.get_test_execution_name_api_url(self.token.cloud_name)
         body = {}
         return await api_request(self.token, "POST", endpoint=report_management_url, json=body)
 
-    @token_verify
-    async def list_filter_values(self, filter_names: list[str]) -> BaseResult:
+    async def _load_metadata(self) -> BaseResult:
         metadata_management_url = perfecto.get_test_execution_metadata_api_url(self.token.cloud_name)
+        return await api_request(self.token, "GET", endpoint=metadata_management_url)
+
+    async def _get_metadata(self) -> BaseResult:
+        return await ExecutionManager.metadata_cache.get(self.token.cloud_name, self._load_metadata)
+
+    def _get_metadata_values(self, metadata: dict[str, Any], filter_name: str) -> Optional[list[Any]]:
+        metadata_name = self.metadata_map[filter_name]
+        if metadata_name in self.metadata_in_root and metadata_name in metadata:
+            return metadata[metadata_name]
+        elif metadata_name in metadata.get("items", {}):
+            return metadata["items"][metadata_name]["values"]
+        return None
+
+    @staticmethod
+    def _get_filter_value_candidates(values: list[Any]) -> dict[str, Any]:
+        # Maps each searchable text to the value expected by the filter
+        candidates = {}
+        for value in values:
+            if isinstance(value, dict):
+                filter_value = value.get("id", value.get("value", value.get("name")))
+                for key in ["id", "value", "name", "displayName"]:
+                    if value.get(key) is not None:
+                        candidates.setdefault(str(value[key]), filter_value)
+            elif value is not None:
+                candidates.setdefault(str(value), value)
+        return candidates
+
+    @staticmethod
+    def _resolve_exact_value(candidates: dict[str, Any], value: Any,
+                             prefix: bool = False) -> tuple[list[Any], list[str]]:
+        """
+        Values matching the value exactly or case-insensitively (more than one when it's ambiguous),
+        or the only value starting with it when prefix is enabled,
+        and the similar known values to suggest when nothing matches.
+        """
+        texts = list(candidates.keys())
+        matches = resolve_value(str(value), texts, fuzzy=False)
+        if len(matches) > 0:
+            return list(dict.fromkeys(candidates[match] for match in matches)), []
+        if prefix:
+            folded_value = str(value).casefold()
+            prefix_matches = [text for text in texts if text.casefold().startswith(folded_value)]
+            if len(prefix_matches) == 1:
+                return [candidates[prefix_matches[0]]], []
+            if len(prefix_matches) > 1:
+                return [], prefix_matches[:3]
+        return [], resolve_value(str(value), texts, max_matches=3)
+
+    async def _resolve_filter_values(self, args: dict[str, Any]) -> BaseResult:
+        filter_names = [filter_name for filter_name in self.filter_map.keys() if len(args.get(filter_name, [])) > 0]
+        resolved_args = dict(args)
+        if len(filter_names) == 0:
+            return BaseResult(result=resolved_args)
+
+        metadata_result = await self._get_metadata()
+        if metadata_result.error is not None:
+            return BaseResult(
+                result=resolved_args,
+                warning=[f"Filter values could not be resolved, using them as provided: {metadata_result.error}"]
+            )
+
+        info = []
+        warnings = []
+        for filter_name in filter_names:
+            values = self._get_metadata_values(metadata_result.result, filter_name)
+            if values is None:
+                continue
+            candidates = self._get_filter_value_candidates(values)
+            folded_texts = {text.casefold() for text in candidates.keys()}
+            resolved_values = []
+            for value in args[filter_name]:
+                # Only unique matches are used, any other value could be a value not cached yet
+                matched_values, suggestions = self._resolve_exact_value(
+                    candidates, value, prefix=filter_name not in self.exact_filters
+                )
+                if len(matched_values) == 1:
+                    matched_value = matched_values[0]
+                    if str(value).casefold() in folded_texts:
+                        if matched_value != value:
+                            info.append(f"{filter_name}: '{value}' resolved to {matched_value}")
+                    else:
+                        warnings.append(f"{filter_name}: '{value}' is not a known value, resolved to {matched_value}, "
+                                        f"the only value starting with it")
+                    if matched_value not in resolved_values:
+                        resolved_values.append(matched_value)
+                    continue
+                resolved_values.append(value)
+                if len(matched_values) > 1:
+                    warnings.append(f"{filter_name}: '{value}' matches {', '.join(str(v) for v in matched_values)}"
+                                    f" ignoring case, used as provided")
+                else:
+                    did_you_mean = f", did you mean {', '.join(suggestions)}?" if suggestions else ""
+                    warnings.append(f"{filter_name}: '{value}' does not match any known value, "
+                                    f"used as provided{did_you_mean}")
+            resolved_args[filter_name] = resolved_values
+
+        return BaseResult(
+            result=resolved_args,
+            info=info or None,
+            warning=warnings or None,
+        )
 
-        metadata_result = await api_request(self.token, "GET", endpoint=metadata_management_url)
+    @token_verify
+    async def list_filter_values(self, filter_names: list[str]) -> BaseResult:
+        metadata_result = await self._get_metadata()
+        if metadata_result.error is not None:
+            return metadata_result
         metadata = metadata_result.result
         filter_values = {}
         filter_not_found = []
         for filter_name in filter_names:
             if filter_name in self.metadata_map:
-                if self.metadata_map[filter_name] in self.metadata_in_root and self.metadata_map[
-                    filter_name] in metadata:
-                    filter_values[filter_name] = metadata[self.metadata_map[filter_name]]
-                elif self.metadata_map[filter_name] in metadata["items"]:
-                    filter_values[filter_name] = metadata["items"][self.metadata_map[filter_name]]["values"]
+                values = self._get_metadata_values(metadata, filter_name)
+                if values is not None:
+                    filter_values[filter_name] = values
             else:
                 filter_not_found.append(filter_name)
 
@@ -108,12 +618,11 @@ class ExecutionManager(Manager):
             warning=warnings,
         )
 
-    @token_verify
-    async def list_report_executions(self, args: dict[str, Any]) -> BaseResult:
-        page_size = 50
-        page_index = args.get("page_index", 1)
-        skip = (page_size * page_index) - page_size
-        report_name = args.get("report_name", "")
+    @staticmethod
+    def _get_time_frame(args: dict[str, Any]) -> tuple[int, Optional[int]]:
+        """
+        Start and end (only for custom time frame) of the time frame in milliseconds.
+        """
         time_frame = args.get("time_frame", "latest")
         start_time_str = args.get("start_time", "")
         end_time_str = args.get("end_time", "")
@@ -131,14 +640,16 @@ class ExecutionManager(Manager):
             start_time_dt = datetime.fromisoformat(start_time_str)
         start_time_dt = start_time_dt.replace(hour=0, minute=0, second=0, microsecond=0)
         start_time = int(start_time_dt.timestamp() * 1000)
-        end_time = start_time
+        end_time = None
         if time_frame == "custom":
             end_time_dt = datetime.fromisoformat(end_time_str)
             end_time_dt = end_time_dt.replace(hour=0, minute=0, second=0, microsecond=0)
             end_time = int(end_time_dt.timestamp() * 1000)
+        return start_time, end_time
 
-        report_management_url = perfecto.get_test_execution_management_api_url(self.token.cloud_name)
-        report_management_url = report_management_url + "/search"
+    def _build_report_search_body(self, args: dict[str, Any], skip: int, page_size: int) -> dict[str, Any]:
+        report_name = args.get("report_name", "")
+        start_time, end_time = self._get_time_frame(args)
 
         body = {
             "filter": {
@@ -161,37 +672,443 @@ class ExecutionManager(Manager):
             "skip": skip,
             "pageSize": page_size
         }
-        if time_frame == "custom":
+        if end_time is not None:
             body["filter"]["fields"]["endExecutionTime"] = [end_time]
 
         for filter_arg, target in self.filter_map.items():
             filter_values = args.get(filter_arg, [])
             if len(filter_values) > 0:
                 body["filter"]["fields"][target] = filter_values
+        return body
 
-        executions = await api_request(self.token, "POST", endpoint=report_management_url, json=body,
-                                       result_formatter=format_executions,
-                                       result_formatter_params={"cloud_name": self.token.cloud_name})
+    async def _search_report_executions(self, args: dict[str, Any], skip: int, page_size: int) -> BaseResult:
+        report_management_url = perfecto.get_test_execution_management_api_url(self.token.cloud_name)
+        report_management_url = report_management_url + "/search"
+        body = self._build_report_search_body(args, skip, page_size)
+        return await api_request(self.token, "POST", endpoint=report_management_url, json=body)
 
-        page_result = PaginationResult(
-            items=executions.result,
-            count=len(executions.result),
-            page=page_index,
-            offset=skip,
-            next_offset=skip + page_size,
-            has_more=page_size - len(executions.result) <= 0,
+    def _get_filters_hash(self, args: dict[str, Any]) -> str:
+        filter_names = ["report_name", "time_frame", "start_time", "end_time"] + list(self.filter_map.keys())
+        filters = {name: args[name] for name in filter_names if args.get(name)}
+        return hashlib.sha256(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+    async def _read_report_executions_page(self, args: dict[str, Any], page_size: int,
+                                           cursor: Optional[str] = None, skip: int = 0,
+                                           result_formatter: Callable = format_executions) -> BaseResult:
+        """
+        Read a page of executions (sorted by startTime descending) resuming after the cursor when given.
+        The cursor keeps the (startTime, id) of the last returned executions, the upstream skip is only a hint,
+        so the executions that arrive in between pages don't produce duplicated or missed executions.
+        """
+        anchor_time = None
+        anchor_ids = []
+        filters_hash = self._get_filters_hash(args)
+        if cursor:
+            try:
+                cursor_state = decode_cursor(cursor)
+                anchor_time = cursor_state["t"]
+                anchor_ids = list(cursor_state["ids"])
+                skip = int(cursor_state["s"])
+                cursor_filters_hash = cursor_state["f"]
+            except (ValueError, TypeError, KeyError):
+                return BaseResult(
+                    error=f"Invalid cursor {cursor}, use the next_cursor of a previous result"
+                )
+            if cursor_filters_hash != filters_hash:
+                return BaseResult(
+                    error="Invalid cursor, it was created with other filters. Use the same filters of the result "
+                          "that returned the cursor, or start again without cursor"
+                )
+
+        items = []
+        total = None
+        upstream_skip = skip
+        for _ in range(self.max_cursor_reads):
+            # One more than the page size to know if there are more executions
+            search_result = await self._search_report_executions(args, upstream_skip, page_size + 1)
+            if search_result.error is not None:
+                return search_result
+            total = total if total is not None else get_executions_total(search_result.result)
+            batch = search_result.result.get("items", [])
+            for position, item in enumerate(batch):
+                start_time = item.get("startTime", 0)
+                if anchor_time is not None and (start_time > anchor_time or
+                                                (start_time == anchor_time and item.get("id") in anchor_ids)):
+                    continue  # Already returned in a previous page
+                items.append((upstream_skip + position, item))
+            upstream_skip += len(batch)
+            if len(items) > page_size or len(batch) < page_size + 1:
+                break
+
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        next_cursor = None
+        if len(items) > 0:
+            last_position, last_item = items[-1]
+            last_time = last_item.get("startTime", 0)
+            last_ids = [item.get("id") for _, item in items if item.get("startTime", 0) == last_time]
+            if last_time == anchor_time:
+                last_ids = anchor_ids + last_ids
+            next_cursor = encode_cursor({"t": last_time, "ids": last_ids, "s": last_position + 1, "f": filters_hash})
+        elif cursor:
+            next_cursor = cursor
+
+        executions = result_formatter({"items": [item for _, item in items]}, {"cloud_name": self.token.cloud_name})
+        return BaseResult(
+            result=PaginationResult(
+                items=executions,
+                count=len(executions),
+                total=total,
+                offset=items[0][0] if len(items) > 0 else upstream_skip,
+                next_offset=items[-1][0] + 1 if len(items) > 0 else upstream_skip,
+                has_more=has_more,
+                cursor=cursor,
+                next_cursor=next_cursor,
+            )
         )
 
+    @token_verify
+    async def iter_report_executions(self, args: dict[str, Any], max_executions: Optional[int],
+                                      cursor: Optional[str] = None,
+                                      result_formatter: Callable = format_executions) -> AsyncIterator[BaseResult]:
+        """
+        Yields the pages of executions (following the cursors) until max_executions (all when None),
+        or the first page with error.
+        """
+        page_size = 50
+        count = 0
+        while max_executions is None or count < max_executions:
+            read_size = page_size if max_executions is None else min(page_size, max_executions - count)
+            page = await self._read_report_executions_page(args, read_size, cursor, result_formatter=result_formatter)
+            if page.error is not None:
+                yield page
+                return
+            count += page.result.count
+            yield BaseResult(result=page.result.items)
+            if not page.result.has_more:
+                return
+            cursor = page.result.next_cursor
+
+    async def _collect_report_executions(self, args: dict[str, Any], max_executions: int) -> BaseResult:
+        """
+        Collect up to max_executions executions. The first page tells the total, so the rest of the pages are read
+        concurrently. When executions arrive meanwhile (the total changes) the rows shift between the pages,
+        so they're read again following the keyset cursors of the first page.
+        """
+        page_size = 50
+        first_page = await self._read_report_executions_page(args, min(page_size, max_executions))
+        if first_page.error is not None:
+            return first_page
+        executions = list(first_page.result.items)
+        if not first_page.result.has_more:
+            return BaseResult(result=executions)
+
+        total = first_page.result.total
+        if total is not None:
+            end = first_page.result.next_offset + min(total, max_executions) - len(executions)
+            skips = range(first_page.result.next_offset, end, page_size)
+            results = await gather_with_concurrency(
+                self.max_concurrency,
+                (self._search_report_executions(args, skip, min(page_size, end - skip)) for skip in skips)
+            )
+            test_ids = {execution.test_id for execution in executions}
+            for skip, result in zip(skips, results):
+                if isinstance(result, BaseException):
+                    return BaseResult(
+                        error=f"Error reading the executions from {skip}: {result!r}"
+                    )
+                if result.error is not None:
+                    return result
+                for execution in format_executions(result.result, {"cloud_name": self.token.cloud_name}):
+                    if execution.test_id not in test_ids:
+                        test_ids.add(execution.test_id)
+                        executions.append(execution)
+            # The total again once every page was read, to detect the shifted rows
+            total_result = await self._search_report_executions(args, 0, 1)
+            if total_result.error is None and get_executions_total(total_result.result) == total and \
+                    len(executions) >= min(total, max_executions):
+                return BaseResult(
+                    result=executions[:max_executions],
+                )
+            executions = list(first_page.result.items)
+
+        # Without total, or with rows shifted, the pages can only be followed one after another
+        async for page in self.iter_report_executions(args, max_executions - len(executions),
+                                                       first_page.result.next_cursor):
+            if page.error is not None:
+                return page
+            executions.extend(page.result)
         return BaseResult(
-            result=page_result,
-            error=executions.error,
-            warning=executions.warning,
-            info=executions.info,
+            result=executions,
+        )
+
+    @token_verify
+    async def list_report_executions(self, args: dict[str, Any]) -> BaseResult:
+        page_size = 50
+        page_index = args.get("page_index", 1)
+        skip = (page_size * page_index) - page_size
+
+        resolved_args = await self._resolve_filter_values(args)
+        page = await self._read_report_executions_page(resolved_args.result, page_size, args.get("cursor"), skip)
+        if page.result is not None and not args.get("cursor"):
+            page.result.page = page_index
+
+        page.append_info(resolved_args.info or [])
+        page.append_warnings(resolved_args.warning or [])
+        return page
+
+    @token_verify
+    async def export_report_executions(self, args: dict[str, Any]) -> BaseResult:
+        file_format = args.get("format", "ndjson")
+        if file_format not in EXPORT_FORMATS:
+            return BaseResult(
+                error=f"Invalid format {file_format}, valid values: {', '.join(EXPORT_FORMATS)}"
+            )
+        file_path = args.get("file_path", "")
+        if not file_path:
+            file_name = f"perfecto-executions-{self.token.cloud_name}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            file_path = os.path.join(tempfile.gettempdir(), f"{file_name}.{file_format}")
+        file_path = os.path.abspath(os.path.expanduser(file_path))
+        if os.path.exists(file_path) and not args.get("overwrite", False):
+            return BaseResult(
+                error=f"The file {file_path} already exists, use another file_path or overwrite=true to replace it"
+            )
+        max_executions = args.get("max_executions")
+
+        resolved_args = await self._resolve_filter_values(args)
+        # Written to a partial file that replaces the file only when the export is complete
+        file_descriptor, partial_path = tempfile.mkstemp(prefix=f".{os.path.basename(file_path)}.", suffix=".part",
+                                                         dir=os.path.dirname(file_path))
+        os.close(file_descriptor)
+        try:
+            writer = await asyncio.to_thread(open_rows_writer, partial_path, file_format, EXPORT_EXECUTION_COLUMNS)
+        except ValueError as e:
+            os.remove(partial_path)
+            return BaseResult(
+                error=str(e)
+            )
+        rows = 0
+        pages = 0
+        completed = False
+        try:
+            # Only one page is kept in memory, it's written before reading the next one
+            async for page in self.iter_report_executions(resolved_args.result, max_executions,
+                                                           result_formatter=format_export_execution_rows):
+                if page.error is not None:
+                    return page
+                await asyncio.to_thread(writer.write, page.result)
+                rows += len(page.result)
+                pages += 1
+                await self.ctx.report_progress(rows, max_executions, f"{rows} executions exported")
+            completed = True
+        finally:
+            await asyncio.to_thread(writer.close)
+            if completed:
+                await asyncio.to_thread(os.replace, partial_path, file_path)
+            else:
+                await asyncio.to_thread(os.remove, partial_path)
+
+        return BaseResult(
+            result=ExecutionExport(
+                file_path=file_path,
+                file_format=file_format,
+                rows=rows,
+                pages=pages,
+                columns=EXPORT_EXECUTION_COLUMNS,
+            ),
+            info=resolved_args.info,
+            warning=resolved_args.warning,
+        )
+
+    @token_verify
+    async def report_execution_trends(self, args: dict[str, Any]) -> BaseResult:
+        max_executions = args.get("max_executions", 2000)
+        buckets = min(max(args.get("buckets", 20), 1), 200)
+
+        resolved_args = await self._resolve_filter_values(args)
+        executions_result = await self._collect_report_executions(resolved_args.result, max_executions)
+        if executions_result.error is not None:
+            return executions_result
+
+        start_time, end_time = self._get_time_frame(args)
+        trends = format_execution_trends(executions_result.result, {
+            "buckets": buckets,
+            "top_tests": args.get("top_tests", 10),
+            "window_start": start_time / 1000,
+            "window_end": end_time / 1000 if end_time is not None else datetime.now().timestamp(),
+        })
+        result = BaseResult(
+            result=trends,
+            info=resolved_args.info,
+            warning=resolved_args.warning,
         )
+        if len(executions_result.result) >= max_executions:
+            result.append_warnings([f"Only the latest {max_executions} executions were analyzed, "
+                                    f"use a shorter time frame or a higher max_executions"])
+        return result
 
     @token_verify
-    async def red_report_execution(self, execution_id: str) -> BaseResult:
+    async def device_utilization(self, args: dict[str, Any]) -> BaseResult:
+        max_executions = args.get("max_executions", 10000)
+
+        resolved_args = await self._resolve_filter_values(args)
+        devices_usage = {}
+        executions = 0
+        async for page in self.iter_report_executions(resolved_args.result, max_executions):
+            if page.error is not None:
+                return page
+            add_device_usage(devices_usage, page.result)
+            executions += len(page.result)
+            await self.ctx.report_progress(executions, max_executions, f"{executions} executions analyzed")
+
+        warnings = list(resolved_args.warning or [])
+        inventory = None
+        if args.get("include_inventory", True):
+            # Imported here, the device manager depends on this module
+            from tools.device_manager import DeviceManager
+            snapshot_result = await DeviceManager(self.token, self.ctx).get_real_devices_snapshot()
+            if snapshot_result.error is None:
+                inventory = set(snapshot_result.result.devices.keys())
+            else:
+                warnings.append(f"The real devices inventory could not be read: {snapshot_result.error}")
+
+        start_time, end_time = self._get_time_frame(args)
+        end_time = end_time if end_time is not None else datetime.now().timestamp() * 1000
+        report = format_device_utilization(devices_usage, {
+            "executions": executions,
+            "window_hours": (end_time - start_time) / 1000 / 3600,
+            "hot_threshold": args.get("hot_threshold", 0.5),
+            "idle_threshold": args.get("idle_threshold", 0.05),
+            "inventory": inventory,
+        })
+        if executions >= max_executions:
+            warnings.append(f"Only the latest {max_executions} executions were analyzed, "
+                            f"use a shorter time frame or a higher max_executions")
+        return BaseResult(
+            result=report,
+            info=resolved_args.info,
+            warning=warnings or None,
+        )
+
+    @token_verify
+    async def job_summary(self, args: dict[str, Any]) -> BaseResult:
+        job_name = args.get("job_name", "")
+        job_number_list = [int(job_number) for job_number in dict.fromkeys(args.get("job_number_list", []))]
+        if not job_name or len(job_number_list) == 0:
+            return BaseResult(
+                error="Invalid value for job_name or job_number_list, both are required."
+            )
+        max_executions = args.get("max_executions", 2000)
+
+        info = []
+        warnings = []
+        # A single job, the builds of different jobs with the same number can't be merged
+        metadata_result = await self._get_metadata()
+        job_names = self._get_metadata_values(metadata_result.result, "job_name_list") \
+            if metadata_result.error is None else None
+        if job_names is not None:
+            matched_names, suggestions = self._resolve_exact_value(self._get_filter_value_candidates(job_names),
+                                                                   job_name)
+            if len(matched_names) > 1:
+                return BaseResult(
+                    error=f"The job_name {job_name} is ambiguous, it matches the jobs: "
+                          f"{', '.join(str(name) for name in matched_names)}. Use one of them."
+                )
+            elif len(matched_names) == 1:
+                if matched_names[0] != job_name:
+                    info.append(f"job_name: '{job_name}' resolved to {matched_names[0]}")
+                job_name = matched_names[0]
+            else:
+                did_you_mean = f", did you mean {', '.join(suggestions)}?" if suggestions else ""
+                warnings.append(f"job_name: '{job_name}' does not match any known job, used as provided{did_you_mean}")
 
+        job_args = {"time_frame": "lastMonth", **args}
+        for filter_name in ["job_name_list", "job_number_list"]:
+            job_args.pop(filter_name, None)
+        resolved_args = await self._resolve_filter_values(job_args)
+        job_args = {**resolved_args.result, "job_name_list": [job_name]}
+        info.extend(resolved_args.info or [])
+        warnings.extend(resolved_args.warning or [])
+
+        results = await gather_with_concurrency(
+            self.max_concurrency,
+            (self._collect_report_executions({**job_args, "job_number_list": [job_number]}, max_executions)
+             for job_number in job_number_list)
+        )
+        builds = {}
+        for job_number, result in zip(job_number_list, results):
+            if isinstance(result, BaseException):
+                warnings.append(f"Error reading the executions of job number {job_number}: {result!r}")
+            elif result.error is not None:
+                warnings.append(f"Error reading the executions of job number {job_number}: {result.error}")
+            else:
+                builds[job_number] = result.result
+                if len(result.result) == 0:
+                    warnings.append(f"No executions found for job number {job_number} in the time frame")
+
+        return BaseResult(
+            result=format_job_summary(builds, {"job_name": job_name}),
+            info=info or None,
+            warning=warnings or None,
+        )
+
+    @token_verify
+    async def compare_executions(self, args: dict[str, Any]) -> BaseResult:
+        execution_id_a = args.get("execution_id_a", "")
+        execution_id_b = args.get("execution_id_b", "")
+        if not execution_id_a or not execution_id_b:
+            return BaseResult(
+                error="Invalid value for execution_id_a or execution_id_b, both are required."
+            )
+
+        commands_a, commands_b = await asyncio.gather(
+            self._read_report_commands(execution_id_a, format_execution_commands),
+            self._read_report_commands(execution_id_b, format_execution_commands),
+        )
+        for execution_id, commands in [(execution_id_a, commands_a), (execution_id_b, commands_b)]:
+            if commands.error is not None:
+                return BaseResult(
+                    error=f"Error reading the commands of execution {execution_id}: {commands.error}"
+                )
+
+        return BaseResult(
+            result=format_execution_comparison(commands_a.result, commands_b.result, {
+                "execution_id_a": execution_id_a,
+                "execution_id_b": execution_id_b,
+                "min_delta": args.get("min_delta", 1.0),
+            }),
+        )
+
+    @token_verify
+    async def cluster_failures(self, args: dict[str, Any]) -> BaseResult:
+        max_executions = args.get("max_executions", 500)
+        similarity = args.get("similarity", 0.5)
+
+        resolved_args = await self._resolve_filter_values(args)
+        executions_result = await self._collect_report_executions(resolved_args.result, max_executions)
+        if executions_result.error is not None:
+            return executions_result
+
+        failed_executions = []
+        messages = []
+        for execution in executions_result.result:
+            message = get_failure_message(execution)
+            if message is not None:
+                failed_executions.append(execution)
+                messages.append(message)
+
+        clusters = cluster_messages(messages, threshold=similarity)
+        result = BaseResult(
+            result=format_failure_clusters(failed_executions, messages, clusters),
+            info=[f"{len(executions_result.result)} executions analyzed, {len(failed_executions)} with failure "
+                  f"messages grouped in {len(clusters)} clusters"],
+            warning=resolved_args.warning,
+        )
+        result.append_info(resolved_args.info or [])
+        return result
+
+    async def _read_report_commands(self, execution_id: str, result_formatter: Callable = None,
+                                    result_formatter_params: Optional[dict] = None) -> BaseResult:
         report_commands_url = perfecto.get_test_execution_commands_api_url(self.token.cloud_name) + "/"
 
         params = {
@@ -201,7 +1118,82 @@ class ExecutionManager(Manager):
         }
 
         return await api_request(self.token, "GET", endpoint=report_commands_url, params=params,
-                                 result_formatter_params={"cloud_name": self.token.cloud_name})
+                                 result_formatter=result_formatter,
+                                 result_formatter_params={"cloud_name": self.token.cloud_name,
+                                                          **(result_formatter_params or {})})
+
+    @token_verify
+    async def red_report_execution(self, execution_id: str, summary_only: bool = False) -> BaseResult:
+        return await self._read_report_commands(execution_id,
+                                                format_execution_commands_summary if summary_only else None)
+
+    @token_verify
+    async def list_report_execution_commands(self, args: dict[str, Any]) -> BaseResult:
+        page_size = min(max(args.get("page_size", 50), 1), 200)
+        page_index = max(args.get("page_index", 1), 1)
+        skip = args.get("offset", (page_size * page_index) - page_size)
+        start_time_str = args.get("start_time", "")
+        end_time_str = args.get("end_time", "")
+
+        formatter_params = {
+            "failed_only": args.get("failed_only", False),
+            "start_time": datetime.fromisoformat(start_time_str).timestamp() if start_time_str else None,
+            "end_time": datetime.fromisoformat(end_time_str).timestamp() if end_time_str else None,
+        }
+        # Only the compact representation of the commands is kept, the raw summary is discarded by the formatter
+        commands_result = await self._read_report_commands(args.get("execution_id", ""),
+                                                           format_execution_commands, formatter_params)
+        if commands_result.error is not None:
+            return commands_result
+        commands = commands_result.result
+
+        info = []
+        first_failure = next((i for i, command in enumerate(commands) if is_failed_status(command.status)), None)
+        if first_failure is not None:
+            info.append(f"First failed command at offset {first_failure} of the listed commands "
+                        f"(command index {commands[first_failure].index})")
+            if args.get("around_failure", False):
+                skip = max(0, first_failure - page_size // 2)
+        skip = max(0, skip)
+
+        items = commands[skip:skip + page_size]
+        page_result = PaginationResult(
+            items=items,
+            count=len(items),
+            total=len(commands),
+            page=skip // page_size + 1,
+            offset=skip,
+            next_offset=skip + page_size,
+            has_more=skip + page_size < len(commands),
+        )
+        return BaseResult(
+            result=page_result,
+            info=info or None,
+        )
+
+    @token_verify
+    async def read_report_executions(self, execution_id_list: list[str], summary_only: bool = False) -> BaseResult:
+        if len(execution_id_list) == 0:
+            return BaseResult(
+                warning=["No list of execution IDs to be read was indicated."]
+            )
+        execution_id_list = list(dict.fromkeys(execution_id_list))
+        results = await gather_with_concurrency(
+            self.max_concurrency,
+            (self.red_report_execution(execution_id, summary_only) for execution_id in execution_id_list)
+        )
+
+        reports = []
+        for execution_id, result in zip(execution_id_list, results):
+            if isinstance(result, BaseException):
+                reports.append(ExecutionReport(execution_id=execution_id, error=f"Error: {result!r}"))
+            else:
+                reports.append(ExecutionReport(execution_id=execution_id, result=result.result, error=result.error))
+        errors = sum(1 for report in reports if report.error is not None)
+        return BaseResult(
+            result=reports,
+            info=[f"{len(reports) - errors} of {len(reports)} report executions read"],
+        )
 
 
 def register(mcp, token: Optional[PerfectoToken]):
@@ -211,9 +1203,36 @@ def register(mcp, token: Optional[PerfectoToken]):
 Operations on execution information.
 Actions:
 - list_live_executions: List all live executions (Mobile, Tablet and Desktop Browser).
-- stop_live_executions: Stop live executions.
-    args(dict): Dictionary with the following required parameters:
-        execution_id_list (list[str]): The execution Id to to be stopped.
+- watch_live_executions: Watch the live executions for a bounded time and report only the changes (started, finished, status changed).
+    The changes are streamed as progress notifications and a summary with all the changes is returned at the end.
+    args(dict): Dictionary with the following optional parameters:
+        duration (int, default=60, max=600): Seconds to watch the live executions.
+        stop_when_empty (bool, default=False): Stop watching when there are no more live executions.
+- wait_for_executions: Wait for executions submitted with AI Scriptless execute_test or execute_test_matrix to finish,
+    with a single shared search of the live executions for all of them (polled faster while they change),
+    reporting the status changes as progress. Returns the report status, URL, duration and failure reason of each one.
+    args(dict): Dictionary with the following parameters:
+        handles (list[str], required): The handles returned by the execution submissions.
+        timeout (int, default=600, max=1800): Seconds to wait, the executions not finished are returned as pending.
+- scriptless_run_summary: Summarize the runs of AI Scriptless tests on many devices in a single matrix, with the 
+    latest execution of each test on each device (status, duration and failure reason, failed first), 
+    the number of devices by status and the most frequent failure reasons.
+    args(dict): Dictionary with the test_name or the handles:
+        test_name (str or list[str]): The test names (report names), their executions are read concurrently.
+        handles (list[str]): The handles returned by execute_test or execute_test_matrix.
+        time_frame (str, default='last24'): With test_name, the time frame of the executions 
+            (same values as list_report_executions, custom with start_time and end_time).
+        max_executions (int, default=500): With test_name, the maximum number of executions read by test.
+- stop_live_executions: Stop live executions, by IDs or by a predicate over the live executions.
+    args(dict): Dictionary with the execution_id_list or at least one of the predicate parameters:
+        execution_id_list (list[str]): The execution Id to to be stopped (not empty).
+        owner (str): Stop the executions of this owner (supports * wildcards, but not only wildcards).
+        job_name (str): Stop the executions of this job (supports * wildcards, but not only wildcards).
+        device_id (str): Stop the executions running on this device (supports * wildcards, but not only wildcards).
+        test_name_pattern (str): Stop the executions with a test name matching this pattern 
+            (supports * wildcards, but not only wildcards).
+        dry_run (bool, default=True): Only preview the executions matching the predicates, nothing is stopped. 
+            Review the preview with the user and call again with dry_run=False to stop them.
 - list_report_names: List alls report names (also known as Test Names).
 - list_report_executions: List finished executions.
     args(dict): Dictionary with the following optional filter parameters:
@@ -223,31 +1242,87 @@ Actions:
             latest=Today, last24=Last 24 hours, lastWeek=Last 7 days, lastMonth=Last 30 days, custom= Custom Filter Range (use start_time and end_time).
         start_time (str): The start time in ISO format (only when time_frame is 'custom').
         end_time (str): The end time in ISO format (only when time_frame is 'custom').
-        device_id_list (list[str], values= use first list_filter_values tool with 'device_id_list'): The real device IDs to filter the execution results.
-        os_list (list[str], values= use first list_filter_values tool with 'os_list'): The list of OS IDs to filter the execution results.
-        platform_list (list[str], values= use first list_filter_values tool with 'platform_list'): The list of platform type to filter the execution results.
-        browser_list (list[str], values= use first list_filter_values tool with 'browser_list'): The list of browsers to filter the execution results.
-        job_name_list (list[str], values= use first list_filter_values tool with 'job_name_list'): The list of job names to filter the execution results.
-        trigger_list (list[str], values= use first list_filter_values tool with 'trigger_list'): The list of trigger types to filter the execution results.
-        tag_list (list[str], values= use first list_filter_values tool with 'tag_list'): The list of tags to filter the execution results.
-        owner_list (list[str], values= use first list_filter_values tool with 'owner_list'): The list of owners to filter the execution results.
-        os_version_list (list[str], values= use first list_filter_values tool with 'os_version_list'): The list of operating system versions to filter the execution results.
-        failure_reason_list (list[str], values= use first list_filter_values tool with 'failure_reason_list'): The list of failure reason IDs to filter the execution results.
+        device_id_list (list[str], values= list_filter_values with 'device_id_list'): The real device IDs to filter the execution results.
+        os_list (list[str], values= list_filter_values with 'os_list'): The list of OS IDs to filter the execution results.
+        platform_list (list[str], values= list_filter_values with 'platform_list'): The list of platform type to filter the execution results.
+        browser_list (list[str], values= list_filter_values with 'browser_list'): The list of browsers to filter the execution results.
+        job_name_list (list[str], values= list_filter_values with 'job_name_list'): The list of job names to filter the execution results.
+        trigger_list (list[str], values= list_filter_values with 'trigger_list'): The list of trigger types to filter the execution results.
+        tag_list (list[str], values= list_filter_values with 'tag_list'): The list of tags to filter the execution results.
+        owner_list (list[str], values= list_filter_values with 'owner_list'): The list of owners to filter the execution results.
+        os_version_list (list[str], values= list_filter_values with 'os_version_list'): The list of operating system versions to filter the execution results.
+        failure_reason_list (list[str], values= list_filter_values with 'failure_reason_list'): The list of failure reason IDs to filter the execution results.
         page_index (int, default=1), The current page number. If the result mention has_next_page in true, asks the user if they want to see the next page. 
+        cursor (str): The next_cursor of the previous result, continues exactly after the last execution of that page 
+            even when new executions arrive (preferred over page_index to see the next page).
+            It's only valid with the same filters of that result.
         
 - list_filter_values: List the values needed for list_report_executions filters
     args(dict): Dictionary with the following required filter parameters:
         filter_names (list[str], values=['device_id_list', 'os_list', 'platform_list', 'browser_list', 'job_name_list', 'trigger_list', 'tag_list', 'owner_list', 'os_version_list', 'failure_reason_list']): The filter name list.
         
 - read_report_execution: Read report execution details (commands summary)
-    args(dict): Dictionary with the following required filter parameters:
+    args(dict): Dictionary with the following parameters (execution_id or execution_id_list is required):
         execution_id (str): The report execution ID (obtained from list_report_executions).
+        execution_id_list (list[str]): A list of report execution IDs to read concurrently (instead of execution_id), 
+            each item of the result has its execution_id and its result or error.
+        summary_only (bool, default=False): Return only the summary attributes and the command counters by status.
+- list_report_execution_commands: List the commands of a report execution in a compact and paged form.
+    args(dict): Dictionary with the following parameters:
+        execution_id (str, required): The report execution ID (obtained from list_report_executions).
+        failed_only (bool, default=False): Only the failed commands.
+        start_time (str): Only the commands started after this time in ISO format.
+        end_time (str): Only the commands started before this time in ISO format.
+        around_failure (bool, default=False): Returns the page of commands around the first failed command.
+        page_size (int, default=50, max=200): The number of commands per page.
+        page_index (int, default=1): The current page number.
+        offset (int): The offset of the first command to return (instead of page_index, use next_offset to continue).
+- export_report_executions: Export finished executions to a local file page by page, returns only the file path and row counts.
+    Useful for offline analysis of large periods of time (the executions are not returned in the result).
+    args(dict): Dictionary with the time_frame, start_time, end_time and the list filter parameters of list_report_executions and:
+        format (str, default='ndjson', values=['ndjson']): The format of the exported file.
+        file_path (str): The path of the exported file (by default a new file in the temporary folder).
+        overwrite (bool, default=False): Replace the file when it already exists.
+        max_executions (int): The maximum number of executions to export (by default all).
+- report_execution_trends: Duration percentiles (p50, p90, p99 in seconds) and pass rate by test and by device, 
+    and time series of pass rate and duration downsampled to a fixed number of buckets (as parallel lists).
+    args(dict): Dictionary with the same optional filter parameters of list_report_executions (except page_index) and:
+        buckets (int, default=20, max=200): The number of buckets of the time series.
+        top_tests (int, default=10): The number of tests (with more executions) with their own time series.
+        max_executions (int, default=2000): The maximum number of executions to analyze.
+- device_utilization: Device hours, runs and failure rate by device and by model over the time frame, flagging the hot and idle devices.
+    args(dict): Dictionary with the same optional filter parameters of list_report_executions (except page_index) and:
+        hot_threshold (float, default=0.5): Utilization ratio (device hours over window hours) to flag a device as hot.
+        idle_threshold (float, default=0.05): Utilization ratio to flag a device as idle.
+        include_inventory (bool, default=True): Compare with the real devices inventory, reporting separately the 
+            inventory devices without executions and the execution devices not in the inventory 
+            (the device IDs of the inventory and of the execution reports may differ).
+        max_executions (int, default=10000): The maximum number of executions to analyze.
+- job_summary: Compare the builds (job numbers) of a CI job: totals by status, pass rate, durations, 
+    newly failing and newly fixed tests and test duration changes versus the previous build.
+    args(dict): Dictionary with the following parameters:
+        job_name (str, required): The job name (matched exactly or ignoring case with a single job).
+        job_number_list (list[int], required): The job numbers (builds) to summarize.
+        time_frame (str, default='lastMonth'), start_time (str), end_time (str): Same as list_report_executions.
+        max_executions (int, default=2000): The maximum number of executions to read by build.
+- compare_executions: Compare the commands of two report executions (e.g. a passing and a failing run of the same test), 
+    aligning both command sequences. Returns the first divergence, the status changes, the biggest timing deltas by command 
+    and the inserted, deleted or replaced commands.
+    args(dict): Dictionary with the following parameters:
+        execution_id_a (str, required): The first report execution ID (usually the reference run).
+        execution_id_b (str, required): The second report execution ID.
+        min_delta (float, default=1.0): The minimum duration difference in seconds to report a timing delta.
+- cluster_failures: Group the failure messages (failure reason and error analysis) of finished executions into clusters of near duplicates.
+    args(dict): Dictionary with the same optional filter parameters of list_report_executions (except page_index) and:
+        max_executions (int, default=500): The maximum number of executions to analyze.
+        similarity (float, default=0.5): The minimum similarity (0 to 1) between two messages to be grouped.
 
 Hints:
-- IMPORTANT: Always call list_filter_values first to get valid filter values before using any filters in list_report_executions. 
-  This ensures you're using the correct device IDs, test names, or other filter values that actually exist in the execution reports system.
+- Filter values are resolved automatically against the known values (ignoring case, or the only value starting with it), 
+  there is no need to call list_filter_values before filtering. The device IDs, job numbers, OS versions and failure 
+  reasons are only matched exactly or ignoring case. The values not matched are used as provided (they could be new values) 
+  and reported in warning with the similar known values, in that case use list_filter_values to review the valid values.
 - The device IDs from list_real_devices may not match the device IDs used in execution reports. Use list_filter_values to get the exact device IDs that are valid for filtering executions.
-- When filtering by device_id_list, time_frame, or test_name, always verify the valid values using list_filter_values to avoid empty results due to incorrect filter values.
 - Always generates the url attributes as a link in markdown format (like execution_url). 
 """
     )
@@ -263,8 +1338,16 @@ Hints:
             match action:
                 case "list_live_executions":
                     return await execution_manager.list_live_executions()
+                case "watch_live_executions":
+                    return await execution_manager.watch_live_executions(args)
+                case "scriptless_run_summary":
+                    return await execution_manager.scriptless_run_summary(args)
+                case "wait_for_executions":
+                    return await execution_manager.wait_for_executions(args)
                 case "stop_live_executions":
-                    return await execution_manager.stop_live_executions(args["execution_id_list"])
+                    if "execution_id_list" in args:
+                        return await execution_manager.stop_live_executions(args["execution_id_list"])
+                    return await execution_manager.stop_matching_live_executions(args)
                 case "list_report_names":
                     return await execution_manager.list_report_names()
                 case "list_report_executions":
@@ -272,7 +1355,25 @@ Hints:
                 case "list_filter_values":
                     return await execution_manager.list_filter_values(args.get("filter_names", []))
                 case "read_report_execution":
-                    return await execution_manager.red_report_execution(args.get("execution_id", ""))
+                    if "execution_id_list" in args:
+                        return await execution_manager.read_report_executions(args["execution_id_list"],
+                                                                              args.get("summary_only", False))
+                    return await execution_manager.red_report_execution(args.get("execution_id", ""),
+                                                                        args.get("summary_only", False))
+                case "list_report_execution_commands":
+                    return await execution_manager.list_report_execution_commands(args)
+                case "export_report_executions":
+                    return await execution_manager.export_report_executions(args)
+                case "report_execution_trends":
+                    return await execution_manager.report_execution_trends(args)
+                case "device_utilization":
+                    return await execution_manager.device_utilization(args)
+                case "job_summary":
+                    return await execution_manager.job_summary(args)
+                case "compare_executions":
+                    return await execution_manager.compare_executions(args)
+                case "cluster_failures":
+                    return await execution_manager.cluster_failures(args)
                 case _:
                     return BaseResult(
                         error=f"Action {action} not found in execution manager tool"
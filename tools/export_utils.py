@@ -0,0 +1,28 @@
+"""
+Writers to export rows to local files page by page, without keeping the exported rows in memory.
+"""
+import json
+from typing import Any, List
+
+EXPORT_FORMATS = ["ndjson"]
+
+
+class NdjsonRowsWriter:
+    def __init__(self, path: str, columns: List[str]):
+        self.columns = columns
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: List[dict[str, Any]]):
+        for row in rows:
+            self._file.write(json.dumps({column: row.get(column) for column in self.columns}, ensure_ascii=False))
+            self._file.write("\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def open_rows_writer(path: str, file_format: str, columns: List[str]):
+    if file_format == "ndjson":
+        return NdjsonRowsWriter(path, columns)
+    raise ValueError(f"Invalid format {file_format!r}, valid values: {', '.join(EXPORT_FORMATS)}")
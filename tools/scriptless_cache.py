@@ -0,0 +1,176 @@
+"""
+In memory AI Scriptless tests catalogue shared between the instances of the Perfecto MCP tools managers.
+"""
+from collections import Counter
+from typing import Any, List, Optional
+
+from formatters.ai_scriptless import get_ai_scriptless_test_name
+from tools.text_utils import trigrams, trigram_similarity
+
+# Attributes of a test that are compared to detect its changes between refreshes
+TEST_COMPARED_FIELDS = ["name", "modificationTime", "createdBy", "modifiedBy", "visibility", "path"]
+
+
+class ScriptlessTestIndex:
+    """
+    Flattened tests of the AI Scriptless scripts tree of a cloud, indexed by name trigrams, owner and visibility.
+    A newer flattening of the tree is applied with patch, re-indexing only the changed tests.
+    """
+
+    def __init__(self, tests: List[dict[str, Any]]):
+        self.validators: dict[str, str] = {}  # ETag and Last-Modified of the tree response
+        self.tests: dict[str, dict[str, Any]] = {}
+        self._containers: dict[tuple, Optional[str]] = {}  # Modification time by (visibility, path)
+        self._name_trigrams: dict[str, set[str]] = {}
+        self._owners: dict[str, set[str]] = {}
+        self._visibilities: dict[str, set[str]] = {}
+        self._owner_names: dict[str, set[str]] = {}  # Any user that created or modified a test, for the facets
+        self._test_names: dict[str, set[str]] = {}
+        self._ordered: Optional[List[dict[str, Any]]] = None  # Tests in listing order, reset on any change
+        self._rank: dict[str, int] = {}
+        for test in tests:
+            self.add(test)
+            self._containers[(test["visibility"], test["path"])] = test.get("container_modified")
+
+    @staticmethod
+    def _index(index: dict[str, set[str]], value: str, test_key: str):
+        index.setdefault(value, set()).add(test_key)
+
+    @staticmethod
+    def _unindex(index: dict[str, set[str]], value: str, test_key: str):
+        keys = index.get(value)
+        if keys is not None:
+            keys.discard(test_key)
+            if len(keys) == 0:
+                del index[value]
+
+    def add(self, test: dict[str, Any]):
+        test_key = test["key"]
+        if test_key in self.tests:
+            self.remove(test_key)
+        self.tests[test_key] = test
+        self._ordered = None
+        name = get_ai_scriptless_test_name(test["name"])
+        name_trigrams = self._name_trigrams
+        for trigram in trigrams(name):
+            name_trigrams.setdefault(trigram, set()).add(test_key)
+        self._index(self._owners, test["createdBy"], test_key)
+        self._index(self._visibilities, test["visibility"], test_key)
+        self._index(self._owner_names, test["createdBy"], test_key)
+        self._index(self._owner_names, test["modifiedBy"], test_key)
+        self._index(self._test_names, name, test_key)
+
+    def remove(self, test_key: str):
+        test = self.tests.pop(test_key, None)
+        if test is None:
+            return
+        self._ordered = None
+        name = get_ai_scriptless_test_name(test["name"])
+        for trigram in trigrams(name):
+            self._unindex(self._name_trigrams, trigram, test_key)
+        self._unindex(self._owners, test["createdBy"], test_key)
+        self._unindex(self._visibilities, test["visibility"], test_key)
+        self._unindex(self._owner_names, test["createdBy"], test_key)
+        self._unindex(self._owner_names, test["modifiedBy"], test_key)
+        self._unindex(self._test_names, name, test_key)
+
+    def copy(self) -> "ScriptlessTestIndex":
+        """
+        Copy of the index that can be patched while this one keeps serving searches.
+        """
+        index = ScriptlessTestIndex([])
+        index.validators = dict(self.validators)
+        index.tests = dict(self.tests)
+        index._containers = dict(self._containers)
+        for name in ["_name_trigrams", "_owners", "_visibilities", "_owner_names", "_test_names"]:
+            setattr(index, name, {value: set(test_keys) for value, test_keys in getattr(self, name).items()})
+        index._ordered = self._ordered
+        index._rank = self._rank
+        return index
+
+    def patch(self, tests: List[dict[str, Any]]) -> int:
+        """
+        Apply a newer flattening of the tree, returns the number of added, changed or removed tests.
+        The tests of the containers with the same modification time are only compared by their modification time.
+        """
+        containers = {}
+        test_keys = set()
+        changes = 0
+        for test in tests:
+            test_key = test["key"]
+            test_keys.add(test_key)
+            container = (test["visibility"], test["path"])
+            container_modified = test.get("container_modified")
+            containers[container] = container_modified
+            current = self.tests.get(test_key)
+            if current is None:
+                changed = True
+            elif container_modified is not None and self._containers.get(container) == container_modified:
+                changed = current.get("modificationTime") != test.get("modificationTime")
+            else:
+                changed = any(current.get(field) != test.get(field) for field in TEST_COMPARED_FIELDS)
+            if changed:
+                self.add(test)
+                changes += 1
+        for test_key in [test_key for test_key in self.tests.keys() if test_key not in test_keys]:
+            self.remove(test_key)
+            changes += 1
+        self._containers = containers
+        return changes
+
+    def _match_name(self, test_name: str) -> set[str]:
+        """
+        Tests with the name containing test_name (case-insensitive), narrowed with the trigrams of test_name.
+        """
+        query = test_name.lower()
+        query_trigrams = {query[i:i + 3] for i in range(len(query) - 2)}
+        if query_trigrams:
+            postings = sorted((self._name_trigrams.get(trigram, set()) for trigram in query_trigrams), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+        else:
+            candidates = self.tests.keys()
+        return {test_key for test_key in candidates
+                if query in get_ai_scriptless_test_name(self.tests[test_key]["name"]).lower()}
+
+    def similar_names(self, test_name: str, threshold: float = 0.3, max_matches: int = 10) -> List[str]:
+        # Only the names sharing the most trigrams are scored
+        shared = Counter()
+        for trigram in trigrams(test_name):
+            shared.update(self._name_trigrams.get(trigram, ()))
+        candidates = {get_ai_scriptless_test_name(self.tests[test_key]["name"])
+                      for test_key, _ in shared.most_common(max_matches * 10)}
+        scored = sorted(((trigram_similarity(test_name, name), name) for name in candidates), reverse=True)
+        return [name for score, name in scored[:max_matches] if score >= threshold]
+
+    def _get_ordered(self) -> List[dict[str, Any]]:
+        if self._ordered is None:
+            self._ordered = sorted(self.tests.values(),
+                                   key=lambda test: (test["visibility"], test["path"], test["name"].lower(), test["key"]))
+            self._rank = {test["key"]: i for i, test in enumerate(self._ordered)}
+        return self._ordered
+
+    def search(self, test_name: Optional[str] = None, visibility: Optional[str] = None,
+               owner_list: Optional[List[str]] = None) -> List[dict[str, Any]]:
+        candidates = []
+        if test_name:
+            candidates.append(self._match_name(test_name))
+        if visibility:
+            candidates.append(self._visibilities.get(visibility, set()))
+        if owner_list is not None:
+            candidates.append(set().union(*(self._owners.get(owner, set()) for owner in owner_list)))
+        ordered = self._get_ordered()
+        if len(candidates) == 0:
+            return ordered
+        candidates.sort(key=len)
+        test_keys = set(candidates[0])
+        for candidate in candidates[1:]:
+            test_keys &= candidate
+        return [ordered[i] for i in sorted(self._rank[test_key] for test_key in test_keys)]
+
+    def filter_values(self) -> dict[str, List[str]]:
+        return {
+            "test_name": sorted(self._test_names.keys(), key=str.lower),
+            "owner_list": sorted(self._owner_names.keys(), key=str.lower),
+        }
@@ -0,0 +1,37 @@
+"""
+Statistics utilities to summarize executions without returning them.
+"""
+import math
+from typing import List, Optional, Sequence
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> Optional[float]:
+    """
+    Percentile (0 to 100) of already sorted values, with linear interpolation between the closest ranks.
+    """
+    if len(sorted_values) == 0:
+        return None
+    rank = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def percentiles(values: Sequence[float], qs: Sequence[float]) -> List[Optional[float]]:
+    sorted_values = sorted(values)
+    return [percentile(sorted_values, q) for q in qs]
+
+
+def bucket_indexes(timestamps: Sequence[float], start: float, end: float, buckets: int) -> List[int]:
+    """
+    Index of the bucket of each timestamp, dividing [start, end] in buckets of the same size.
+    """
+    width = (end - start) / buckets if end > start else 1.0
+    return [min(max(int((timestamp - start) / width), 0), buckets - 1) for timestamp in timestamps]
+
+
+def bucket_starts(start: float, end: float, buckets: int) -> List[float]:
+    width = (end - start) / buckets if end > start else 1.0
+    return [start + width * i for i in range(buckets)]
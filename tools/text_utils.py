@@ -0,0 +1,161 @@
+"""
+Text utilities for grouping free-form messages (failure reasons, error analysis, etc.).
+"""
+import hashlib
+import re
+from typing import List
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_NORMALIZATION_PATTERNS = [
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"), " <uuid> "),
+    (re.compile(r"\b\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}(:\d{2}([.,]\d+)?)?(z|[+-]\d{2}:?\d{2})?\b"), " <ts> "),
+    (re.compile(r"\b\d{4}-\d{2}-\d{2}\b"), " <date> "),
+    (re.compile(r"\b\d{1,2}:\d{2}(:\d{2}([.,]\d+)?)?\b"), " <time> "),
+    (re.compile(r"\b0x[0-9a-f]+\b"), " <hex> "),
+    (re.compile(r"\b(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{12,}\b"), " <id> "),
+    (re.compile(r"\b[\w.+-]+@[\w-]+\.[\w.-]+\b"), " <email> "),
+    (re.compile(r"https?://\S+"), " <url> "),
+    (re.compile(r"\d+"), " <n> "),
+]
+_TOKEN_PATTERN = re.compile(r"<\w+>|\w+")
+
+
+def normalize_message(message: str) -> str:
+    """
+    Lower case the message and replace volatile parts (ids, numbers, timestamps, urls) by placeholders,
+    so messages that only differ on those parts become equal.
+    """
+    text = message.lower()
+    for pattern, replacement in _NORMALIZATION_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return " ".join(_TOKEN_PATTERN.findall(text))
+
+
+def shingles(text: str, size: int = 3) -> set[str]:
+    tokens = text.split()
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with banded Locality Sensitive Hashing.
+    Only the items that share at least one band bucket are compared, which keeps the grouping sub-quadratic.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        seeds = hashlib.blake2b(str(seed).encode(), digest_size=64).digest()
+        self._permutations = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(seeds + i.to_bytes(4, "little"), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], "little") % _MERSENNE_PRIME or 1
+            b = int.from_bytes(digest[8:], "little") % _MERSENNE_PRIME
+            self._permutations.append((a, b))
+
+    def signature(self, items: set[str]) -> tuple[int, ...]:
+        hashes = [int.from_bytes(hashlib.blake2b(item.encode(), digest_size=8).digest(), "little") for item in items]
+        if not hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._permutations
+        )
+
+    @staticmethod
+    def similarity(signature_a: tuple[int, ...], signature_b: tuple[int, ...]) -> float:
+        return sum(1 for x, y in zip(signature_a, signature_b) if x == y) / len(signature_a)
+
+    def candidate_pairs(self, signatures: List[tuple[int, ...]]) -> set[tuple[int, int]]:
+        pairs = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets: dict[tuple[int, ...], List[int]] = {}
+            for index, signature in enumerate(signatures):
+                buckets.setdefault(signature[start:start + self.rows], []).append(index)
+            for members in buckets.values():
+                for i in range(1, len(members)):
+                    pairs.add((members[0], members[i]))
+                    pairs.add((members[i - 1], members[i]))
+        return pairs
+
+
+def cluster_messages(messages: List[str], threshold: float = 0.5) -> List[List[int]]:
+    """
+    Group near duplicate messages.
+    Returns the list of clusters (indexes over messages), biggest clusters first.
+    """
+    # Identical normalized messages are grouped without hashing
+    normalized_groups: dict[str, List[int]] = {}
+    for index, message in enumerate(messages):
+        normalized_groups.setdefault(normalize_message(message), []).append(index)
+    normalized = list(normalized_groups.keys())
+
+    lsh = MinHashLSH()
+    signatures = [lsh.signature(shingles(text)) for text in normalized]
+
+    parents = list(range(len(normalized)))
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for i, j in lsh.candidate_pairs(signatures):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j and MinHashLSH.similarity(signatures[i], signatures[j]) >= threshold:
+            parents[root_j] = root_i
+
+    clusters: dict[int, List[int]] = {}
+    for i, text in enumerate(normalized):
+        clusters.setdefault(find(i), []).extend(normalized_groups[text])
+    return sorted((sorted(c) for c in clusters.values()), key=len, reverse=True)
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f"  {text.lower()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(text_a: str, text_b: str) -> float:
+    trigrams_a = trigrams(text_a)
+    trigrams_b = trigrams(text_b)
+    if not trigrams_a or not trigrams_b:
+        return 0.0
+    return len(trigrams_a & trigrams_b) / len(trigrams_a | trigrams_b)
+
+
+def resolve_value(value: str, candidates: List[str], threshold: float = 0.3, max_matches: int = 10,
+                  fuzzy: bool = True) -> List[str]:
+    """
+    Resolve a loosely typed value against the candidates.
+    Tries exact, case-insensitive, prefix, substring and finally trigram similarity matching,
+    the first strategy that matches wins (only the exact and case-insensitive ones when not fuzzy).
+    Returns an empty list when nothing matches.
+    """
+    if value in candidates:
+        return [value]
+    folded_value = value.casefold()
+    folded_candidates = [(candidate, candidate.casefold()) for candidate in candidates]
+
+    matches = [candidate for candidate, folded in folded_candidates if folded == folded_value]
+    if not fuzzy:
+        return matches[:max_matches]
+    if len(matches) == 0:
+        matches = [candidate for candidate, folded in folded_candidates if folded.startswith(folded_value)]
+    if len(matches) == 0:
+        matches = [candidate for candidate, folded in folded_candidates if folded_value in folded]
+    if len(matches) == 0:
+        scored = [(trigram_similarity(value, candidate), candidate) for candidate in candidates]
+        scored = [item for item in scored if item[0] >= threshold]
+        if scored:
+            matches = [max(scored)[1]]
+    return matches[:max_matches]
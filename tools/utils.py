@@ -1,14 +1,19 @@
 """
 Simple utilities for Perfecto MCP tools.
 """
+import asyncio
 import base64
+import contextvars
+import json
 import os
 import platform
 import sys
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 from importlib import resources
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Awaitable, Iterable, Any, AsyncIterator, Coroutine
 
 import httpx
 
@@ -29,29 +34,60 @@ timeout = httpx.Timeout(
     write=15.0,
     pool=60.0
 )
+# Client shared by the requests of a concurrent batch (see gather_with_concurrency), so they reuse the connections
+shared_client: contextvars.ContextVar[Optional[httpx.AsyncClient]] = contextvars.ContextVar("shared_client",
+                                                                                            default=None)
 
 
-async def api_request(token: Optional[PerfectoToken], method: str, endpoint: str,
-                      result_formatter: Callable = None,
-                      result_formatter_params: Optional[dict] = None,
-                      **kwargs) -> BaseResult:
+def new_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url="", http2=True, timeout=timeout)
+
+
+@asynccontextmanager
+async def get_http_client() -> AsyncIterator[httpx.AsyncClient]:
     """
-    Make an authenticated request to the Perfecto API.
-    Handles authentication errors gracefully.
+    The shared client of the current batch of requests, or a new client only for this request.
+    """
+    client = shared_client.get()
+    if client is not None and not client.is_closed:
+        yield client
+    else:
+        async with new_http_client() as client:
+            yield client
+
+
+async def _send_api_request(token: Optional[PerfectoToken], method: str, endpoint: str,
+                            validators: Optional[dict[str, str]] = None,
+                            result_formatter: Callable = None,
+                            result_formatter_params: Optional[dict] = None,
+                            **kwargs) -> tuple[Optional[BaseResult], dict[str, str]]:
+    """
+    Make an authenticated request to the Perfecto API, conditional when the validators (ETag and Last-Modified)
+    of a previous response are given. Returns None as result when the resource was not modified,
+    and the validators of the response.
     """
     if not token:
         return BaseResult(
             error="No API token. Set PERFECTO_SECURITY_TOKEN or PERFECTO_SECURITY_TOKEN_FILE env var with security token."
-        )
+        ), {}
 
     headers = kwargs.pop("headers", {})
     headers["Perfecto-Authorization"] = token.token
     headers["User-Agent"] = user_agent
+    if validators:
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last-modified" in validators:
+            headers["If-Modified-Since"] = validators["last-modified"]
 
-    async with (httpx.AsyncClient(base_url="", http2=True, timeout=timeout) as client):
+    async with get_http_client() as client:
         try:
             resp = await client.request(method, endpoint, headers=headers, **kwargs)
+            if validators and resp.status_code == 304:
+                return None, validators
             resp.raise_for_status()
+            response_validators = {name: resp.headers[name] for name in ["etag", "last-modified"]
+                                   if name in resp.headers}
             result = resp.json()
             error = None
             if isinstance(result, list) and len(result) > 0 and "userMessage" in result[0]:  # It's an error
@@ -62,15 +98,42 @@ async def api_request(token: Optional[PerfectoToken], method: str, endpoint: str
             return BaseResult(
                 result=final_result,
                 error=error,
-            )
+            ), response_validators
         except httpx.HTTPStatusError as e:
             if e.response.status_code in [401, 403]:
                 return BaseResult(
                     error="Invalid credentials"
-                )
+                ), {}
             raise
 
 
+async def api_request(token: Optional[PerfectoToken], method: str, endpoint: str,
+                      result_formatter: Callable = None,
+                      result_formatter_params: Optional[dict] = None,
+                      **kwargs) -> BaseResult:
+    """
+    Make an authenticated request to the Perfecto API.
+    Handles authentication errors gracefully.
+    """
+    result, _ = await _send_api_request(token, method, endpoint, result_formatter=result_formatter,
+                                        result_formatter_params=result_formatter_params, **kwargs)
+    return result
+
+
+async def api_conditional_request(token: Optional[PerfectoToken], method: str, endpoint: str,
+                                  validators: Optional[dict[str, str]] = None,
+                                  result_formatter: Callable = None,
+                                  result_formatter_params: Optional[dict] = None,
+                                  **kwargs) -> tuple[Optional[BaseResult], dict[str, str]]:
+    """
+    Make an authenticated conditional request to the Perfecto API with the validators of a previous response.
+    Returns None as result when the resource was not modified, and the validators to use in the next request.
+    """
+    return await _send_api_request(token, method, endpoint, validators=validators or {},
+                                   result_formatter=result_formatter,
+                                   result_formatter_params=result_formatter_params, **kwargs)
+
+
 async def http_request(method: str, endpoint: str,
                        result_formatter: Callable = None,
                        result_formatter_params: Optional[dict] = None,
@@ -82,7 +145,7 @@ async def http_request(method: str, endpoint: str,
     headers = kwargs.pop("headers", {})
     headers["User-Agent"] = user_agent
 
-    async with (httpx.AsyncClient(base_url="", http2=True, timeout=timeout) as client):
+    async with get_http_client() as client:
         try:
             resp = await client.request(method, endpoint, headers=headers, **kwargs)
             resp.raise_for_status()
@@ -101,6 +164,86 @@ async def http_request(method: str, endpoint: str,
             raise
 
 
+async def gather_with_concurrency(limit: int, coroutines: Iterable[Awaitable]) -> list[Any]:
+    """
+    Run the coroutines concurrently, with no more than limit running at the same time.
+    The results keep the order of the coroutines, exceptions are returned in place of the failed results.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coroutine: Awaitable):
+        async with semaphore:
+            return await coroutine
+
+    if shared_client.get() is not None:  # Nested in another batch, its client is reused
+        return await asyncio.gather(*(run(coroutine) for coroutine in coroutines), return_exceptions=True)
+    async with new_http_client() as client:
+        token = shared_client.set(client)
+        try:
+            return await asyncio.gather(*(run(coroutine) for coroutine in coroutines), return_exceptions=True)
+        finally:
+            shared_client.reset(token)
+
+
+class AdaptivePolling:
+    """
+    Interval between the polls of a bounded polling loop, it polls faster while things are changing
+    and backs off when idle.
+    """
+
+    def __init__(self, timeout: float, min_interval: float = 2.0, max_interval: float = 30.0):
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.started_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def idle(self) -> bool:
+        """
+        Whether nothing changed in the latest polls (the interval backed off to the max interval).
+        """
+        return self.interval >= self.max_interval
+
+    async def wait_next(self, changed: bool) -> bool:
+        """
+        Wait until the next poll, returns False without waiting when the timeout was reached.
+        """
+        self.interval = self.min_interval if changed else min(self.interval * 2, self.max_interval)
+        remaining = self.timeout - self.elapsed
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(self.interval, remaining))
+        return True
+
+
+def create_background_task(coroutine: Coroutine) -> asyncio.Task:
+    """
+    Create a task that can outlive the current batch of requests, so it doesn't use the batch shared client.
+    """
+    context = contextvars.copy_context()
+    context.run(shared_client.set, None)
+    return asyncio.create_task(coroutine, context=context)
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    """
+    Encode the state needed to resume a paged search as an opaque token.
+    """
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor value: {cursor!r}") from e
+
+
 def get_date_time_iso(timestamp: int) -> Optional[str]:
     if timestamp is None:
         return None